@@ -1,50 +1,131 @@
 """The OpenPlantBook integration."""
 
 import asyncio
+import contextlib
 import logging
+import math
 import os
 import re
+import sqlite3
+import time
 import urllib.parse
 from asyncio import timeout as async_timeout
-from datetime import datetime, timedelta
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from datetime import datetime
+from functools import partial
+from itertools import islice
 from pathlib import Path
+from typing import Any
 
+import aiohttp
 import voluptuous as vol
+from aiohttp import hdrs
 from homeassistant import exceptions
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.core import (
+    HassJob,
     HomeAssistant,
     ServiceCall,
     ServiceResponse,
     SupportsResponse,
+    callback,
 )
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.util import raise_if_invalid_filename, slugify
-from openplantbook_sdk import MissingClientIdOrSecret, OpenPlantBookApi
+from openplantbook_sdk import MissingClientIdOrSecret
 from openplantbook_sdk.sdk import RateLimitError
 
+from .auth import TokenManager, async_get_client
+from .cache import (
+    CacheStats,
+    SearchCache,
+    SpeciesCache,
+    SpeciesRecord,
+    cache_key,
+    normalize_species,
+    species_fingerprint,
+)
+from .cache_file import (
+    CACHE_FILE_FORMAT,
+    CACHE_FILE_VERSION,
+    read_cache_file,
+    write_cache_file,
+)
+from .circuit import CircuitBreaker
 from .const import (
     ATTR_ALIAS,
     ATTR_API,
+    ATTR_COMPRESS,
+    ATTR_ERROR,
     ATTR_HOURS,
     ATTR_IMAGE,
     ATTR_INCLUDE,
+    ATTR_LANG,
+    ATTR_LIMIT,
+    ATTR_OFFSET,
+    ATTR_PATH,
     ATTR_SPECIES,
+    ATTR_TIMEOUT,
+    CACHE_FILE_IMPORT_BATCH,
     CACHE_TIME,
+    DATA_ALIASES,
+    DATA_CIRCUIT,
     DATA_COMPONENT,
+    DATA_EXPIRY_TIMER,
+    DATA_IN_FLIGHT,
+    DATA_LANGUAGE,
+    DATA_MISSES,
+    DATA_SCHEDULER,
+    DATA_SEARCH_BURST,
+    DATA_SEARCH_BURST_CALL,
+    DATA_SEARCH_CACHE,
     DATA_SEARCH_ENTITY,
+    DATA_SEARCH_IN_FLIGHT,
+    DATA_SPECIES_DB,
     DATA_SPECIES_ENTITIES,
+    DATA_STATS,
+    DATA_STATS_ENTITY,
+    DATA_STORE,
+    DATA_TOKEN,
+    DEFAULT_API_MAX_CONCURRENT,
+    DEFAULT_API_RATE_LIMIT,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_NEGATIVE_CACHE_TTL,
+    DEFAULT_SEARCH_CACHE_TTL,
+    DEFAULT_SEARCH_DEBOUNCE,
+    DEFAULT_SEARCH_RESULT_MAX,
     DLI_SANITY_MAX,
     DOMAIN,
+    EVENT_SPECIES_CHANGED,
+    FLOW_API_MAX_CONCURRENT,
+    FLOW_API_RATE_LIMIT,
+    FLOW_CACHE_MAX_ENTRIES,
+    FLOW_CACHE_MAX_SIZE,
     FLOW_DOWNLOAD_IMAGES,
     FLOW_DOWNLOAD_PATH,
+    FLOW_NEGATIVE_CACHE_TTL,
+    FLOW_SEARCH_CACHE_TTL,
+    FLOW_SEARCH_DEBOUNCE,
+    FLOW_SEARCH_POLICY,
+    FLOW_SEARCH_RESULT_MAX,
     FLOW_SEND_LANG,
+    FLOW_SERVE_STALE,
+    FLOW_STATS_ENTITY,
+    GET_MANY_CONCURRENCY,
+    IMAGE_CHUNK_SIZE,
+    IMAGE_DOWNLOAD_TIMEOUT,
+    IMAGE_MAX_SIZE,
     MMOL_TO_DLI_FACTOR,
-    OPB_ATTR_INCLUDES,
+    OPB_ATTR_LANG,
     OPB_ATTR_RESULTS,
     OPB_ATTR_TIMESTAMP,
     OPB_DISPLAY_PID,
@@ -54,17 +135,41 @@ from .const import (
     OPB_MIN_LIGHT_MMOL,
     OPB_PID,
     OPB_SERVICE_CLEAN_CACHE,
+    OPB_SERVICE_EXPORT_CACHE,
     OPB_SERVICE_GET,
+    OPB_SERVICE_GET_MANY,
+    OPB_SERVICE_IMPORT_CACHE,
     OPB_SERVICE_SEARCH,
     OPB_SERVICE_UPLOAD,
-    PLANTBOOK_BASEURL,
+    SEARCH_CACHE_MAX_ENTRIES,
+    SEARCH_POLICY_LOCAL,
+    SEARCH_POLICY_REMOTE,
+    SPECIES_DB_FILE,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TOKEN_STORAGE_KEY,
+    TOKEN_STORAGE_VERSION,
+)
+from .entity import (
+    OpenPlantbookCacheStatistics,
+    OpenPlantbookSearchResult,
+    OpenPlantbookSpecies,
 )
-from .entity import OpenPlantbookSearchResult, OpenPlantbookSpecies
-from .plantbook_exception import OpenPlantbookException
+from .plantbook_exception import (
+    ApiUnavailableError,
+    CircuitOpenError,
+    OpenPlantbookException,
+    SpeciesNotFoundError,
+)
+from .retry import async_api_call, default_wait_timeout, retry_after
+from .scheduler import ApiScheduler, background_requests
+from .species_db import SpeciesDatabase
 from .uploader import (
     async_setup_upload_schedule,
     plant_data_upload,
 )
+from .warmup import async_setup_warm_up
 
 CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
 _LOGGER = logging.getLogger(__name__)
@@ -131,6 +236,386 @@ def _parse_includes(include: str | None) -> set[str]:
     return {part.strip() for part in include.split(",") if part.strip()}
 
 
+def _species_entity_id(pid: str) -> str:
+    """Return the entity_id of the per-species entity for a canonical pid."""
+    return async_generate_entity_id(f"{DOMAIN}.{{}}", pid, current_ids={})
+
+
+def _cache_entry_is_fresh(value: SpeciesRecord, hours: float) -> bool:
+    """Return True if a cached species is younger than `hours`."""
+    return time.time() < value.fetched + hours * 3600
+
+
+def _missing_includes(record: SpeciesRecord, requested_includes: set[str]) -> set[str]:
+    """Return the requested include categories a record lacks or holds expired."""
+    oldest = time.time() - CACHE_TIME * 3600
+    return {
+        category
+        for category in requested_includes
+        if record.includes.get(category, 0) <= oldest
+    }
+
+
+def _language_code(language: str | None) -> str:
+    """Return the language code OpenPlantbook expects for a language tag."""
+    if not isinstance(language, str) or not language:
+        return "en"
+    return language.split("-")[0].lower()
+
+
+def _api_language(hass: HomeAssistant, entry: ConfigEntry) -> str | None:
+    """Return the language species are fetched in by default, if one is sent.
+
+    The per-species entities show the species in this language.
+    """
+    if not entry.options.get(FLOW_SEND_LANG, True):
+        return None
+    return _language_code(hass.config.language)
+
+
+def _cache_limits(entry: ConfigEntry) -> tuple[int, int]:
+    """Return the (max entries, max bytes) species cache limits of an entry."""
+    max_size_mb = entry.options.get(FLOW_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE)
+    return (
+        entry.options.get(FLOW_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES),
+        max_size_mb * 1024 * 1024,
+    )
+
+
+def _api_limits(entry: ConfigEntry) -> tuple[int, int]:
+    """Return the API requests per minute and concurrent requests allowed."""
+    return (
+        entry.options.get(FLOW_API_RATE_LIMIT, DEFAULT_API_RATE_LIMIT),
+        entry.options.get(FLOW_API_MAX_CONCURRENT, DEFAULT_API_MAX_CONCURRENT),
+    )
+
+
+async def _async_remove_species_entity(
+    hass: HomeAssistant, entry: ConfigEntry, pid: str
+) -> None:
+    """Remove the entity of a pid whose default-language entry left the cache.
+
+    Runs after the cache entry is gone, possibly as a scheduled task, so a pid
+    that has been fetched again meanwhile keeps its entity. Entries of other
+    languages have no entity; removing them leaves the entity alone.
+    """
+    domain_data = hass.data.get(DOMAIN, {})
+    if (
+        ATTR_SPECIES not in domain_data
+        or cache_key(pid, _api_language(hass, entry)) in domain_data[ATTR_SPECIES]
+    ):
+        return
+    entity = domain_data[DATA_SPECIES_ENTITIES].pop(pid, None)
+    if entity is None:
+        return
+    entity_id = entity.entity_id
+    await entity.async_remove()
+    # Purge the registry entry too, so dynamically-removed species do not
+    # accumulate as stale "unavailable" entities.
+    ent_reg = er.async_get(hass)
+    if ent_reg.async_get(entity_id) is not None:
+        ent_reg.async_remove(entity_id)
+
+
+def _cache_file_path(hass: HomeAssistant, path: str | None) -> Path:
+    """Return the file an export/import call names, if it may be accessed.
+
+    Relative paths are relative to the config directory; the file must be in
+    a directory listed in allowlist_external_dirs.
+    """
+    if not path:
+        raise OpenPlantbookException(
+            "invalid service call, required attribute %s missing", ATTR_PATH
+        )
+    file_path = Path(path)
+    if not file_path.is_absolute():
+        file_path = Path(hass.config.path(path))
+    if not hass.config.is_allowed_path(str(file_path)):
+        raise OpenPlantbookException(
+            f"Access to {file_path} is not allowed, add its directory to "
+            "allowlist_external_dirs"
+        )
+    return file_path
+
+
+def _species_cache_to_store(cache: SpeciesCache) -> dict:
+    """Return the snapshot of the species cache that is written to disk."""
+    return {
+        ATTR_SPECIES: {key: record.as_dict() for key, record in cache.items()},
+        DATA_ALIASES: cache.aliases,
+    }
+
+
+async def _async_api_request[T](
+    hass: HomeAssistant,
+    method: Callable[..., Awaitable[T | None]],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Call an API method as scheduled, retrying transient failures.
+
+    The latency of every attempt (without the wait for admission) is recorded
+    in the cache statistics.
+    """
+
+    async def _async_attempt() -> T | None:
+        started = time.monotonic()
+        failed = True
+        try:
+            result = await method(*args, **kwargs)
+            failed = result is None
+        except SpeciesNotFoundError:
+            # An answer from the API, just not the one asked for
+            failed = False
+            raise
+        finally:
+            hass.data[DOMAIN][DATA_STATS].record_api_request(
+                time.monotonic() - started, failed
+            )
+        return result
+
+    return await async_api_call(hass, _async_attempt)
+
+
+@callback
+def _async_coalesce[T](
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    in_flight: dict[str, asyncio.Task[T]],
+    key: str,
+    factory: Callable[[], Awaitable[T]],
+) -> asyncio.Task[T]:
+    """Return the request in flight for key, starting factory() if there is none.
+
+    The request runs as its own task, registered in in_flight until it is
+    done. Callers await it through asyncio.shield, so a caller that is
+    cancelled or gives up does not fail the request for the others.
+    """
+    if (task := in_flight.get(key)) is not None:
+        return task
+
+    async def _async_run() -> T:
+        try:
+            return await factory()
+        finally:
+            del in_flight[key]
+
+    # Not started eagerly: the task must be registered before it can finish.
+    task = entry.async_create_task(
+        hass, _async_run(), f"{DOMAIN} request {key}", eager_start=False
+    )
+    # Retrieve the outcome, so asyncio does not log an error nobody awaited.
+    task.add_done_callback(lambda done: done.cancelled() or done.exception())
+    in_flight[key] = task
+    return task
+
+
+def _rate_limit_error(err: RateLimitError) -> exceptions.HomeAssistantError:
+    """Return the error a service raises when the rate limit is exhausted."""
+    if (delay := retry_after(err)) is None:
+        when = "later"
+    else:
+        when = f"in {math.ceil(delay)} seconds"
+    return exceptions.HomeAssistantError(
+        f"OpenPlantbook API rate limit exceeded. Please try again {when}."
+    )
+
+
+async def _async_setup_statistics_entity(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> None:
+    """Add or remove the cache statistics entity as the options require."""
+    domain_data = hass.data[DOMAIN]
+    entity = domain_data.get(DATA_STATS_ENTITY)
+    if entry.options.get(FLOW_STATS_ENTITY, False):
+        if entity is None:
+            entity = OpenPlantbookCacheStatistics(entry, domain_data[DATA_STATS])
+            await domain_data[DATA_COMPONENT].async_add_entities([entity])
+            domain_data[DATA_STATS_ENTITY] = entity
+    elif entity is not None:
+        del domain_data[DATA_STATS_ENTITY]
+        entity_id = entity.entity_id
+        await entity.async_remove()
+        ent_reg = er.async_get(hass)
+        if ent_reg.async_get(entity_id) is not None:
+            ent_reg.async_remove(entity_id)
+
+
+def _page(results: dict[str, str], offset: int, limit: int | None) -> dict[str, str]:
+    """Return limit results (all if None) of results, skipping offset first."""
+    stop = None if limit is None else offset + limit
+    return dict(islice(results.items(), offset, stop))
+
+
+def _species_db_path(hass: HomeAssistant) -> Path:
+    """Return the path of the local species database."""
+    return Path(hass.config.path(STORAGE_DIR, SPECIES_DB_FILE))
+
+
+def _species_db_row(
+    record: SpeciesRecord, aliases: Iterable[str] = ()
+) -> tuple[str, str, list[str]]:
+    """Return the species database row of a cached record."""
+    names = [*aliases]
+    if common_name := record.data.get(ATTR_ALIAS):
+        names.append(common_name)
+    return record.pid, record.data.get(OPB_DISPLAY_PID) or record.pid, names
+
+
+async def _async_setup_species_db(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Open or close the local species database as the search policy requires."""
+    domain_data = hass.data[DOMAIN]
+    database = domain_data.get(DATA_SPECIES_DB)
+    policy = entry.options.get(FLOW_SEARCH_POLICY, SEARCH_POLICY_REMOTE)
+    if policy != SEARCH_POLICY_REMOTE:
+        if database is not None:
+            return
+        database = SpeciesDatabase(_species_db_path(hass))
+        try:
+            await hass.async_add_executor_job(database.open)
+        except (OSError, sqlite3.Error) as err:
+            _LOGGER.warning("Unable to open the local species database: %s", err)
+            return
+        domain_data[DATA_SPECIES_DB] = database
+        # Index what is already cached, with the names it was asked for by.
+        cache = domain_data[ATTR_SPECIES]
+        names: dict[str, list[str]] = {}
+        for alias, pid in cache.aliases.items():
+            names.setdefault(pid, []).append(alias)
+        _async_index_species(
+            hass,
+            entry,
+            [
+                _species_db_row(record, names.get(record.pid, ()))
+                for record in cache.values()
+            ],
+        )
+    elif database is not None:
+        del domain_data[DATA_SPECIES_DB]
+        await hass.async_add_executor_job(database.close)
+
+
+@callback
+def _async_index_species(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    rows: list[tuple[str, str, list[str]]],
+) -> None:
+    """Add species to the local database in the background, if it is open."""
+    if not rows or (database := hass.data[DOMAIN].get(DATA_SPECIES_DB)) is None:
+        return
+
+    async def _async_add() -> None:
+        try:
+            await hass.async_add_executor_job(database.add_species, rows)
+        except sqlite3.Error as err:
+            _LOGGER.warning("Unable to index species locally: %s", err)
+
+    entry.async_create_task(hass, _async_add(), f"{DOMAIN} index species")
+
+
+async def _async_switch_language(
+    hass: HomeAssistant, entry: ConfigEntry, previous: str | None
+) -> None:
+    """Move the species entities over to a new default language.
+
+    Only the entries cached in the previous default language are dropped;
+    those of other languages stay warm. Entities of species cached in the new
+    language show that entry, the others are removed until fetched again.
+    """
+    cache = hass.data[DOMAIN][ATTR_SPECIES]
+    for key in [key for key, record in cache.items() if record.lang == previous]:
+        _LOGGER.debug("Dropping %s, cached in the previous language", key)
+        del cache[key]
+    for pid in list(hass.data[DOMAIN][DATA_SPECIES_ENTITIES]):
+        await _async_remove_species_entity(hass, entry, pid)
+    await _async_add_species_entities(hass, entry, cache.values())
+    _async_schedule_cache_save(hass)
+
+
+async def _async_add_species_entities(
+    hass: HomeAssistant, entry: ConfigEntry, records: Iterable[SpeciesRecord]
+) -> None:
+    """Create or update the entities of cached species in the default language."""
+    language = _api_language(hass, entry)
+    species_entities = hass.data[DOMAIN][DATA_SPECIES_ENTITIES]
+    new_entities = {}
+    for record in records:
+        if record.lang != language:
+            continue
+        if (species_entity := species_entities.get(record.pid)) is not None:
+            species_entity.async_update_data(record)
+        else:
+            new_entities[record.pid] = OpenPlantbookSpecies(
+                entry, _species_entity_id(record.pid), record
+            )
+    if new_entities:
+        await hass.data[DOMAIN][DATA_COMPONENT].async_add_entities(
+            list(new_entities.values())
+        )
+        species_entities.update(new_entities)
+
+
+@callback
+def _async_schedule_cache_save(hass: HomeAssistant) -> None:
+    """Schedule a debounced write of the species cache to disk."""
+    cache = hass.data[DOMAIN][ATTR_SPECIES]
+    hass.data[DOMAIN][DATA_STORE].async_delay_save(
+        lambda: _species_cache_to_store(cache), STORAGE_SAVE_DELAY
+    )
+
+
+@callback
+def _async_schedule_expiry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Arm the expiry timer for the earliest-expiring species, if not yet armed.
+
+    A single timer is kept, set for the next expiry; it is only moved when an
+    entry expires earlier than the time it is already set for.
+    """
+    domain_data = hass.data[DOMAIN]
+    next_expiry = domain_data[ATTR_SPECIES].next_expiry()
+    armed = domain_data.get(DATA_EXPIRY_TIMER)
+    if next_expiry is None or (armed is not None and armed[0] <= next_expiry):
+        return
+    if armed is not None:
+        armed[1]()
+
+    @callback
+    def _async_expire(_now: datetime) -> None:
+        if domain_data.get(DATA_EXPIRY_TIMER) is not timer:
+            return
+        del domain_data[DATA_EXPIRY_TIMER]
+        cache = domain_data[ATTR_SPECIES]
+        due = cache.pop_due(time.time())
+        # With serve stale, or while the circuit breaker is open, expired
+        # entries stay cached (bounded by the cache limits) until refreshed;
+        # only clean_cache removes them.
+        if (
+            not entry.options.get(FLOW_SERVE_STALE, False)
+            and not domain_data[DATA_CIRCUIT].is_open
+        ):
+            for key in due:
+                _LOGGER.debug("Expiring %s from cache", key)
+                domain_data[DATA_STATS].expirations += 1
+                pid = cache.pop(key).pid
+                hass.async_create_task(_async_remove_species_entity(hass, entry, pid))
+            if due:
+                _async_schedule_cache_save(hass)
+        _async_schedule_expiry(hass, entry)
+
+    timer = (
+        next_expiry,
+        async_call_later(
+            hass,
+            max(next_expiry - time.time(), 0),
+            HassJob(
+                _async_expire, name="opb species cache expiry", cancel_on_shutdown=True
+            ),
+        ),
+    )
+    domain_data[DATA_EXPIRY_TIMER] = timer
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the OpenPlantBook component."""
     return True
@@ -142,15 +627,88 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
 
-    if ATTR_API not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][ATTR_API] = OpenPlantBookApi(
-            entry.data.get(CONF_CLIENT_ID),
-            entry.data.get(CONF_CLIENT_SECRET),
-            base_url=PLANTBOOK_BASEURL,
-        )
+    client = async_get_client(
+        hass, entry.data.get(CONF_CLIENT_ID), entry.data.get(CONF_CLIENT_SECRET)
+    )
+
+    if DATA_SCHEDULER not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_SCHEDULER] = ApiScheduler(*_api_limits(entry))
+    if DATA_CIRCUIT not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_CIRCUIT] = CircuitBreaker()
+    if DATA_TOKEN not in hass.data[DOMAIN]:
+        # Restored before anything else may send a request
+        token_manager = TokenManager(hass, entry, client)
+        await token_manager.async_load()
+        token_manager.async_start()
+        hass.data[DOMAIN][DATA_TOKEN] = token_manager
+
+    if DATA_STORE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_STORE] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+
+    if DATA_IN_FLIGHT not in hass.data[DOMAIN]:
+        # species -> task of the API request currently fetching it
+        hass.data[DOMAIN][DATA_IN_FLIGHT] = {}
+
+    if DATA_STATS not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_STATS] = CacheStats()
+
+    if DATA_SEARCH_CACHE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_SEARCH_CACHE] = SearchCache(SEARCH_CACHE_MAX_ENTRIES)
+        # normalized alias -> task of the API search currently running
+        hass.data[DOMAIN][DATA_SEARCH_IN_FLIGHT] = {}
+        # normalized alias -> task of its debounced search, and the last call
+        # of that burst: (alias, offset, limit, quiet event, cancel its timer)
+        hass.data[DOMAIN][DATA_SEARCH_BURST] = {}
+        hass.data[DOMAIN][DATA_SEARCH_BURST_CALL] = {}
+
+    if DATA_MISSES not in hass.data[DOMAIN]:
+        # normalized species name -> epoch time until which it is not found
+        hass.data[DOMAIN][DATA_MISSES] = {}
 
     if ATTR_SPECIES not in hass.data[DOMAIN]:
-        hass.data[DOMAIN][ATTR_SPECIES] = {}
+
+        @callback
+        def _async_species_evicted(key: str, record: SpeciesRecord) -> None:
+            _LOGGER.debug("Evicting %s from the full cache", key)
+            hass.data[DOMAIN][DATA_STATS].evictions += 1
+            _async_schedule_cache_save(hass)
+            hass.async_create_task(
+                _async_remove_species_entity(hass, entry, record.pid)
+            )
+
+        cache = SpeciesCache(
+            *_cache_limits(entry),
+            pinned=hass.data[DOMAIN][DATA_IN_FLIGHT],
+            on_evict=_async_species_evicted,
+            ttl=CACHE_TIME * 3600,
+        )
+        # Restore the species cache persisted by a previous run, oldest first
+        # so recency order survives. Entries that expired while HA was down
+        # are dropped here rather than refetched, unless stale entries are
+        # served (they are then refreshed on their next get).
+        serve_stale = entry.options.get(FLOW_SERVE_STALE, False)
+        # Entries are keyed by pid and language. Older stores held the default
+        # language only, keyed by the raw `get` input, which is kept as alias.
+        language = _api_language(hass, entry)
+        stored = await hass.data[DOMAIN][DATA_STORE].async_load() or {}
+        for species, value in sorted(
+            (stored.get(ATTR_SPECIES) or {}).items(),
+            key=lambda item: item[1].get(OPB_ATTR_TIMESTAMP, ""),
+        ):
+            if OPB_PID not in value:
+                continue
+            record = SpeciesRecord.from_dict(value, language)
+            if serve_stale or _cache_entry_is_fresh(record, CACHE_TIME):
+                cache[cache_key(record.pid, record.lang)] = record
+                if OPB_ATTR_LANG not in value:
+                    cache.learn_alias(species, record.pid)
+        for alias, pid in (stored.get(DATA_ALIASES) or {}).items():
+            cache.learn_alias(alias, pid)
+        hass.data[DOMAIN][ATTR_SPECIES] = cache
+        _async_schedule_expiry(hass, entry)
+    # The default language the species entities are shown in, to tell which
+    # cache entries an options change invalidates.
+    hass.data[DOMAIN][DATA_LANGUAGE] = _api_language(hass, entry)
 
     # Backfill a unique_id for entries created before this was set in the
     # config flow, so existing installs also gain one (silences the repair
@@ -166,6 +724,192 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if DATA_SPECIES_ENTITIES not in hass.data[DOMAIN]:
         hass.data[DOMAIN][DATA_SPECIES_ENTITIES] = {}
 
+    async def _async_fetch_plant(
+        species: str, requested_includes: set[str], lang: str | None
+    ) -> Mapping[str, Any]:
+        """Fetch one species in a language, cache it and update its entity.
+
+        Only species fetched in the default language have an entity. Returns
+        the stored record, or {} if the API returned nothing.
+        """
+        # Pass requested extra categories straight through to the API. The
+        # SDK merges `lang` in and treats an empty dict as no extra params.
+        extra_params = {}
+        if requested_includes:
+            extra_params["include"] = ",".join(sorted(requested_includes))
+        try:
+            plant_data = await _async_api_request(
+                hass,
+                hass.data[DOMAIN][ATTR_API].async_plant_detail_get,
+                species,
+                lang=lang,
+                params=extra_params,
+            )
+        except RateLimitError as err:
+            _LOGGER.warning("Rate limit reached while fetching data for %s", species)
+            raise _rate_limit_error(err) from err
+        except CircuitOpenError as err:
+            _LOGGER.debug("Not fetching %s: %s", species, err)
+            raise exceptions.HomeAssistantError(str(err)) from err
+        except TimeoutError as err:
+            _LOGGER.warning("Timed out fetching data for %s", species)
+            raise exceptions.HomeAssistantError(
+                "OpenPlantbook API did not respond in time. Please try again later."
+            ) from err
+        except (aiohttp.ClientError, ApiUnavailableError) as err:
+            _LOGGER.warning("Unable to fetch data for %s: %s", species, err)
+            raise exceptions.HomeAssistantError(
+                "OpenPlantbook API unavailable. Please try again later."
+            ) from err
+        except PermissionError as err:
+            _LOGGER.exception(
+                "Authentication failed while fetching data for %s. Please reconfigure the integration",
+                species,
+            )
+            raise InvalidAuth("Authentication failed") from err
+        except MissingClientIdOrSecret:
+            _LOGGER.exception(
+                "Missing client ID or secret. Please set up the integration again"
+            )
+            raise
+        except SpeciesNotFoundError as err:
+            # Only a 404 says the species does not exist; failed requests
+            # raised above and must not hide a valid species for a while.
+            _LOGGER.debug("%s", err)
+            _async_record_miss(species)
+            return {}
+
+        if not plant_data:
+            return {}
+
+        _LOGGER.debug("Got data for %s", species)
+        _enrich_plant_data_with_dli(plant_data)
+        # Merge into the cached entry. The API always returns the base data,
+        # so the entry timestamp is renewed; include categories not asked for
+        # this time are kept with their own, older, fetch time.
+        pid = plant_data[OPB_PID]
+        key = cache_key(pid, lang)
+        now = time.time()
+        previous = hass.data[DOMAIN][ATTR_SPECIES].get(key)
+        previous_data = previous.data if previous is not None else {}
+        includes = dict(previous.includes) if previous is not None else {}
+        includes.update(dict.fromkeys(requested_includes, now))
+        record = SpeciesRecord.from_api(
+            {**previous_data, **plant_data}, lang, now, includes
+        )
+        # Cache under the canonical pid and remember the name we asked for, so
+        # any later variant of it resolves locally to this entry.
+        hass.data[DOMAIN][ATTR_SPECIES][key] = record
+        hass.data[DOMAIN][ATTR_SPECIES].learn_alias(species, pid)
+        _async_schedule_expiry(hass, entry)
+        entity_id = _species_entity_id(pid)
+        if entry.options.get(FLOW_DOWNLOAD_IMAGES) and record.data.get(ATTR_IMAGE):
+            # Derive the filename from the URL path only, ignoring any
+            # cache-busting query string (e.g. ...jpg?v=abc123) so the
+            # saved filename stays stable across refreshes.
+            filename = slugify(
+                urllib.parse.unquote(
+                    Path(urllib.parse.urlparse(record.data[ATTR_IMAGE]).path).name
+                ),
+                separator=" ",
+            ).replace(" jpg", ".jpg")
+            raise_if_invalid_filename(filename)
+            download_path = entry.options.get(FLOW_DOWNLOAD_PATH)
+            if not Path(download_path).is_absolute():
+                download_path = hass.config.path(download_path)
+
+            final_path = str(Path(download_path) / filename)
+            if await hass.async_add_executor_job(Path(final_path).is_file):
+                _LOGGER.warning("Filename %s already exists", final_path)
+                downloaded_file = final_path
+            else:
+                downloaded_file = await async_download_image(
+                    record.data[ATTR_IMAGE], final_path
+                )
+            if downloaded_file and "www/" in downloaded_file:
+                record.data[ATTR_IMAGE] = re.sub("^.*www/", "/local/", downloaded_file)
+
+        _LOGGER.debug("data stored for %s: %s", species, record)
+        _async_index_species(hass, entry, [_species_db_row(record, [species])])
+        # Compared after the image rewrite, as the cached entry has it too.
+        changed = species_fingerprint(previous_data) != species_fingerprint(record.data)
+        if changed and previous is not None:
+            hass.bus.async_fire(EVENT_SPECIES_CHANGED, {OPB_PID: pid, ATTR_LANG: lang})
+        if lang != _api_language(hass, entry):
+            _async_schedule_cache_save(hass)
+            return record
+        # Key the entity holder by the canonical pid (not the raw
+        # service input), so different inputs that resolve to the same
+        # pid (casing/alias differences) map to the one entity instead
+        # of colliding on the shared entity_id/unique_id.
+        species_entities = hass.data[DOMAIN][DATA_SPECIES_ENTITIES]
+        existing_entity = species_entities.get(pid)
+        if existing_entity is None:
+            species_entity = OpenPlantbookSpecies(entry, entity_id, record)
+            await hass.data[DOMAIN][DATA_COMPONENT].async_add_entities([species_entity])
+            # Record the entity only after it is successfully added, so a
+            # failed add does not leave a phantom (unattached) entity that
+            # a later update would call async_write_ha_state() on.
+            species_entities[pid] = species_entity
+        else:
+            existing_entity.async_update_data(record, changed)
+        _async_schedule_cache_save(hass)
+        return record
+
+    @callback
+    def _async_record_miss(species: str) -> None:
+        """Answer `get` for an unknown species locally for a while."""
+        ttl = entry.options.get(FLOW_NEGATIVE_CACHE_TTL, DEFAULT_NEGATIVE_CACHE_TTL)
+        if not ttl:
+            return
+        now = time.time()
+        misses = hass.data[DOMAIN][DATA_MISSES]
+        # Misspellings are unbounded; drop expired ones once there are many.
+        if len(misses) >= DEFAULT_CACHE_MAX_ENTRIES:
+            for name in [name for name, until in misses.items() if until <= now]:
+                del misses[name]
+        misses[normalize_species(species)] = now + ttl * 60
+
+    async def _async_fetch_coalesced(
+        key: str, species: str, requested_includes: set[str], lang: str | None
+    ) -> Mapping[str, Any]:
+        """Fetch a species as the one in-flight request for its key.
+
+        Concurrent get calls resolving to the same key (the pid, or the
+        normalized input while the pid is not yet known, in the same language)
+        await the registered request instead of starting their own.
+        """
+        _LOGGER.debug("I am the first process to get %s", species)
+        return await asyncio.shield(
+            _async_coalesce(
+                hass,
+                entry,
+                hass.data[DOMAIN][DATA_IN_FLIGHT],
+                key,
+                partial(_async_fetch_plant, species, requested_includes, lang),
+            )
+        )
+
+    async def _async_refresh_plant(
+        pid: str, includes: set[str], lang: str | None
+    ) -> None:
+        """Refetch a stale species in the background (stale-while-revalidate)."""
+        try:
+            with background_requests():
+                await _async_fetch_coalesced(cache_key(pid, lang), pid, includes, lang)
+        except Exception as err:
+            # The stale entry stays cached; the next get retries the refresh.
+            if isinstance(err.__cause__, CircuitOpenError):
+                _LOGGER.debug("Not refreshing %s while the API is unavailable", pid)
+                return
+            _LOGGER.warning("Background refresh of %s failed: %s", pid, err)
+
+    def _call_language(call: ServiceCall) -> str | None:
+        """Return the language a get asks for, or the default language."""
+        if lang := call.data.get(ATTR_LANG):
+            return _language_code(lang)
+        return _api_language(hass, entry)
+
     async def get_plant(call: ServiceCall) -> ServiceResponse:
         if DOMAIN not in hass.data:
             _LOGGER.error("no data found for domain %s", DOMAIN)
@@ -179,205 +923,206 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Parse the optional `include` parameter (comma-separated extra data
         # categories, e.g. "care"). An empty request is satisfied by any entry.
         requested_includes = _parse_includes(call.data.get(ATTR_INCLUDE))
-
-        # Decide whether to drop a cached entry and refetch. We refetch when the
-        # caller bypasses the cache (cache: false) or when a cached entry does
-        # not already contain all the requested include categories. In both
-        # cases we require a *completed* entry (OPB_PID present), so we never
-        # delete the in-flight sentinel ({}) used by the concurrency guard
-        # below — a concurrent request waits for that fetch instead of starting
-        # a duplicate one.
         use_cache = call.data.get("cache", True)
-        cached = hass.data[DOMAIN][ATTR_SPECIES].get(species)
-        includes_unsatisfied = not requested_includes.issubset(
-            set((cached or {}).get(OPB_ATTR_INCLUDES, []))
-        )
-        if (
-            cached is not None
-            and OPB_PID in cached
-            and (not use_cache or includes_unsatisfied)
-        ):
-            _LOGGER.debug(
-                "Refetching %s (bypass=%s, include=%s), clearing cached data",
+        wait_timeout = call.data.get(ATTR_TIMEOUT, default_wait_timeout())
+        return dict(
+            await _async_get_plant(
                 species,
-                not use_cache,
-                sorted(requested_includes),
+                requested_includes,
+                use_cache,
+                wait_timeout,
+                _call_language(call),
             )
-            del hass.data[DOMAIN][ATTR_SPECIES][species]
+        )
+
+    async def _async_get_plant(
+        species: str,
+        requested_includes: set[str],
+        use_cache: bool,
+        wait_timeout: float,
+        lang: str | None,
+        limit: asyncio.Semaphore | None = None,
+    ) -> Mapping[str, Any]:
+        """Return a species from the cache or the API (shared by get/get_many).
 
-        # Here we try to ensure that we only run one API request for each species
-        # The first process creates an empty dict, and accesses the API
-        # Later requests for the same species either wait for the first one to complete
-        # or they return immediately if we already have the data we need
+        Each language is cached separately, so fetching a species in another
+        language does not replace the entry of the default one. Only waiting
+        for and starting API requests is done under `limit`; cache hits are
+        answered without it.
+        """
         _LOGGER.debug("get_plant %s (include=%s)", species, sorted(requested_includes))
-        if species not in hass.data[DOMAIN][ATTR_SPECIES]:
-            _LOGGER.debug("I am the first process to get %s", species)
-            hass.data[DOMAIN][ATTR_SPECIES][species] = {}
-            # Pass requested extra categories straight through to the API. The
-            # SDK merges `lang` in and treats an empty dict as no extra params.
-            extra_params = {}
-            if requested_includes:
-                extra_params["include"] = ",".join(sorted(requested_includes))
-            try:
-                # Optionally pass Home Assistant language to OpenPlantbook API
-                send_lang = entry.options.get(FLOW_SEND_LANG, True)
-                if send_lang:
-                    lang_code = hass.config.language or "en"
-                    if isinstance(lang_code, str):
-                        lang_code = lang_code.split("-")[0].lower()
-                    else:
-                        lang_code = "en"
-                    plant_data = await hass.data[DOMAIN][
-                        ATTR_API
-                    ].async_plant_detail_get(
-                        species, lang=lang_code, params=extra_params
-                    )
-                else:
-                    plant_data = await hass.data[DOMAIN][
-                        ATTR_API
-                    ].async_plant_detail_get(species, params=extra_params)
-            except RateLimitError as err:
-                plant_data = None
-                _LOGGER.warning(
-                    "Rate limit reached while fetching data for %s", species
-                )
-                del hass.data[DOMAIN][ATTR_SPECIES][species]
-                raise exceptions.HomeAssistantError(
-                    "OpenPlantbook API rate limit exceeded. Please try again later."
-                ) from err
-            except PermissionError as err:
-                plant_data = None
-                _LOGGER.exception(
-                    "Authentication failed while fetching data for %s. Please reconfigure the integration",
-                    species,
-                )
-                del hass.data[DOMAIN][ATTR_SPECIES][species]
-                raise InvalidAuth("Authentication failed") from err
-            except MissingClientIdOrSecret:
-                plant_data = None
-                _LOGGER.exception(
-                    "Missing client ID or secret. Please set up the integration again"
-                )
-                del hass.data[DOMAIN][ATTR_SPECIES][species]
-                raise
-
-            if plant_data:
-                _LOGGER.debug("Got data for %s", species)
-                _enrich_plant_data_with_dli(plant_data)
-                plant_data[OPB_ATTR_TIMESTAMP] = datetime.now().isoformat()
-                plant_data[OPB_ATTR_INCLUDES] = sorted(requested_includes)
-                hass.data[DOMAIN][ATTR_SPECIES][species] = plant_data
-                entity_id = async_generate_entity_id(
-                    f"{DOMAIN}.{{}}", plant_data[OPB_PID], current_ids={}
-                )
-                if entry.options.get(FLOW_DOWNLOAD_IMAGES) and plant_data.get(
-                    ATTR_IMAGE
-                ):
-                    # Derive the filename from the URL path only, ignoring any
-                    # cache-busting query string (e.g. ...jpg?v=abc123) so the
-                    # saved filename stays stable across refreshes.
-                    filename = slugify(
-                        urllib.parse.unquote(
-                            Path(
-                                urllib.parse.urlparse(plant_data[ATTR_IMAGE]).path
-                            ).name
+
+        # A fresh cached entry that already holds every requested include
+        # category is returned as-is. Otherwise we refetch: the caller bypasses
+        # the cache (cache: false), the entry expired, or it lacks a category,
+        # in which case only the missing categories are asked for and merged
+        # into the entry.
+        # With serve_stale on, an expired entry is still returned immediately
+        # and refreshed in the background; its entity updates once that lands.
+        # Any known variant of a name (casing, display_pid, an earlier input)
+        # resolves to its pid through the cache's alias index.
+        cache = hass.data[DOMAIN][ATTR_SPECIES]
+        stats = hass.data[DOMAIN][DATA_STATS]
+        pid = cache.resolve(species)
+        key = cache_key(pid if pid is not None else normalize_species(species), lang)
+        cached = cache.get(key) if pid is not None else None
+        in_flight = hass.data[DOMAIN][DATA_IN_FLIGHT]
+        # A name the API recently did not know is answered as not found
+        # without asking again (negative cache, see _async_record_miss).
+        misses = hass.data[DOMAIN][DATA_MISSES]
+        if (
+            use_cache
+            and pid is None
+            and misses.get(normalize_species(species), 0) > time.time()
+        ):
+            _LOGGER.debug("%s was recently not found, not asking again", species)
+            stats.negative_hits += 1
+            return {}
+        fetch_includes = requested_includes
+        if use_cache and cached is not None:
+            fetch_includes = _missing_includes(cached, requested_includes)
+        if use_cache and cached is not None and not fetch_includes:
+            if _cache_entry_is_fresh(cached, CACHE_TIME):
+                _LOGGER.debug("We already have cached data for %s", species)
+                stats.hits += 1
+                cache.touch(key)
+                return cached
+            # While the circuit breaker holds back API requests, stale data is
+            # served whatever the option, as a fetch would fail anyway.
+            breaker = hass.data[DOMAIN][DATA_CIRCUIT]
+            if entry.options.get(FLOW_SERVE_STALE, False) or breaker.is_open:
+                _LOGGER.debug("Serving stale data for %s while refreshing", species)
+                stats.stale_hits += 1
+                cache.touch(key)
+                if key not in in_flight and breaker.admits_requests:
+                    entry.async_create_background_task(
+                        hass,
+                        _async_refresh_plant(
+                            pid,
+                            _missing_includes(cached, set(cached.includes)),
+                            lang,
                         ),
-                        separator=" ",
-                    ).replace(" jpg", ".jpg")
-                    raise_if_invalid_filename(filename)
-                    download_path = entry.options.get(FLOW_DOWNLOAD_PATH)
-                    if not Path(download_path).is_absolute():
-                        download_path = hass.config.path(download_path)
-
-                    final_path = str(Path(download_path) / filename)
-                    if await hass.async_add_executor_job(Path(final_path).is_file):
-                        _LOGGER.warning("Filename %s already exists", final_path)
-                        downloaded_file = final_path
-                    else:
-                        downloaded_file = await async_download_image(
-                            plant_data.get(ATTR_IMAGE), final_path
-                        )
-                    if downloaded_file and "www/" in downloaded_file:
-                        plant_data[ATTR_IMAGE] = re.sub(
-                            "^.*www/", "/local/", downloaded_file
-                        )
-
-                _LOGGER.debug("data stored for %s: %s", species, plant_data)
-                # Key the entity holder by the canonical pid (not the raw
-                # service input), so different inputs that resolve to the same
-                # pid (casing/alias differences) map to the one entity instead
-                # of colliding on the shared entity_id/unique_id.
-                pid = plant_data[OPB_PID]
-                species_entities = hass.data[DOMAIN][DATA_SPECIES_ENTITIES]
-                existing_entity = species_entities.get(pid)
-                if existing_entity is None:
-                    species_entity = OpenPlantbookSpecies(entry, entity_id, plant_data)
-                    await hass.data[DOMAIN][DATA_COMPONENT].async_add_entities(
-                        [species_entity]
+                        f"{DOMAIN} refresh {key}",
                     )
-                    # Record the entity only after it is successfully added, so a
-                    # failed add does not leave a phantom (unattached) entity that
-                    # a later update would call async_write_ha_state() on.
-                    species_entities[pid] = species_entity
-                else:
-                    existing_entity.async_update_data(plant_data)
-                return plant_data
-            del hass.data[DOMAIN][ATTR_SPECIES][species]
-            return {}
-        if OPB_PID not in hass.data[DOMAIN][ATTR_SPECIES][species]:
-            # If more than one "get_plant" is triggered for the same species, we wait for up to
-            # 10 seconds for the first process to complete the API request.
-            # We don't want to return immediately, as we want the state object to be set by
-            # the running process before we return from this call.
-            # Known limitation: if this request asked for extra `include`
-            # categories but the in-flight request did not, we return the
-            # in-flight (possibly base-only) result rather than refetching here.
-            # The next call for those categories will refetch, so this is a
-            # transient, self-correcting miss in the rare concurrent case.
-            _LOGGER.debug(
-                "Another process is currently trying to get the data for %s",
-                species,
-            )
+                return cached
 
-            wait = 0
-            while OPB_PID not in hass.data[DOMAIN][ATTR_SPECIES][species]:
-                _LOGGER.debug("Waiting")
-                wait += 1
-                if wait == 10:
-                    _LOGGER.error("Giving up waiting for OpenPlantBook")
+        if not use_cache:
+            stats.bypasses += 1
+        elif cached is not None and fetch_includes:
+            stats.include_refetches += 1
+        else:
+            stats.misses += 1
+        async with limit or contextlib.nullcontext():
+            # Here we ensure that we only run one API request for each species. The
+            # first process starts a request task (see _async_coalesce); later
+            # requests for the same species await that task and resume the moment
+            # it completes, receiving the same data or the same exception.
+            while (pending := in_flight.get(key)) is not None:
+                _LOGGER.debug(
+                    "Another process is currently trying to get the data for %s",
+                    species,
+                )
+                stats.coalesced += 1
+                try:
+                    # shield: a waiter giving up must not cancel the shared fetch.
+                    async with async_timeout(wait_timeout):
+                        plant_data = await asyncio.shield(pending)
+                except TimeoutError as err:
+                    _LOGGER.warning("Giving up waiting for OpenPlantBook (%s)", species)
                     raise OpenPlantbookException(
                         "another request is still in progress, but timed out"
-                    )
-                await asyncio.sleep(1)
-            _LOGGER.debug("The other process completed successfully")
-            return hass.data[DOMAIN][ATTR_SPECIES][species]
-        if datetime.now() < datetime.fromisoformat(
-            hass.data[DOMAIN][ATTR_SPECIES][species][OPB_ATTR_TIMESTAMP]
-        ) + timedelta(hours=CACHE_TIME):
-            # We already have the data we need, so let's just return
-            _LOGGER.debug("We already have cached data for %s", species)
-            return hass.data[DOMAIN][ATTR_SPECIES][species]
-        del hass.data[DOMAIN][ATTR_SPECIES][species]
-        raise OpenPlantbookException(
-            "an unknown error occurred while fetching data for species %s", species
-        )
+                    ) from err
+                if not plant_data or not (
+                    fetch_includes := _missing_includes(plant_data, requested_includes)
+                ):
+                    _LOGGER.debug("The other process completed successfully")
+                    return plant_data
+                # The in-flight request did not ask for all of our include
+                # categories. Chain a follow-up fetch for the missing ones rather
+                # than returning its result without them (or wait for whichever
+                # caller already started that follow-up).
+                _LOGGER.debug(
+                    "The other process did not fetch %s for %s, fetching again",
+                    sorted(fetch_includes),
+                    species,
+                )
 
-    async def search_plantbook(call: ServiceCall) -> ServiceResponse:
+            return await _async_fetch_coalesced(key, species, fetch_includes, lang)
+
+    async def get_many_plants(call: ServiceCall) -> ServiceResponse:
+        """Get a list of species; the response maps each input to its data.
+
+        Inputs naming the same species are fetched once. A species that fails
+        maps to {"error": ...} instead of failing the whole call.
+        """
         if DOMAIN not in hass.data:
             raise OpenPlantbookException("no data found for domain %s", DOMAIN)
-        alias = call.data.get(ATTR_ALIAS)
-        if alias is None:
+        species_list = call.data.get(ATTR_SPECIES)
+        if not species_list:
             raise OpenPlantbookException(
-                "invalid service call, required attribute %s missing", ATTR_ALIAS
+                "invalid service call, required attribute %s missing", ATTR_SPECIES
             )
+        if isinstance(species_list, str):
+            species_list = [species_list]
+
+        requested_includes = _parse_includes(call.data.get(ATTR_INCLUDE))
+        use_cache = call.data.get("cache", True)
+        wait_timeout = call.data.get(ATTR_TIMEOUT, default_wait_timeout())
+        lang = _call_language(call)
+        limit = asyncio.Semaphore(GET_MANY_CONCURRENCY)
+        unique: dict[str, str] = {}
+        for species in species_list:
+            unique.setdefault(normalize_species(species), species)
+
+        async def _async_get_one(species: str) -> dict:
+            try:
+                return dict(
+                    await _async_get_plant(
+                        species,
+                        requested_includes,
+                        use_cache,
+                        wait_timeout,
+                        lang,
+                        limit,
+                    )
+                )
+            except Exception as err:
+                _LOGGER.debug("get_many failed for %s: %s", species, err)
+                return {ATTR_ERROR: str(err) or type(err).__name__}
+
+        results = dict(
+            zip(
+                unique,
+                await asyncio.gather(*map(_async_get_one, unique.values())),
+                strict=True,
+            )
+        )
+        return {
+            species: results[normalize_species(species)] for species in species_list
+        }
 
+    async def _async_search_api(alias: str) -> dict[str, str]:
+        """Search the API for alias and index the results locally."""
         _LOGGER.info("Searching for %s", alias)
         try:
-            plant_data = await hass.data[DOMAIN][ATTR_API].async_plant_search(alias)
+            plant_data = await _async_api_request(
+                hass, hass.data[DOMAIN][ATTR_API].async_plant_search, alias
+            )
         except RateLimitError as err:
             _LOGGER.warning("Rate limit reached while searching for %s", alias)
+            raise _rate_limit_error(err) from err
+        except CircuitOpenError as err:
+            _LOGGER.debug("Not searching for %s: %s", alias, err)
+            raise exceptions.HomeAssistantError(str(err)) from err
+        except TimeoutError as err:
+            _LOGGER.warning("Timed out searching for %s", alias)
+            raise exceptions.HomeAssistantError(
+                "OpenPlantbook API did not respond in time. Please try again later."
+            ) from err
+        except (aiohttp.ClientError, ApiUnavailableError) as err:
+            _LOGGER.warning("Unable to search for %s: %s", alias, err)
             raise exceptions.HomeAssistantError(
-                "OpenPlantbook API rate limit exceeded. Please try again later."
+                "OpenPlantbook API unavailable. Please try again later."
             ) from err
         except PermissionError as err:
             _LOGGER.exception(
@@ -390,69 +1135,267 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "Missing client ID or secret. Please set up the integration again"
             )
             raise
-        state = len(plant_data[OPB_ATTR_RESULTS])
         attrs = {}
         for plant in plant_data[OPB_ATTR_RESULTS]:
             pid = plant[OPB_PID]
             attrs[pid] = plant[OPB_DISPLAY_PID]
-        hass.data[DOMAIN][DATA_SEARCH_ENTITY].async_update_results(state, attrs)
+        _async_index_species(
+            hass, entry, [(pid, display_pid, []) for pid, display_pid in attrs.items()]
+        )
+        return attrs
+
+    async def _async_search_remote(alias: str) -> dict[str, str]:
+        """Return the API results for alias, from the search cache if possible.
+
+        Concurrent searches for the same normalized alias await the one
+        request in flight instead of starting their own.
+        """
+        search_cache = hass.data[DOMAIN][DATA_SEARCH_CACHE]
+        stats = hass.data[DOMAIN][DATA_STATS]
+        if (attrs := search_cache.get(alias, time.time())) is not None:
+            _LOGGER.debug("Search results for %s found in cache", alias)
+            stats.search_hits += 1
+            return attrs
+        key = normalize_species(alias)
+        in_flight = hass.data[DOMAIN][DATA_SEARCH_IN_FLIGHT]
+        if key in in_flight:
+            _LOGGER.debug("Waiting for the search for %s in progress", alias)
+            stats.search_coalesced += 1
+        # shield: a caller giving up must not cancel the shared search.
+        return await asyncio.shield(
+            _async_coalesce(
+                hass, entry, in_flight, key, partial(_async_search_and_cache, alias)
+            )
+        )
 
+    async def _async_search_and_cache(alias: str) -> dict[str, str]:
+        """Search the API for alias and keep the results in the search cache."""
+        attrs = await _async_search_api(alias)
+        if ttl := entry.options.get(FLOW_SEARCH_CACHE_TTL, DEFAULT_SEARCH_CACHE_TTL):
+            hass.data[DOMAIN][DATA_SEARCH_CACHE].put(
+                alias, attrs, time.time() + ttl * 60
+            )
+        return attrs
+
+    async def _async_search(
+        alias: str, offset: int, limit: int | None
+    ) -> dict[str, str]:
+        """Search for alias as the policy says and show the results.
+
+        Every result is returned. The search_result entity shows the total
+        count, but only the requested page of results, at most as many as
+        the options allow, to keep its state small.
+        """
+        # Any policy but remote opens the local database; local_then_remote
+        # asks the API only when nothing is found locally.
+        policy = entry.options.get(FLOW_SEARCH_POLICY, SEARCH_POLICY_REMOTE)
+        attrs = None
+        if (database := hass.data[DOMAIN].get(DATA_SPECIES_DB)) is not None:
+            attrs = await hass.async_add_executor_job(database.search, alias)
+            _LOGGER.debug("Found %d species for %s locally", len(attrs), alias)
+            if not attrs and policy != SEARCH_POLICY_LOCAL:
+                attrs = None
+        if attrs is None:
+            attrs = await _async_search_remote(alias)
+        shown = _page(attrs, offset, limit)
+        if max_shown := entry.options.get(
+            FLOW_SEARCH_RESULT_MAX, DEFAULT_SEARCH_RESULT_MAX
+        ):
+            shown = _page(shown, 0, max_shown)
+        hass.data[DOMAIN][DATA_SEARCH_ENTITY].async_update_results(len(attrs), shown)
         return attrs
 
+    async def _async_search_debounced(
+        alias: str, offset: int, limit: int | None, delay: float
+    ) -> dict[str, str]:
+        """Search for alias once no newer search for it has come in for delay seconds.
+
+        Calls for the same normalized alias form a burst that awaits one task.
+        Each call postpones it and replaces the paging, so only the last one
+        searches (and writes the search result entity). Searches for other
+        aliases have bursts of their own.
+        """
+        key = normalize_species(alias)
+        calls = hass.data[DOMAIN][DATA_SEARCH_BURST_CALL]
+        if (last := calls.get(key)) is None:
+            quiet = asyncio.Event()
+        else:
+            quiet, cancel = last[3:]
+            cancel()
+
+        @callback
+        def _async_quiet(_now: datetime) -> None:
+            quiet.set()
+
+        calls[key] = (
+            alias,
+            offset,
+            limit,
+            quiet,
+            async_call_later(hass, delay, HassJob(_async_quiet)),
+        )
+
+        async def _async_run() -> dict[str, str]:
+            try:
+                await quiet.wait()
+                last_alias, last_offset, last_limit, _, _ = calls[key]
+                return await _async_search(last_alias, last_offset, last_limit)
+            finally:
+                # Also stops the timer of a call that came in during the search.
+                calls.pop(key)[4]()
+
+        return await asyncio.shield(
+            _async_coalesce(
+                hass, entry, hass.data[DOMAIN][DATA_SEARCH_BURST], key, _async_run
+            )
+        )
+
+    async def search_plantbook(call: ServiceCall) -> ServiceResponse:
+        if DOMAIN not in hass.data:
+            raise OpenPlantbookException("no data found for domain %s", DOMAIN)
+        alias = call.data.get(ATTR_ALIAS)
+        if alias is None:
+            raise OpenPlantbookException(
+                "invalid service call, required attribute %s missing", ATTR_ALIAS
+            )
+
+        try:
+            offset = cv.positive_int(call.data.get(ATTR_OFFSET, 0))
+            limit = call.data.get(ATTR_LIMIT)
+            if limit is not None:
+                limit = cv.positive_int(limit)
+        except vol.Invalid as err:
+            raise OpenPlantbookException(f"invalid service call: {err}") from err
+
+        if debounce := entry.options.get(FLOW_SEARCH_DEBOUNCE, DEFAULT_SEARCH_DEBOUNCE):
+            attrs = await _async_search_debounced(alias, offset, limit, debounce / 1000)
+        else:
+            attrs = await _async_search(alias, offset, limit)
+
+        # Always a copy: the cached results are shared with later searches.
+        return _page(attrs, offset, limit)
+
+    async def export_cache(call: ServiceCall) -> ServiceResponse:
+        """Write the species cache and its alias index to a file."""
+        path = _cache_file_path(hass, call.data.get(ATTR_PATH))
+        compress = call.data.get(ATTR_COMPRESS, path.suffix == ".gz")
+        cache = hass.data[DOMAIN][ATTR_SPECIES]
+        # Encoded here: the records belong to the event loop, which may change
+        # them while the executor writes the file.
+        species = [json_bytes(record.as_dict()) for record in cache.values()]
+        try:
+            await hass.async_add_executor_job(
+                write_cache_file,
+                path,
+                json_bytes(
+                    {"format": CACHE_FILE_FORMAT, "version": CACHE_FILE_VERSION}
+                ),
+                species,
+                json_bytes({DATA_ALIASES: cache.aliases}),
+                compress,
+            )
+        except OSError as err:
+            raise OpenPlantbookException(f"Unable to write {path}: {err}") from err
+        _LOGGER.info("Exported %d species to %s", len(species), path)
+        return {ATTR_SPECIES: len(species), ATTR_PATH: str(path)}
+
+    async def import_cache(call: ServiceCall) -> ServiceResponse:
+        """Load the species of an exported cache file into the cache.
+
+        Species cached more recently than in the file are kept, and expired
+        ones are skipped (unless stale entries are served), just as when the
+        cache is restored at startup. Species are added in the order of the
+        file, which the export writes least recently used first.
+        """
+        path = _cache_file_path(hass, call.data.get(ATTR_PATH))
+        cache = hass.data[DOMAIN][ATTR_SPECIES]
+        serve_stale = entry.options.get(FLOW_SERVE_STALE, False)
+        language = _api_language(hass, entry)
+        # Cached once the whole file has been read, so a bad file changes nothing.
+        found: dict[str, SpeciesRecord] = {}
+        aliases: dict[str, str] = {}
+        lines = read_cache_file(path)
+        try:
+            # The file is read in batches, so it is never held in memory whole.
+            while batch := await hass.async_add_executor_job(
+                lambda: list(islice(lines, CACHE_FILE_IMPORT_BATCH))
+            ):
+                for value in batch:
+                    if DATA_ALIASES in value:
+                        aliases = value[DATA_ALIASES]
+                        continue
+                    try:
+                        record = SpeciesRecord.from_dict(value, language)
+                    except (KeyError, TypeError, ValueError) as err:
+                        _LOGGER.debug("Skipping malformed entry in %s: %s", path, err)
+                        continue
+                    key = cache_key(record.pid, record.lang)
+                    current = found.get(key) or cache.get(key)
+                    if (
+                        current is not None and current.fetched >= record.fetched
+                    ) or not (serve_stale or _cache_entry_is_fresh(record, CACHE_TIME)):
+                        continue
+                    found[key] = record
+        except OSError as err:
+            raise OpenPlantbookException(f"Unable to read {path}: {err}") from err
+        except (OpenPlantbookException, ValueError) as err:
+            raise exceptions.ServiceValidationError(
+                f"Unable to import {path}: {err}"
+            ) from err
+        finally:
+            await hass.async_add_executor_job(lines.close)
+        if not isinstance(aliases, dict):
+            raise exceptions.ServiceValidationError(
+                f"Unable to import {path}: the alias index is not a JSON object"
+            )
+        for key, record in found.items():
+            cache[key] = record
+        for alias, pid in aliases.items():
+            cache.learn_alias(alias, pid)
+        # Entries evicted again by the cache limits get no entity.
+        await _async_add_species_entities(
+            hass,
+            entry,
+            [record for key, record in found.items() if cache.get(key) is record],
+        )
+        _async_schedule_expiry(hass, entry)
+        _async_schedule_cache_save(hass)
+        _LOGGER.info("Imported %d species from %s", len(found), path)
+        return {ATTR_SPECIES: len(found)}
+
     async def plant_data_upload_service(call: ServiceCall) -> ServiceResponse:
         try:
             return {"result": await plant_data_upload(hass, entry=entry, call=call)}
         except RateLimitError as err:
             _LOGGER.warning("Rate limit reached while uploading plant data")
-            raise exceptions.HomeAssistantError(
-                "OpenPlantbook API rate limit exceeded. Please try again later."
-            ) from err
+            raise _rate_limit_error(err) from err
+        except (ApiUnavailableError, CircuitOpenError) as err:
+            raise exceptions.HomeAssistantError(str(err)) from err
 
     async def clean_cache(call: ServiceCall) -> None:
+        """Remove every species older than `hours`, regardless of its timer."""
         hours = call.data.get(ATTR_HOURS)
         if hours is None or not isinstance(hours, int):
             hours = CACHE_TIME
+        hass.data[DOMAIN].get(DATA_MISSES, {}).clear()
+        if (search_cache := hass.data[DOMAIN].get(DATA_SEARCH_CACHE)) is not None:
+            search_cache.clear()
         if ATTR_SPECIES in hass.data[DOMAIN]:
-            ent_reg = er.async_get(hass)
-            for species in list(hass.data[DOMAIN][ATTR_SPECIES]):
-                value = hass.data[DOMAIN][ATTR_SPECIES][species]
-                # Skip in-flight entries: the get_plant concurrency guard stores
-                # an empty sentinel dict ({}) before the API call completes, so it
-                # has no timestamp/pid yet. It will be cleaned on a later pass.
-                if OPB_ATTR_TIMESTAMP not in value:
-                    continue
-                if datetime.now() > datetime.fromisoformat(
-                    value[OPB_ATTR_TIMESTAMP]
-                ) + timedelta(hours=hours):
-                    _LOGGER.debug("Removing %s from cache", species)
-                    pid = value[OPB_PID]
-                    hass.data[DOMAIN][ATTR_SPECIES].pop(species)
-                    # The same pid can be cached under several input keys
-                    # (casing/alias differences map to one canonical pid, hence
-                    # one shared entity). Only tear the entity down once the last
-                    # cache entry referencing this pid is gone, so an expiring
-                    # key doesn't strand a still-cached one without its state.
-                    if any(
-                        v.get(OPB_PID) == pid
-                        for v in hass.data[DOMAIN][ATTR_SPECIES].values()
-                    ):
-                        continue
-                    entity = hass.data[DOMAIN][DATA_SPECIES_ENTITIES].pop(pid, None)
-                    if entity is not None:
-                        entity_id = entity.entity_id
-                        await entity.async_remove()
-                        # Purge the registry entry too, so dynamically-removed
-                        # species do not accumulate as stale "unavailable"
-                        # entities.
-                        if ent_reg.async_get(entity_id) is not None:
-                            ent_reg.async_remove(entity_id)
-
-    def _write_file(path: str, data: bytes) -> None:
-        """Write binary data to a file (runs in executor)."""
-        with Path(path).open("wb") as fil:
-            fil.write(data)
+            for key in list(hass.data[DOMAIN][ATTR_SPECIES]):
+                record = hass.data[DOMAIN][ATTR_SPECIES][key]
+                if not _cache_entry_is_fresh(record, hours):
+                    _LOGGER.debug("Removing %s from cache", key)
+                    hass.data[DOMAIN][ATTR_SPECIES].pop(key)
+                    _async_schedule_cache_save(hass)
+                    await _async_remove_species_entity(hass, entry, record.pid)
 
     async def async_download_image(url: str, download_to: str) -> str | bool:
+        """Download an image to download_to, returning it, or False on failure.
+
+        The response is streamed to a temporary file next to the target, which
+        replaces the target only once complete, so an interrupted download
+        never leaves a truncated image behind.
+        """
         _LOGGER.debug(
             "Going to download image %s to %s",
             url,
@@ -463,28 +1406,84 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 "File %s already exists. Will not download again", download_to
             )
             return download_to
-        websession = async_get_clientsession(hass)
-
-        async with async_timeout(10):
-            resp = await websession.get(url)
-            if resp.status != 200:
+        target = Path(download_to)
+        part_file = target.with_name(f".{target.name}.part")
+        try:
+            async with (
+                async_timeout(IMAGE_DOWNLOAD_TIMEOUT),
+                async_get_clientsession(hass).get(url) as resp,
+            ):
+                if resp.status != 200:
+                    _LOGGER.warning(
+                        "Downloading '%s' failed, status_code=%d", url, resp.status
+                    )
+                    return False
+                if not resp.content_type.startswith("image/"):
+                    _LOGGER.warning(
+                        "Not downloading '%s': not an image (%s)",
+                        url,
+                        resp.content_type,
+                    )
+                    return False
+                expected = resp.content_length
+                encoded = hdrs.CONTENT_ENCODING in resp.headers
+                if expected is not None and expected > IMAGE_MAX_SIZE:
+                    _LOGGER.warning(
+                        "Not downloading '%s': %d bytes is over the limit of %d",
+                        url,
+                        expected,
+                        IMAGE_MAX_SIZE,
+                    )
+                    return False
+                size = await _async_stream_to_file(resp, part_file)
+            if size is None:
                 _LOGGER.warning(
-                    "Downloading '%s' failed, status_code=%d", url, resp.status
+                    "Not downloading '%s': over the limit of %d bytes",
+                    url,
+                    IMAGE_MAX_SIZE,
                 )
                 return False
-
-        data = await resp.read()
-        try:
-            await hass.async_add_executor_job(_write_file, download_to, data)
-        except PermissionError:
-            _LOGGER.warning(
-                "Cannot write image to %s due to permission error", download_to
-            )
+            # Content-Length counts the encoded body, aiohttp streams it decoded
+            if expected is not None and not encoded and size != expected:
+                _LOGGER.warning(
+                    "Downloading '%s' failed: got %d of %d bytes", url, size, expected
+                )
+                return False
+            await hass.async_add_executor_job(part_file.replace, target)
+        except (aiohttp.ClientError, TimeoutError) as err:
+            _LOGGER.warning("Downloading '%s' failed: %s", url, err)
             return False
+        except OSError as err:
+            _LOGGER.warning("Cannot write image to %s: %s", download_to, err)
+            return False
+        finally:
+            await hass.async_add_executor_job(
+                partial(part_file.unlink, missing_ok=True)
+            )
 
         _LOGGER.debug("Downloading of %s done", url)
         return download_to
 
+    async def _async_stream_to_file(
+        resp: aiohttp.ClientResponse, path: Path
+    ) -> int | None:
+        """Write the response body to path in chunks, in the executor.
+
+        Returns the number of bytes written, or None once the body grows over
+        IMAGE_MAX_SIZE.
+        """
+        fil = await hass.async_add_executor_job(path.open, "wb")
+        size = 0
+        try:
+            async for chunk in resp.content.iter_chunked(IMAGE_CHUNK_SIZE):
+                size += len(chunk)
+                if size > IMAGE_MAX_SIZE:
+                    return None
+                await hass.async_add_executor_job(fil.write, chunk)
+        finally:
+            await hass.async_add_executor_job(fil.close)
+        return size
+
     # Setup upload schedule
     await async_setup_upload_schedule(hass, entry)
     # Setup optionFlow updates listener
@@ -496,30 +1495,66 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     search_entity = OpenPlantbookSearchResult(entry)
     await hass.data[DOMAIN][DATA_COMPONENT].async_add_entities([search_entity])
     hass.data[DOMAIN][DATA_SEARCH_ENTITY] = search_entity
+    await _async_setup_statistics_entity(hass, entry)
+    await _async_setup_species_db(hass, entry)
 
-    # The per-species cache is in-memory only, so on a fresh start (e.g. after a
-    # restart) it is empty and clean_cache has nothing to expire. Purge any
-    # per-species entities left in the registry by a previous run so they don't
-    # linger as stale, unavailable entities. The persistent search_result entity
-    # is kept; no per-species entities are live yet at this point in setup.
+    # Rebuild one per-species entity for every pid restored from storage in
+    # the default language, so a restart makes no API calls for entries that
+    # are still fresh.
+    species_entities = hass.data[DOMAIN][DATA_SPECIES_ENTITIES]
+    language = hass.data[DOMAIN][DATA_LANGUAGE]
+    new_entities = {
+        record.pid: OpenPlantbookSpecies(entry, _species_entity_id(record.pid), record)
+        for record in hass.data[DOMAIN][ATTR_SPECIES].values()
+        if record.lang == language and record.pid not in species_entities
+    }
+
+    # Purge any other per-species entities left in the registry by a previous
+    # run (their cache entries expired while HA was down) so they don't linger
+    # as stale, unavailable entities. The persistent search_result and
+    # cache_statistics entities are kept, as are the rows the restored
+    # entities are about to reclaim.
+    keep_unique_ids = {search_entity.unique_id} | {
+        species_entity.unique_id for species_entity in new_entities.values()
+    }
+    if (stats_entity := hass.data[DOMAIN].get(DATA_STATS_ENTITY)) is not None:
+        keep_unique_ids.add(stats_entity.unique_id)
     ent_reg = er.async_get(hass)
     for reg_entry in list(ent_reg.entities.values()):
         if (
             reg_entry.platform == DOMAIN
             and reg_entry.domain == DOMAIN
-            and reg_entry.entity_id != search_entity.entity_id
+            and reg_entry.unique_id not in keep_unique_ids
         ):
             ent_reg.async_remove(reg_entry.entity_id)
 
+    if new_entities:
+        await hass.data[DOMAIN][DATA_COMPONENT].async_add_entities(
+            list(new_entities.values())
+        )
+        species_entities.update(new_entities)
+        _LOGGER.debug(
+            "Restored %d species from the persistent cache", len(new_entities)
+        )
+
     hass.services.async_register(
         DOMAIN, OPB_SERVICE_SEARCH, search_plantbook, None, SupportsResponse.OPTIONAL
     )
     hass.services.async_register(
         DOMAIN, OPB_SERVICE_GET, get_plant, None, SupportsResponse.OPTIONAL
     )
+    hass.services.async_register(
+        DOMAIN, OPB_SERVICE_GET_MANY, get_many_plants, None, SupportsResponse.OPTIONAL
+    )
     hass.services.async_register(
         DOMAIN, OPB_SERVICE_CLEAN_CACHE, clean_cache, None, SupportsResponse.NONE
     )
+    hass.services.async_register(
+        DOMAIN, OPB_SERVICE_EXPORT_CACHE, export_cache, None, SupportsResponse.OPTIONAL
+    )
+    hass.services.async_register(
+        DOMAIN, OPB_SERVICE_IMPORT_CACHE, import_cache, None, SupportsResponse.OPTIONAL
+    )
     hass.services.async_register(
         DOMAIN,
         OPB_SERVICE_UPLOAD,
@@ -527,6 +1562,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         None,
         SupportsResponse.OPTIONAL,
     )
+    # Prefetch the species of existing plants once HA has started (optional)
+    async_setup_warm_up(hass, entry)
 
     return True
 
@@ -535,6 +1572,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.debug("Unloading %s", DOMAIN)
     _LOGGER.debug("Removing cache")
+    # Snapshot the cache before clean_cache empties it: the persisted copy is
+    # kept, so a reload starts warm just like a restart does.
+    snapshot = _species_cache_to_store(hass.data[DOMAIN][ATTR_SPECIES])
     await hass.services.async_call(
         domain=DOMAIN,
         service=OPB_SERVICE_CLEAN_CACHE,
@@ -542,14 +1582,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         blocking=True,
         # limit=30,
     )
+    if (store := hass.data[DOMAIN].get(DATA_STORE)) is not None:
+        # Replaces the (empty) save that clean_cache just scheduled.
+        await store.async_save(snapshot)
+    if (timer := hass.data[DOMAIN].pop(DATA_EXPIRY_TIMER, None)) is not None:
+        timer[1]()
+    if (token_manager := hass.data[DOMAIN].get(DATA_TOKEN)) is not None:
+        await token_manager.async_stop()
+    for burst in hass.data[DOMAIN][DATA_SEARCH_BURST].values():
+        # Nobody will run the pending searches; release their callers.
+        burst.cancel()
     _LOGGER.debug("Removing search result")
     search_entity = hass.data[DOMAIN].get(DATA_SEARCH_ENTITY)
     if search_entity is not None:
         await search_entity.async_remove()
+    if (stats_entity := hass.data[DOMAIN].get(DATA_STATS_ENTITY)) is not None:
+        await stats_entity.async_remove()
+    if (database := hass.data[DOMAIN].get(DATA_SPECIES_DB)) is not None:
+        await hass.async_add_executor_job(database.close)
     _LOGGER.debug("Removing services")
     hass.services.async_remove(DOMAIN, OPB_SERVICE_SEARCH)
     hass.services.async_remove(DOMAIN, OPB_SERVICE_GET)
+    hass.services.async_remove(DOMAIN, OPB_SERVICE_GET_MANY)
     hass.services.async_remove(DOMAIN, OPB_SERVICE_CLEAN_CACHE)
+    hass.services.async_remove(DOMAIN, OPB_SERVICE_EXPORT_CACHE)
+    hass.services.async_remove(DOMAIN, OPB_SERVICE_IMPORT_CACHE)
     hass.services.async_remove(DOMAIN, OPB_SERVICE_UPLOAD)
     # Clear per-entry data but keep the EntityComponent, which is reused across
     # reloads (it owns the openplantbook.* entity platform).
@@ -559,12 +1616,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the persisted species cache and database on removal."""
+    await Store(hass, STORAGE_VERSION, STORAGE_KEY).async_remove()
+    await Store(hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY).async_remove()
+    await hass.async_add_executor_job(
+        lambda: _species_db_path(hass).unlink(missing_ok=True)
+    )
+
+
 async def config_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle component's options update."""
     # await hass.config_entries.async_reload(entry.entry_id)
 
     _LOGGER.debug("Options update: %s, %s", entry.entry_id, entry.options)
     await async_setup_upload_schedule(hass, entry)
+    hass.data[DOMAIN][ATTR_SPECIES].resize(*_cache_limits(entry))
+    hass.data[DOMAIN][DATA_SCHEDULER].configure(*_api_limits(entry))
+    # Sending another language (or none) only invalidates the species cached
+    # in the previous one.
+    previous = hass.data[DOMAIN][DATA_LANGUAGE]
+    if (language := _api_language(hass, entry)) != previous:
+        hass.data[DOMAIN][DATA_LANGUAGE] = language
+        await _async_switch_language(hass, entry, previous)
+    await _async_setup_statistics_entity(hass, entry)
+    await _async_setup_species_db(hass, entry)
 
 
 class InvalidAuth(exceptions.HomeAssistantError):
@@ -0,0 +1,169 @@
+"""OAuth token of the OpenPlantbook API client.
+
+The SDK fetches its client-credentials token lazily, so the first request after
+a restart or an expiry waits for a token round trip. The TokenManager stored at
+hass.data[DOMAIN][DATA_TOKEN] avoids that for the shared client: it persists
+the token with its expiry in .storage/, restores it at startup, and fetches the
+next one in the background TOKEN_REFRESH_MARGIN seconds before it expires.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .client import PlantbookClient
+from .const import (
+    ATTR_API,
+    DOMAIN,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_RETRY_DELAY,
+    TOKEN_STORAGE_KEY,
+    TOKEN_STORAGE_VERSION,
+)
+from .retry import async_api_call
+from .scheduler import PRIORITY_BACKGROUND
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def async_get_client(
+    hass: HomeAssistant, client_id: str | None, secret: str | None
+) -> PlantbookClient:
+    """Return the shared API client for these credentials.
+
+    The config flow and the config entry use the same client, so the token
+    obtained while validating the credentials is not fetched again at setup.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    client = domain_data.get(ATTR_API)
+    if client is None or (client.client_id, client.secret) != (client_id, secret):
+        client = PlantbookClient(hass, client_id, secret)
+        domain_data[ATTR_API] = client
+    return client
+
+
+def _token_expires(token: Any) -> datetime | None:
+    """Return when an SDK token expires (naive local time, as the SDK keeps it)."""
+    if not isinstance(token, dict):
+        return None
+    try:
+        return datetime.fromisoformat(token["expires"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenManager:
+    """Persist and renew the token of the shared API client."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, client: PlantbookClient
+    ) -> None:
+        """Initialize the manager of client's token."""
+        self._hass = hass
+        self._entry = entry
+        self._client = client
+        self._store: Store[dict[str, Any]] = Store(
+            hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY, private=True
+        )
+        self._unsub: CALLBACK_TYPE | None = None
+        self.refreshes = 0
+
+    async def async_load(self) -> None:
+        """Give the client the persisted token, if it is still valid."""
+        if _token_expires(self._client.token) is not None:
+            # Fetched moments ago, while validating the credentials
+            return
+        stored = await self._store.async_load()
+        if not stored or stored.get("client_id") != self._client.client_id:
+            return
+        token = stored.get("token")
+        if (expires := _token_expires(token)) is not None and expires > datetime.now():
+            _LOGGER.debug("Restored the OpenPlantbook token, valid until %s", expires)
+            self._client.token = token
+
+    @callback
+    def async_start(self) -> None:
+        """Renew the token before it expires, or now if there is none."""
+        self._async_schedule(self._refresh_in())
+
+    async def async_stop(self) -> None:
+        """Stop renewing and persist the token the client holds now."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        await self._async_save()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the token lifetime, for diagnostics."""
+        expires = _token_expires(self._client.token)
+        return {
+            "expires": expires.isoformat() if expires else None,
+            "refreshes": self.refreshes,
+        }
+
+    def _refresh_in(self) -> float:
+        """Return the seconds until the token should be renewed."""
+        if (expires := _token_expires(self._client.token)) is None:
+            return 0
+        renew = expires - timedelta(seconds=TOKEN_REFRESH_MARGIN)
+        return max((renew - datetime.now()).total_seconds(), 0)
+
+    @callback
+    def _async_schedule(self, delay: float) -> None:
+        """Renew the token after delay seconds."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+        @callback
+        def _async_renew(_now: datetime | None = None) -> None:
+            self._unsub = None
+            self._entry.async_create_background_task(
+                self._hass, self._async_refresh(), f"{DOMAIN} token refresh"
+            )
+
+        if delay <= 0:
+            _async_renew()
+            return
+        self._unsub = async_call_later(
+            self._hass,
+            delay,
+            HassJob(_async_renew, name="opb token refresh", cancel_on_shutdown=True),
+        )
+
+    async def _async_refresh(self) -> None:
+        """Fetch a new token and hand it to the client.
+
+        A separate client fetches it, as the SDK reuses a token that is still
+        valid; requests keep using the current token until it is swapped in.
+        """
+        fresh = PlantbookClient(self._hass, self._client.client_id, self._client.secret)
+        try:
+            await async_api_call(
+                self._hass, fresh._async_get_token, PRIORITY_BACKGROUND
+            )
+        except Exception as err:
+            # The SDK still fetches a token itself when a request needs one.
+            _LOGGER.warning("Unable to renew the OpenPlantbook token: %s", err)
+            self._async_schedule(TOKEN_RETRY_DELAY)
+            return
+        self._client.token = fresh.token
+        self.refreshes += 1
+        _LOGGER.debug("Renewed the OpenPlantbook token")
+        await self._async_save()
+        self._async_schedule(self._refresh_in() or TOKEN_RETRY_DELAY)
+
+    async def _async_save(self) -> None:
+        """Persist the client's token, if it has one."""
+        if _token_expires(token := self._client.token) is None:
+            return
+        await self._store.async_save(
+            {"client_id": self._client.client_id, "token": token}
+        )
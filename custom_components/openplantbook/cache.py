@@ -0,0 +1,472 @@
+"""Bounded species cache for the OpenPlantBook integration.
+
+Stored at hass.data[DOMAIN][ATTR_SPECIES], it maps each (pid, language) cache
+key to a SpeciesRecord. It holds at most a configured number of entries and an
+approximate byte budget, evicting by recency and frequency of use, and keeps an
+alias index so that casing/spelling variants of a species resolve locally.
+Expiry times live in a min-heap, so finding the entries that are due costs
+O(log n) per expiring entry rather than a scan of the whole cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import heapq
+import sys
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Container, Iterator, Mapping, MutableMapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any
+
+from homeassistant.helpers.json import json_bytes, json_bytes_sorted
+
+from .const import (
+    OPB_ATTR_INCLUDES,
+    OPB_ATTR_INCLUDES_AT,
+    OPB_ATTR_LANG,
+    OPB_ATTR_TIMESTAMP,
+    OPB_DISPLAY_PID,
+    OPB_PID,
+)
+
+# On eviction, the least frequently used entry among this many least recently
+# used ones is dropped. A small window keeps eviction O(1) per entry while
+# sparing an old but popular species from being pushed out by a burst of
+# one-off lookups.
+EVICTION_SAMPLE = 8
+
+# Fields the integration adds to each entry; they change on every fetch
+# without the species itself changing.
+BOOKKEEPING_FIELDS = frozenset(
+    {OPB_ATTR_TIMESTAMP, OPB_ATTR_INCLUDES, OPB_ATTR_INCLUDES_AT, OPB_ATTR_LANG}
+)
+
+# Typographic quotes users paste from web pages, mapped to the ASCII ones used
+# in OpenPlantbook pids (e.g. coleus 'marble').
+_QUOTES = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+
+def normalize_species(name: str) -> str:
+    """Return the alias-index form of a species name.
+
+    Case, Unicode compatibility forms, typographic quotes and runs of
+    whitespace are folded, so "Coleus 'Marble'" and " coleus  ’marble’ " map
+    to the same key.
+    """
+    name = unicodedata.normalize("NFKC", name).translate(_QUOTES)
+    return " ".join(name.casefold().split())
+
+
+def species_fingerprint(plant_data: Mapping[str, Any]) -> bytes:
+    """Return a digest of a species' content, ignoring bookkeeping fields.
+
+    Two fetches of an unchanged species have the same fingerprint, whatever
+    their key order.
+    """
+    content = {
+        key: value for key, value in plant_data.items() if key not in BOOKKEEPING_FIELDS
+    }
+    return hashlib.blake2b(json_bytes_sorted(content), digest_size=16).digest()
+
+
+def cache_key(pid: str, lang: str | None) -> str:
+    """Return the cache key of a species fetched in a language.
+
+    Species fetched without a language are keyed by their bare pid.
+    """
+    return pid if lang is None else f"{pid}|{lang}"
+
+
+@dataclass(slots=True)
+class SpeciesRecord(Mapping[str, Any]):
+    """One cached species: the API payload and its bookkeeping.
+
+    Payload keys and the pid are interned, as thousands of entries repeat the
+    same few dozen keys, and times are kept as epoch floats. As a mapping, it
+    reads like the dict the API returned with the bookkeeping fields added
+    (ISO timestamps); those are only built when read, e.g. for the entity
+    attributes or a service response (see `as_dict`).
+    """
+
+    pid: str
+    lang: str | None
+    data: dict[str, Any]
+    fetched: float
+    # include category -> epoch time it was fetched
+    includes: dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_api(
+        cls,
+        plant_data: Mapping[str, Any],
+        lang: str | None,
+        fetched: float,
+        includes: dict[str, float],
+    ) -> SpeciesRecord:
+        """Build a record from a payload, interning its keys."""
+        return cls(
+            sys.intern(plant_data[OPB_PID]),
+            lang,
+            {
+                sys.intern(key): value
+                for key, value in plant_data.items()
+                if key not in BOOKKEEPING_FIELDS
+            },
+            fetched,
+            includes,
+        )
+
+    @classmethod
+    def from_dict(
+        cls, value: Mapping[str, Any], lang: str | None = None
+    ) -> SpeciesRecord:
+        """Build a record from its dict form, as persisted to storage.
+
+        `lang` is used for entries stored without one. Entries from older
+        stores only list their include categories, which are then as old as
+        the entry itself.
+        """
+        fetched = datetime.fromisoformat(value[OPB_ATTR_TIMESTAMP]).timestamp()
+        if (stored := value.get(OPB_ATTR_INCLUDES_AT)) is not None:
+            includes = {
+                category: datetime.fromisoformat(when).timestamp()
+                for category, when in stored.items()
+            }
+        else:
+            includes = dict.fromkeys(value.get(OPB_ATTR_INCLUDES) or (), fetched)
+        return cls.from_api(value, value.get(OPB_ATTR_LANG, lang), fetched, includes)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a payload field or a bookkeeping field."""
+        if key == OPB_ATTR_TIMESTAMP:
+            return datetime.fromtimestamp(self.fetched).isoformat()
+        if key == OPB_ATTR_INCLUDES:
+            return list(self.includes)
+        if key == OPB_ATTR_INCLUDES_AT:
+            return {
+                category: datetime.fromtimestamp(when).isoformat()
+                for category, when in self.includes.items()
+            }
+        if key == OPB_ATTR_LANG:
+            return self.lang
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the payload fields, then the bookkeeping fields."""
+        yield from self.data
+        yield from (
+            OPB_ATTR_TIMESTAMP,
+            OPB_ATTR_INCLUDES,
+            OPB_ATTR_INCLUDES_AT,
+            OPB_ATTR_LANG,
+        )
+
+    def __len__(self) -> int:
+        """Return the number of fields, bookkeeping included."""
+        return len(self.data) + len(BOOKKEEPING_FIELDS)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the record as a plain dict (service responses, storage)."""
+        return dict(self)
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how well the species cache works since setup.
+
+    Lookups end up in exactly one of hits, stale_hits, negative_hits, misses,
+    include_refetches or bypasses; coalesced counts the lookups that waited on
+    a request another caller already had in flight. Searches answered from the
+    search cache, or by waiting on an identical search, are counted apart.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    include_refetches: int = 0
+    bypasses: int = 0
+    coalesced: int = 0
+    search_hits: int = 0
+    search_coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    api_requests: int = 0
+    api_errors: int = 0
+    api_retries: int = 0
+    api_seconds: float = 0.0
+    api_seconds_max: float = 0.0
+
+    def record_api_request(self, seconds: float, failed: bool) -> None:
+        """Count one API request and its latency."""
+        self.api_requests += 1
+        self.api_errors += failed
+        self.api_seconds += seconds
+        self.api_seconds_max = max(self.api_seconds_max, seconds)
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Return the percentage of lookups answered from the cache."""
+        answered = self.hits + self.stale_hits + self.negative_hits
+        lookups = answered + self.misses + self.include_refetches + self.bypasses
+        return round(100 * answered / lookups, 1) if lookups else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters with the derived hit ratio and mean latency."""
+        return {
+            **asdict(self),
+            "hit_ratio": self.hit_ratio,
+            "api_seconds_mean": (
+                self.api_seconds / self.api_requests if self.api_requests else None
+            ),
+        }
+
+
+class SearchCache:
+    """Recent search results by normalized alias, each until it expires.
+
+    Holds at most max_entries searches; the least recently used is dropped.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize an empty search cache."""
+        self._max_entries = max_entries
+        self._results: OrderedDict[str, tuple[float, dict[str, str]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached searches."""
+        return len(self._results)
+
+    def get(self, alias: str, now: float) -> dict[str, str] | None:
+        """Return the unexpired results of a search, if cached."""
+        key = normalize_species(alias)
+        if (cached := self._results.get(key)) is None:
+            return None
+        if cached[0] <= now:
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return cached[1]
+
+    def put(self, alias: str, results: dict[str, str], expires: float) -> None:
+        """Cache the results of a search until expires."""
+        key = normalize_species(alias)
+        self._results[key] = (expires, results)
+        self._results.move_to_end(key)
+        while len(self._results) > self._max_entries:
+            self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached search."""
+        self._results.clear()
+
+
+class SpeciesCache(MutableMapping[str, SpeciesRecord]):
+    """Species cache bounded by entry count and approximate size in bytes.
+
+    Keys are opaque (see `cache_key`); the same pid may be cached under one
+    key per language. Every stored entry teaches the alias index its pid and
+    display_pid; `learn_alias` adds other names (e.g. the `get` input that
+    fetched it) and `resolve` maps any known variant back to the pid. Aliases
+    are forgotten with the last entry of the pid they point to.
+
+    With a `ttl`, each entry expires that many seconds after its timestamp. `next_expiry` and
+    `pop_due` read the expiry heap; refreshed or removed entries leave stale
+    heap items behind, which are skipped lazily and compacted when they
+    outnumber the live ones.
+
+    Entry size is the length of the record's JSON encoding, which tracks the
+    memory held by it (and by the entity sharing it) closely enough to budget
+    on. Keys contained in `pinned` (fetches still in flight) are never
+    evicted, nor is the entry being inserted, even if it alone exceeds the
+    budget. `on_evict(key, value)` is called for every evicted entry.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        pinned: Container[str] = (),
+        on_evict: Callable[[str, SpeciesRecord], None] | None = None,
+        ttl: float | None = None,
+    ) -> None:
+        """Initialize an empty cache with the given limits."""
+        self._data: OrderedDict[str, SpeciesRecord] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._hits: dict[str, int] = {}
+        self._aliases: dict[str, str] = {}
+        self._pid_aliases: dict[str, set[str]] = {}
+        self._pid_keys: dict[str, set[str]] = {}
+        self._key_pids: dict[str, str] = {}
+        self._expires: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._ttl = ttl
+        self._bytes = 0
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._pinned = pinned
+        self._on_evict = on_evict
+
+    def __getitem__(self, key: str) -> SpeciesRecord:
+        """Return the entry for key without counting it as a use."""
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: SpeciesRecord) -> None:
+        """Store an entry as the most recently used, evicting others if needed."""
+        if key in self._data:
+            self._discard(key)
+        size = len(json_bytes(value))
+        self._data[key] = value
+        self._sizes[key] = size
+        self._bytes += size
+        self._hits[key] = self._hits.get(key, 0) + 1
+        pid = value.pid
+        self._key_pids[key] = pid
+        self._pid_keys.setdefault(pid, set()).add(key)
+        self.learn_alias(pid, pid)
+        if display_pid := value.data.get(OPB_DISPLAY_PID):
+            self.learn_alias(display_pid, pid)
+        if self._ttl is not None:
+            self._schedule_expiry(key, value.fetched + self._ttl)
+        self._evict(protect=key)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an entry and its aliases (no eviction callback)."""
+        if key not in self._data:
+            raise KeyError(key)
+        self._discard(key)
+        self._forget(key)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate keys from least to most recently used."""
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove every entry (no eviction callbacks)."""
+        self._data.clear()
+        self._sizes.clear()
+        self._hits.clear()
+        self._aliases.clear()
+        self._pid_aliases.clear()
+        self._pid_keys.clear()
+        self._key_pids.clear()
+        self._expires.clear()
+        self._expiry_heap.clear()
+        self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Return the approximate size of all cached entries in bytes."""
+        return self._bytes
+
+    @property
+    def aliases(self) -> dict[str, str]:
+        """Return a copy of the alias index (normalized name -> pid)."""
+        return dict(self._aliases)
+
+    def resolve(self, name: str) -> str | None:
+        """Return the cached pid a species name is known to resolve to."""
+        return self._aliases.get(normalize_species(name))
+
+    def learn_alias(self, name: str, pid: str) -> None:
+        """Record that name resolves to the (cached) pid."""
+        if pid not in self._pid_keys:
+            return
+        alias = normalize_species(name)
+        previous = self._aliases.get(alias)
+        if previous is not None and previous != pid:
+            self._pid_aliases[previous].discard(alias)
+        self._aliases[alias] = pid
+        self._pid_aliases.setdefault(pid, set()).add(alias)
+
+    def next_expiry(self) -> float | None:
+        """Return the epoch time at which the next entry expires, if any."""
+        heap = self._expiry_heap
+        while heap and self._expires.get(heap[0][1]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def pop_due(self, now: float) -> list[str]:
+        """Return the keys of entries expired by `now`, oldest first.
+
+        The entries stay cached (the caller removes or keeps them); each is
+        reported once, until it is stored again.
+        """
+        due = []
+        while (expires := self.next_expiry()) is not None and expires <= now:
+            _, key = heapq.heappop(self._expiry_heap)
+            del self._expires[key]
+            due.append(key)
+        return due
+
+    def keys_of(self, pid: str) -> set[str]:
+        """Return the keys under which a pid is cached (one per language)."""
+        return set(self._pid_keys.get(pid, ()))
+
+    def touch(self, key: str) -> None:
+        """Record a cache hit on key (most recently used, one more use)."""
+        if key in self._data:
+            self._data.move_to_end(key)
+            self._hits[key] += 1
+
+    def resize(self, max_entries: int, max_bytes: int) -> None:
+        """Apply new limits, evicting entries that no longer fit."""
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def _discard(self, key: str) -> None:
+        """Drop an entry's data and size (its hit count and aliases are kept)."""
+        del self._data[key]
+        self._bytes -= self._sizes.pop(key)
+        self._expires.pop(key, None)
+
+    def _schedule_expiry(self, key: str, expires: float) -> None:
+        """Push an entry's expiry time, compacting the heap when it bloats."""
+        self._expires[key] = expires
+        heapq.heappush(self._expiry_heap, (expires, key))
+        if len(self._expiry_heap) > 2 * len(self._data) + EVICTION_SAMPLE:
+            self._expiry_heap = [(exp, k) for k, exp in self._expires.items()]
+            heapq.heapify(self._expiry_heap)
+
+    def _forget(self, key: str) -> None:
+        """Drop the hit count of a removed entry, and its pid's aliases if last."""
+        self._hits.pop(key, None)
+        pid = self._key_pids.pop(key)
+        keys = self._pid_keys[pid]
+        keys.discard(key)
+        if keys:
+            return
+        del self._pid_keys[pid]
+        for alias in self._pid_aliases.pop(pid, ()):
+            del self._aliases[alias]
+
+    def _evict(self, protect: str | None = None) -> None:
+        """Evict entries until the cache is back within its limits."""
+        while len(self._data) > self._max_entries or self._bytes > self._max_bytes:
+            candidates = list(
+                islice(
+                    (
+                        key
+                        for key in self._data
+                        if key != protect and key not in self._pinned
+                    ),
+                    EVICTION_SAMPLE,
+                )
+            )
+            if not candidates:
+                return
+            # min() keeps the first of equal counts: the least recently used.
+            victim = min(candidates, key=self._hits.__getitem__)
+            value = self._data[victim]
+            self._discard(victim)
+            self._forget(victim)
+            if self._on_evict is not None:
+                self._on_evict(victim, value)
@@ -0,0 +1,83 @@
+"""Read and write the species cache as a portable file.
+
+The file is JSON Lines: a header, one line per cached species (in the same
+form as the persisted cache) and a last line with the alias index. Lines are
+written and read one at a time, so neither side holds the encoded file in
+memory. Exports may be gzip-compressed; imports detect that by themselves.
+Both functions block: write_cache_file, and every step of the iterator
+read_cache_file returns, run in the executor.
+"""
+
+from __future__ import annotations
+
+import gzip
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any
+
+from homeassistant.util.json import json_loads
+
+from .const import DOMAIN
+from .plantbook_exception import OpenPlantbookException
+
+CACHE_FILE_FORMAT = f"{DOMAIN}.species_cache"
+CACHE_FILE_VERSION = 1
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open(path: Path, mode: str, compressed: bool) -> IO[bytes]:
+    """Open a cache file, through gzip if it is compressed."""
+    if compressed:
+        return gzip.open(path, mode, compresslevel=6)
+    return path.open(mode)
+
+
+def write_cache_file(
+    path: Path,
+    header: bytes,
+    species: Iterable[bytes],
+    aliases: bytes,
+    compress: bool,
+) -> None:
+    """Write the encoded header, species and alias lines to a cache file.
+
+    The file is written next to its target and renamed into place, so a
+    failed export never leaves a truncated file behind.
+    """
+    partial = path.with_name(f".{path.name}.partial")
+    try:
+        with _open(partial, "wb", compress) as fil:
+            for line in chain((header,), species, (aliases,)):
+                fil.write(line)
+                fil.write(b"\n")
+        partial.replace(path)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def read_cache_file(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield the species entries and the alias index line of a cache file.
+
+    The header is checked when the first line is requested. Every line must
+    be a JSON object.
+    """
+    with path.open("rb") as fil:
+        compressed = fil.read(2) == _GZIP_MAGIC
+    with _open(path, "rb", compressed) as fil:
+        header = json_loads(fil.readline() or b"null")
+        if (
+            not isinstance(header, dict)
+            or header.get("format") != CACHE_FILE_FORMAT
+            or header.get("version") != CACHE_FILE_VERSION
+        ):
+            raise OpenPlantbookException(f"{path} is not a species cache export")
+        for number, line in enumerate(fil, start=2):
+            if not line.strip():
+                continue
+            if not isinstance(value := json_loads(line), dict):
+                raise OpenPlantbookException(
+                    f"Line {number} of {path} is not a JSON object"
+                )
+            yield value
@@ -0,0 +1,141 @@
+"""Circuit breaker for the OpenPlantbook API requests of the integration.
+
+The CircuitBreaker stored at hass.data[DOMAIN][DATA_CIRCUIT] is shared by every
+API request (see retry.async_api_call). It is closed while the API answers.
+After CIRCUIT_FAILURE_THRESHOLD requests in a row fail to reach it, or after
+one authentication failure, it opens: requests fail at once with
+CircuitOpenError, and cached species are served even when expired. After
+CIRCUIT_RESET_TIMEOUT seconds it is half-open and lets one probe request
+through, which closes it again or reopens it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import aiohttp
+from openplantbook_sdk import MissingClientIdOrSecret
+
+from .const import CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT
+from .plantbook_exception import ApiUnavailableError, CircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Failures meaning the API could not be reached (the SDK returning None for
+# one), and those meaning it will refuse every request until the integration
+# is reconfigured
+_OUTAGE_ERRORS = (aiohttp.ClientError, TimeoutError, ApiUnavailableError)
+_AUTH_ERRORS = (PermissionError, MissingClientIdOrSecret)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker counting consecutive failed requests."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._opened = 0.0
+        self._probing = False
+        self.last_error: str | None = None
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Return the state, half-open once the open period is over."""
+        if self._state == STATE_OPEN and self._retry_in() <= 0:
+            self._state = STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Return whether requests are currently not expected to succeed."""
+        return self.state != STATE_CLOSED
+
+    @property
+    def admits_requests(self) -> bool:
+        """Return whether a request would run now rather than be rejected."""
+        state = self.state
+        return state == STATE_CLOSED or (state == STATE_HALF_OPEN and not self._probing)
+
+    @contextmanager
+    def request(self) -> Iterator[None]:
+        """Run an API request, or raise CircuitOpenError if it may not run."""
+        state = self.state
+        if state == STATE_OPEN or (state == STATE_HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpenError(max(self._retry_in(), 0))
+        probe = state == STATE_HALF_OPEN
+        self._probing = probe
+        try:
+            yield
+        except _AUTH_ERRORS as err:
+            self._trip(err)
+            raise
+        except _OUTAGE_ERRORS as err:
+            self._failures += 1
+            if probe or self._failures >= self._failure_threshold:
+                self._trip(err)
+            raise
+        except asyncio.CancelledError:
+            # Unknown outcome: the next request probes instead
+            if probe:
+                self._probing = False
+            raise
+        except Exception:
+            # Any other error (rate limit, validation) is an answer from the API
+            self._close()
+            raise
+        else:
+            self._close()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the state, for diagnostics."""
+        state = self.state
+        return {
+            "state": state,
+            "failures": self._failures,
+            "retry_in": round(self._retry_in(), 1) if state == STATE_OPEN else None,
+            "rejected": self.rejected,
+            "last_error": self.last_error,
+        }
+
+    def _retry_in(self) -> float:
+        """Return the seconds until the open breaker lets a probe through."""
+        return self._opened + self._reset_timeout - time.monotonic()
+
+    def _trip(self, err: BaseException) -> None:
+        """Open the breaker after a failure."""
+        if self._state != STATE_OPEN:
+            _LOGGER.warning(
+                "OpenPlantbook API unavailable (%s), pausing requests for %s seconds",
+                type(err).__name__,
+                self._reset_timeout,
+            )
+        self._state = STATE_OPEN
+        self._opened = time.monotonic()
+        self._probing = False
+        self.last_error = type(err).__name__
+
+    def _close(self) -> None:
+        """Close the breaker after an answer from the API."""
+        if self._state != STATE_CLOSED:
+            _LOGGER.info("OpenPlantbook API reachable again, resuming requests")
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._probing = False
@@ -0,0 +1,96 @@
+"""OpenPlantbook API client of the integration.
+
+openplantbook-sdk opens a new aiohttp session for every request, and turns
+connection errors, timeouts and error responses into a None result.
+PlantbookClient keeps the SDK's token handling and uploads, but sends the
+plant detail and search requests through Home Assistant's shared session, so
+they reuse its pooled keep-alive connections. They raise instead of returning
+None: aiohttp errors when the API cannot be reached or fails (5xx),
+RateLimitError for 429, PermissionError when the token is refused, and
+SpeciesNotFoundError when a detail request names an unknown pid.
+"""
+
+from __future__ import annotations
+
+from http import HTTPStatus
+from typing import Any
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from openplantbook_sdk import OpenPlantBookApi
+from openplantbook_sdk.sdk import RateLimitError
+
+from .const import PLANTBOOK_BASEURL
+from .plantbook_exception import OpenPlantbookException, SpeciesNotFoundError
+
+
+class PlantbookClient(OpenPlantBookApi):
+    """SDK client whose GET requests use Home Assistant's HTTP session."""
+
+    def __init__(
+        self, hass: HomeAssistant, client_id: str | None, secret: str | None
+    ) -> None:
+        """Initialize the client for these credentials."""
+        super().__init__(client_id, secret, base_url=PLANTBOOK_BASEURL)
+        self._hass = hass
+
+    async def async_plant_detail_get(
+        self,
+        pid: str,
+        lang: str | None = None,
+        params: dict[str, Any] | None = None,
+        request_kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return the details of a species, like the SDK method of that name."""
+        query = dict(params) if params else {}
+        if lang is not None:
+            query["lang"] = lang
+        try:
+            return await self._async_get(f"plant/detail/{pid}/", query, request_kwargs)
+        except aiohttp.ClientResponseError as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                raise SpeciesNotFoundError(pid) from err
+            raise
+
+    async def async_plant_search(
+        self,
+        search_text: str,
+        params: dict[str, Any] | None = None,
+        request_kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Return the species matching search_text, like the SDK method."""
+        query = {"alias": search_text, **(params or {})}
+        return await self._async_get("plant/search", query, request_kwargs)
+
+    async def _async_get(
+        self,
+        path: str,
+        params: dict[str, Any],
+        request_kwargs: dict[str, Any] | None,
+    ) -> Any:
+        """GET an API path with the client's token and return the JSON body."""
+        await self._async_get_token()
+        headers = {"Authorization": f"Bearer {self.token['access_token']}"}
+        session = async_get_clientsession(self._hass)
+        try:
+            async with session.get(
+                f"{PLANTBOOK_BASEURL}/{path}",
+                params=params or None,
+                headers=headers,
+                **(request_kwargs or {}),
+            ) as resp:
+                resp.raise_for_status()
+                return await resp.json()
+        except aiohttp.ClientResponseError as err:
+            if err.status == HTTPStatus.TOO_MANY_REQUESTS:
+                raise RateLimitError from err
+            if err.status in (HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN):
+                raise PermissionError(err.message) from err
+            if err.status == HTTPStatus.NOT_FOUND or err.status >= 500:
+                raise
+            # Any other answer means the request itself was wrong: retrying
+            # it would not help and the API is reachable.
+            raise OpenPlantbookException(
+                f"OpenPlantbook API rejected the request: {err.status} {err.message}"
+            ) from err
@@ -13,18 +13,38 @@ from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.helpers import config_validation as cv
 from openplantbook_sdk import MissingClientIdOrSecret
 
-from . import OpenPlantBookApi
+from .auth import async_get_client
 from .const import (
-    ATTR_API,
+    DEFAULT_API_MAX_CONCURRENT,
+    DEFAULT_API_RATE_LIMIT,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_MAX_SIZE,
     DEFAULT_IMAGE_PATH,
+    DEFAULT_NEGATIVE_CACHE_TTL,
+    DEFAULT_SEARCH_CACHE_TTL,
+    DEFAULT_SEARCH_DEBOUNCE,
+    DEFAULT_SEARCH_RESULT_MAX,
     DOMAIN,
+    FLOW_API_MAX_CONCURRENT,
+    FLOW_API_RATE_LIMIT,
+    FLOW_CACHE_MAX_ENTRIES,
+    FLOW_CACHE_MAX_SIZE,
     FLOW_DOWNLOAD_IMAGES,
     FLOW_DOWNLOAD_PATH,
+    FLOW_NEGATIVE_CACHE_TTL,
+    FLOW_SEARCH_CACHE_TTL,
+    FLOW_SEARCH_DEBOUNCE,
+    FLOW_SEARCH_POLICY,
+    FLOW_SEARCH_RESULT_MAX,
     FLOW_SEND_LANG,
+    FLOW_SERVE_STALE,
+    FLOW_STATS_ENTITY,
     FLOW_UPLOAD_DATA,
     FLOW_UPLOAD_HASS_LOCATION_COORD,
     FLOW_UPLOAD_HASS_LOCATION_COUNTRY,
-    PLANTBOOK_BASEURL,
+    FLOW_WARM_UP,
+    SEARCH_POLICIES,
+    SEARCH_POLICY_REMOTE,
 )
 
 TITLE = "title"
@@ -48,16 +68,11 @@ async def validate_input(hass: core.HomeAssistant, data: dict) -> dict[str, str]
     Data has the keys from DATA_SCHEMA with values provided by the user.
     """
 
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {}
-    # Check if values are not empty
+    # Check if values are not empty. The client (and the token it gets) is the
+    # one the config entry uses once it is set up.
     try:
-        hass.data[DOMAIN][ATTR_API] = OpenPlantBookApi(
-            data[CONF_CLIENT_ID],
-            data[CONF_CLIENT_SECRET],
-            base_url=PLANTBOOK_BASEURL,
-        )
-        await hass.data[DOMAIN][ATTR_API]._async_get_token()
+        client = async_get_client(hass, data[CONF_CLIENT_ID], data[CONF_CLIENT_SECRET])
+        await client._async_get_token()
         # TODO 4: Error messages for "unable to connect" and "creds are not valid" not working well.
     except PermissionError as ex:
         raise ValueError from ex
@@ -172,6 +187,37 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         )
         # Language option
         use_lang = self.config_entry.options.get(FLOW_SEND_LANG, True)
+        # Species cache limits
+        cache_max_entries = self.config_entry.options.get(
+            FLOW_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES
+        )
+        cache_max_size = self.config_entry.options.get(
+            FLOW_CACHE_MAX_SIZE, DEFAULT_CACHE_MAX_SIZE
+        )
+        serve_stale = self.config_entry.options.get(FLOW_SERVE_STALE, False)
+        negative_cache_ttl = self.config_entry.options.get(
+            FLOW_NEGATIVE_CACHE_TTL, DEFAULT_NEGATIVE_CACHE_TTL
+        )
+        warm_up = self.config_entry.options.get(FLOW_WARM_UP, False)
+        stats_entity = self.config_entry.options.get(FLOW_STATS_ENTITY, False)
+        search_policy = self.config_entry.options.get(
+            FLOW_SEARCH_POLICY, SEARCH_POLICY_REMOTE
+        )
+        search_cache_ttl = self.config_entry.options.get(
+            FLOW_SEARCH_CACHE_TTL, DEFAULT_SEARCH_CACHE_TTL
+        )
+        search_debounce = self.config_entry.options.get(
+            FLOW_SEARCH_DEBOUNCE, DEFAULT_SEARCH_DEBOUNCE
+        )
+        search_result_max = self.config_entry.options.get(
+            FLOW_SEARCH_RESULT_MAX, DEFAULT_SEARCH_RESULT_MAX
+        )
+        api_rate_limit = self.config_entry.options.get(
+            FLOW_API_RATE_LIMIT, DEFAULT_API_RATE_LIMIT
+        )
+        api_max_concurrent = self.config_entry.options.get(
+            FLOW_API_MAX_CONCURRENT, DEFAULT_API_MAX_CONCURRENT
+        )
 
         if user_input is not None:
             _LOGGER.debug("User: %s", user_input)
@@ -184,6 +230,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             location_country = user_input.get(FLOW_UPLOAD_HASS_LOCATION_COUNTRY)
             location_coordinates = user_input.get(FLOW_UPLOAD_HASS_LOCATION_COORD)
             use_lang = user_input.get(FLOW_SEND_LANG)
+            cache_max_entries = user_input.get(FLOW_CACHE_MAX_ENTRIES)
+            cache_max_size = user_input.get(FLOW_CACHE_MAX_SIZE)
+            serve_stale = user_input.get(FLOW_SERVE_STALE)
+            negative_cache_ttl = user_input.get(FLOW_NEGATIVE_CACHE_TTL)
+            warm_up = user_input.get(FLOW_WARM_UP)
+            stats_entity = user_input.get(FLOW_STATS_ENTITY)
+            search_policy = user_input.get(FLOW_SEARCH_POLICY)
+            search_cache_ttl = user_input.get(FLOW_SEARCH_CACHE_TTL)
+            search_debounce = user_input.get(FLOW_SEARCH_DEBOUNCE)
+            search_result_max = user_input.get(FLOW_SEARCH_RESULT_MAX)
+            api_rate_limit = user_input.get(FLOW_API_RATE_LIMIT)
+            api_max_concurrent = user_input.get(FLOW_API_MAX_CONCURRENT)
 
         _LOGGER.debug(
             "Init: %s, %s", self.config_entry.entry_id, self.config_entry.options
@@ -200,6 +258,34 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             vol.Optional(FLOW_SEND_LANG, default=use_lang): cv.boolean,
             vol.Optional(FLOW_DOWNLOAD_IMAGES, default=download_images): cv.boolean,
             vol.Optional(FLOW_DOWNLOAD_PATH, default=download_path): cv.string,
+            vol.Optional(FLOW_CACHE_MAX_ENTRIES, default=cache_max_entries): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(FLOW_CACHE_MAX_SIZE, default=cache_max_size): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(FLOW_SERVE_STALE, default=serve_stale): cv.boolean,
+            vol.Optional(
+                FLOW_NEGATIVE_CACHE_TTL, default=negative_cache_ttl
+            ): cv.positive_int,
+            vol.Optional(FLOW_WARM_UP, default=warm_up): cv.boolean,
+            vol.Optional(FLOW_STATS_ENTITY, default=stats_entity): cv.boolean,
+            vol.Optional(FLOW_SEARCH_POLICY, default=search_policy): vol.In(
+                SEARCH_POLICIES
+            ),
+            vol.Optional(
+                FLOW_SEARCH_CACHE_TTL, default=search_cache_ttl
+            ): cv.positive_int,
+            vol.Optional(
+                FLOW_SEARCH_DEBOUNCE, default=search_debounce
+            ): cv.positive_int,
+            vol.Optional(
+                FLOW_SEARCH_RESULT_MAX, default=search_result_max
+            ): cv.positive_int,
+            vol.Optional(FLOW_API_RATE_LIMIT, default=api_rate_limit): cv.positive_int,
+            vol.Optional(FLOW_API_MAX_CONCURRENT, default=api_max_concurrent): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
         }
 
         return self.async_show_form(
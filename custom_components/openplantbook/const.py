@@ -11,24 +11,82 @@ ATTR_API = "api"
 DATA_COMPONENT = "component"
 DATA_SEARCH_ENTITY = "search_entity"
 DATA_SPECIES_ENTITIES = "species_entities"
+DATA_STORE = "store"
+DATA_IN_FLIGHT = "in_flight"
+DATA_ALIASES = "aliases"
+DATA_EXPIRY_TIMER = "expiry_timer"
+DATA_MISSES = "misses"
+DATA_STATS = "stats"
+DATA_STATS_ENTITY = "stats_entity"
+DATA_LANGUAGE = "language"
+DATA_SPECIES_DB = "species_db"
+DATA_SEARCH_CACHE = "search_cache"
+DATA_SEARCH_IN_FLIGHT = "search_in_flight"
+DATA_SEARCH_BURST = "search_burst"
+DATA_SEARCH_BURST_CALL = "search_burst_call"
+DATA_SCHEDULER = "scheduler"
+DATA_CIRCUIT = "circuit"
+DATA_TOKEN = "token"
 ATTR_HOURS = "hours"
 ATTR_INCLUDE = "include"
 ATTR_IMAGE = "image_url"
+ATTR_TIMEOUT = "timeout"
+ATTR_ERROR = "error"
+ATTR_LANG = "lang"
+ATTR_PATH = "path"
+ATTR_COMPRESS = "compress"
+ATTR_LIMIT = "limit"
+ATTR_OFFSET = "offset"
 CACHE_TIME = 24
+# Species a get_many call fetches from the API at the same time
+GET_MANY_CONCURRENCY = 4
+# Consecutive failed API requests (connection errors, timeouts) that open the
+# circuit breaker, and seconds it stays open before a probe request is let in.
+# An authentication failure opens it at once.
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60
+
+# The species cache is persisted to .storage/ so a restart does not refetch
+# every plant. Writes are debounced: a burst of `get` calls costs one write.
+STORAGE_KEY = f"{DOMAIN}.species_cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30
+# Local full-text index of the species seen, in .storage/ next to the cache
+SPECIES_DB_FILE = f"{DOMAIN}.species.db"
+# The API token is persisted (readable by Home Assistant only) and renewed in
+# the background this many seconds before it expires, or retried after
+# TOKEN_RETRY_DELAY seconds when renewing fails.
+TOKEN_STORAGE_KEY = f"{DOMAIN}.token"
+TOKEN_STORAGE_VERSION = 1
+TOKEN_REFRESH_MARGIN = 600
+TOKEN_RETRY_DELAY = 300
 
 OPB_ATTR_SEARCH = "search"
 OPB_ATTR_SEARCH_RESULT = "search_result"
+OPB_ATTR_CACHE_STATISTICS = "cache_statistics"
 OPB_ATTR_RESULT = "result"
 OPB_ATTR_RESULTS = "results"
 OPB_ATTR_TIMESTAMP = "timestamp"
 # Internal marker stored on a cached plant_data dict: the list of extra
 # `include` categories that the cached entry already satisfies (e.g. ["care"]).
 OPB_ATTR_INCLUDES = "_fetched_includes"
+# Internal marker next to it: when each of those categories was fetched, as
+# {category: ISO timestamp}.
+OPB_ATTR_INCLUDES_AT = "_fetched_includes_at"
+# Internal marker stored on a cached plant_data dict: the language it was
+# fetched in (None if no language was sent).
+OPB_ATTR_LANG = "_lang"
+
+# Fired when a refetched species differs from the cached one
+EVENT_SPECIES_CHANGED = f"{DOMAIN}_species_changed"
 
 OPB_SERVICE_SEARCH = "search"
 OPB_SERVICE_GET = "get"
+OPB_SERVICE_GET_MANY = "get_many"
 OPB_SERVICE_UPLOAD = "upload"
 OPB_SERVICE_CLEAN_CACHE = "clean_cache"
+OPB_SERVICE_EXPORT_CACHE = "export_cache"
+OPB_SERVICE_IMPORT_CACHE = "import_cache"
 
 OPB_PID = "pid"
 OPB_DISPLAY_PID = "display_pid"
@@ -38,9 +96,58 @@ OPB_MAX_LIGHT_LUX = "max_light_lux"
 OPB_MAX_DLI = "max_dli"
 OPB_MIN_DLI = "min_dli"
 
+FLOW_CACHE_MAX_ENTRIES = "cache_max_entries"
+FLOW_CACHE_MAX_SIZE = "cache_max_size_mb"
+DEFAULT_CACHE_MAX_ENTRIES = 1000
+DEFAULT_CACHE_MAX_SIZE = 10
+# Return expired cache entries immediately and refresh them in the background
+FLOW_SERVE_STALE = "serve_stale"
+# Minutes an unknown species is answered locally as not found (0 disables)
+FLOW_NEGATIVE_CACHE_TTL = "negative_cache_minutes"
+DEFAULT_NEGATIVE_CACHE_TTL = 10
+# Minutes the results of a search are reused for the same alias (0 disables)
+FLOW_SEARCH_CACHE_TTL = "search_cache_minutes"
+DEFAULT_SEARCH_CACHE_TTL = 10
+# Most searches whose results are kept
+SEARCH_CACHE_MAX_ENTRIES = 100
+# Lines of a cache file read from disk at a time by the import
+CACHE_FILE_IMPORT_BATCH = 500
+# Milliseconds a search waits for a newer one for the same alias before
+# running (0 disables); a burst of repeated searches runs only the last one
+FLOW_SEARCH_DEBOUNCE = "search_debounce_ms"
+DEFAULT_SEARCH_DEBOUNCE = 0
+# Most results shown by openplantbook.search_result (0 shows all); the service
+# response still has every result asked for
+FLOW_SEARCH_RESULT_MAX = "search_result_max_entries"
+DEFAULT_SEARCH_RESULT_MAX = 100
+# Prefetch the species of all plant entities after Home Assistant has started
+FLOW_WARM_UP = "warm_up_cache"
+# Publish the species cache statistics as openplantbook.cache_statistics
+FLOW_STATS_ENTITY = "cache_statistics_entity"
+# Where `search` looks: the API only, the local species database first, or
+# the local database only. Any policy but remote enables the database.
+FLOW_SEARCH_POLICY = "search_policy"
+SEARCH_POLICY_REMOTE = "remote"
+SEARCH_POLICY_LOCAL_FIRST = "local_then_remote"
+SEARCH_POLICY_LOCAL = "local_only"
+SEARCH_POLICIES = [SEARCH_POLICY_REMOTE, SEARCH_POLICY_LOCAL_FIRST, SEARCH_POLICY_LOCAL]
+
+# API requests admitted per minute (0 disables) and running at the same time;
+# requests over the budget wait, interactive lookups first
+FLOW_API_RATE_LIMIT = "api_requests_per_minute"
+DEFAULT_API_RATE_LIMIT = 60
+FLOW_API_MAX_CONCURRENT = "api_max_concurrent_requests"
+DEFAULT_API_MAX_CONCURRENT = 4
+
 FLOW_DOWNLOAD_IMAGES = "download_images"
 FLOW_DOWNLOAD_PATH = "download_path"
 DEFAULT_IMAGE_PATH = "/config/www/images/plants/"
+# Downloaded images are streamed to disk in chunks of this many bytes, and
+# abandoned when larger than IMAGE_MAX_SIZE bytes or slower than
+# IMAGE_DOWNLOAD_TIMEOUT seconds.
+IMAGE_CHUNK_SIZE = 64 * 1024
+IMAGE_MAX_SIZE = 10 * 1024 * 1024
+IMAGE_DOWNLOAD_TIMEOUT = 60
 
 OPB_MEASUREMENTS_TO_UPLOAD = [
     "moisture",
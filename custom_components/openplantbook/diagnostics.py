@@ -0,0 +1,50 @@
+"""Diagnostics support for the OpenPlantbook integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ATTR_SPECIES,
+    DATA_CIRCUIT,
+    DATA_IN_FLIGHT,
+    DATA_MISSES,
+    DATA_SCHEDULER,
+    DATA_STATS,
+    DATA_TOKEN,
+    DOMAIN,
+)
+
+TO_REDACT = {CONF_CLIENT_ID, CONF_CLIENT_SECRET, "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return the entry options, cache statistics and API client state."""
+    domain_data = hass.data.get(DOMAIN, {})
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+    }
+    if (cache := domain_data.get(ATTR_SPECIES)) is not None:
+        diagnostics["cache"] = {
+            "entries": len(cache),
+            "size_bytes": cache.size_bytes,
+            "aliases": len(cache.aliases),
+            "in_flight": len(domain_data.get(DATA_IN_FLIGHT, {})),
+            "not_found": len(domain_data.get(DATA_MISSES, {})),
+        }
+    if (stats := domain_data.get(DATA_STATS)) is not None:
+        diagnostics["statistics"] = stats.as_dict()
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is not None:
+        diagnostics["scheduler"] = scheduler.as_dict()
+    if (breaker := domain_data.get(DATA_CIRCUIT)) is not None:
+        diagnostics["circuit"] = breaker.as_dict()
+    if (token_manager := domain_data.get(DATA_TOKEN)) is not None:
+        diagnostics["token"] = token_manager.as_dict()
+    return diagnostics
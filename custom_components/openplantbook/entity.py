@@ -8,13 +8,26 @@ entity_ids and attributes as before while gaining unique_ids.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_track_time_interval
 
-from .const import DOMAIN, OPB_ATTR_SEARCH_RESULT, OPB_DISPLAY_PID, OPB_PID
+from .cache import CacheStats, SpeciesRecord
+from .const import (
+    DOMAIN,
+    OPB_ATTR_CACHE_STATISTICS,
+    OPB_ATTR_SEARCH_RESULT,
+    OPB_DISPLAY_PID,
+)
+
+# How often the cache statistics entity writes its state
+STATS_UPDATE_INTERVAL = timedelta(minutes=1)
 
 
 class OpenPlantbookSearchResult(Entity):
@@ -64,9 +77,10 @@ class OpenPlantbookSearchResult(Entity):
 class OpenPlantbookSpecies(Entity):
     """Per-species entity mirroring one cached OpenPlantbook detail result.
 
-    State = display_pid; attributes = the full plant_data dict. Replaces the
-    legacy `openplantbook.<pid>` pseudo-state. Created on fetch, removed when
-    the cache entry expires.
+    State = display_pid; attributes = the cached species record, read as a
+    mapping when the state is written. Replaces the legacy
+    `openplantbook.<pid>` pseudo-state. Created on fetch, removed when the
+    cache entry expires.
     """
 
     _attr_should_poll = False
@@ -74,28 +88,81 @@ class OpenPlantbookSpecies(Entity):
     _attr_has_entity_name = False
 
     def __init__(
-        self, entry: ConfigEntry, entity_id: str, plant_data: dict[str, Any]
+        self, entry: ConfigEntry, entity_id: str, plant_data: SpeciesRecord
     ) -> None:
         """Initialize a species entity with its first fetched data."""
         self.entity_id = entity_id
         # See OpenPlantbookSearchResult: prefer the stable client_id prefix.
-        self._attr_unique_id = (
-            f"{entry.unique_id or entry.entry_id}_{plant_data[OPB_PID]}"
-        )
-        self._plant_data: dict[str, Any] = plant_data
+        self._attr_unique_id = f"{entry.unique_id or entry.entry_id}_{plant_data.pid}"
+        self._plant_data = plant_data
 
     @property
     def state(self) -> str | None:
         """Return the display_pid as the entity state."""
-        return self._plant_data.get(OPB_DISPLAY_PID)
+        return self._plant_data.data.get(OPB_DISPLAY_PID)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the full plant_data dict as attributes."""
+    def extra_state_attributes(self) -> Mapping[str, Any]:
+        """Return the full plant_data, with its bookkeeping, as attributes."""
         return self._plant_data
 
     @callback
-    def async_update_data(self, plant_data: dict[str, Any]) -> None:
-        """Refresh the cached plant_data and write the new state."""
+    def async_update_data(
+        self, plant_data: SpeciesRecord, changed: bool = True
+    ) -> None:
+        """Refresh the cached plant_data, writing the state if it changed.
+
+        An unchanged refetch only renews bookkeeping fields such as the
+        timestamp, which are not worth a state write (and recorder row).
+        """
         self._plant_data = plant_data
+        if changed:
+            self.async_write_ha_state()
+
+
+class OpenPlantbookCacheStatistics(Entity):
+    """Optional entity publishing the species cache statistics.
+
+    State = percentage of lookups answered from the cache; attributes = the
+    counters. Written every STATS_UPDATE_INTERVAL rather than on each lookup,
+    so a burst of lookups does not write a state for each one.
+    """
+
+    _attr_should_poll = False
+    _attr_name = None
+    _attr_has_entity_name = False
+    _attr_unit_of_measurement = PERCENTAGE
+
+    def __init__(self, entry: ConfigEntry, stats: CacheStats) -> None:
+        """Initialize the statistics entity for the shared counters."""
+        self.entity_id = f"{DOMAIN}.{OPB_ATTR_CACHE_STATISTICS}"
+        # See OpenPlantbookSearchResult: prefer the stable client_id prefix.
+        self._attr_unique_id = (
+            f"{entry.unique_id or entry.entry_id}_{OPB_ATTR_CACHE_STATISTICS}"
+        )
+        self._stats = stats
+
+    async def async_added_to_hass(self) -> None:
+        """Start writing the statistics periodically."""
+        self.async_on_remove(
+            async_track_time_interval(
+                self.hass,
+                self._async_write_statistics,
+                STATS_UPDATE_INTERVAL,
+                cancel_on_shutdown=True,
+            )
+        )
+
+    @callback
+    def _async_write_statistics(self, _now: datetime) -> None:
         self.async_write_ha_state()
+
+    @property
+    def state(self) -> float | None:
+        """Return the cache hit ratio in percent."""
+        return self._stats.hit_ratio
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the statistics counters."""
+        return self._stats.as_dict()
@@ -3,3 +3,33 @@
 
 class OpenPlantbookException(Exception):
     """Exception raised when OpenPlantbook operations fail."""
+
+
+class CircuitOpenError(OpenPlantbookException):
+    """Exception raised instead of an API request while the circuit is open."""
+
+    def __init__(self, retry_in: float) -> None:
+        """Initialize with the seconds until a request is tried again."""
+        super().__init__(f"OpenPlantbook API unavailable, retrying in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class SpeciesNotFoundError(OpenPlantbookException):
+    """Exception raised when the API does not know the requested pid."""
+
+    def __init__(self, pid: str) -> None:
+        """Initialize with the pid the API did not know."""
+        super().__init__(f"OpenPlantbook does not know {pid}")
+        self.pid = pid
+
+
+class ApiUnavailableError(OpenPlantbookException):
+    """Exception raised when an SDK request returned None instead of an answer.
+
+    openplantbook-sdk returns None when it could not reach the API or the API
+    failed, so such a result is treated as a failed request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with a message for the service caller."""
+        super().__init__("OpenPlantbook API unavailable. Please try again later.")
@@ -0,0 +1,151 @@
+"""Retry transient OpenPlantbook API failures.
+
+Each attempt waits for its own scheduler slot (see scheduler.py) and runs
+under a timeout. Failed attempts are retried after a jittered exponential
+backoff, or after the delay a 429 response asked for in Retry-After, as long
+as the retry starts before the total deadline.
+
+openplantbook-sdk returns None instead of raising when a request fails, so
+a None result counts as a failed attempt and raises ApiUnavailableError.
+
+Rate-limited requests are only retried at interactive priority: background
+work (uploads, warm-up, refreshes) gives the budget back instead. Requests that
+are not idempotent (uploads) are not retried after a timeout, or after a None
+result which may have been one, as the server may have processed them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import aiohttp
+from homeassistant.core import HomeAssistant
+from openplantbook_sdk.sdk import RateLimitError
+
+from .const import DATA_CIRCUIT, DATA_STATS, DOMAIN
+from .plantbook_exception import ApiUnavailableError
+from .scheduler import PRIORITY_INTERACTIVE, async_api_slot, current_priority
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """How often and how long an API request is tried."""
+
+    attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    # Seconds one attempt may take, and within which every retry must start
+    attempt_timeout: float = 20.0
+    deadline: float = 60.0
+
+    @property
+    def budget(self) -> float:
+        """Return the longest a request may take: a retry started at the deadline."""
+        return self.deadline + self.attempt_timeout
+
+    def backoff(self, retry: int) -> float:
+        """Return the jittered delay before the given retry (0 is the first)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**retry))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def default_wait_timeout() -> float:
+    """Return how long a caller waits by default for a request in flight.
+
+    It is the budget of the default retry policy, so a waiter does not give
+    up on a request that is still retrying within its deadline.
+    """
+    return DEFAULT_RETRY_POLICY.budget
+
+
+def retry_after(err: BaseException) -> float | None:
+    """Return the seconds a rate-limit response asked to wait, if it said."""
+    headers = getattr(err.__cause__, "headers", None)
+    if not headers or (value := headers.get("Retry-After")) is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+async def async_api_call[T](
+    hass: HomeAssistant,
+    request: Callable[[], Awaitable[T | None]],
+    priority: int | None = None,
+    *,
+    idempotent: bool = True,
+    policy: RetryPolicy | None = None,
+) -> T:
+    """Run an API request, retrying transient failures.
+
+    The last failure is raised once the attempts or the deadline run out. The
+    request as a whole counts as one success or failure for the circuit
+    breaker, and fails with CircuitOpenError without running while it is open.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    if priority is None:
+        priority = current_priority()
+    retryable: tuple[type[BaseException], ...] = (aiohttp.ClientError,)
+    if idempotent:
+        retryable += (TimeoutError, ApiUnavailableError)
+    if priority == PRIORITY_INTERACTIVE:
+        retryable += (RateLimitError,)
+    breaker = hass.data.get(DOMAIN, {}).get(DATA_CIRCUIT)
+    with breaker.request() if breaker is not None else contextlib.nullcontext():
+        return await _async_with_retries(hass, request, priority, retryable, policy)
+
+
+async def _async_with_retries[T](
+    hass: HomeAssistant,
+    request: Callable[[], Awaitable[T | None]],
+    priority: int,
+    retryable: tuple[type[BaseException], ...],
+    policy: RetryPolicy,
+) -> T:
+    """Run the attempts of a request until one succeeds or retries run out."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + policy.deadline
+    retry = 0
+    while True:
+        try:
+            async with async_api_slot(hass, priority):
+                async with asyncio.timeout(policy.attempt_timeout):
+                    result = await request()
+            if result is None:
+                raise ApiUnavailableError
+        except retryable as err:
+            if retry + 1 >= policy.attempts:
+                raise
+            delay = retry_after(err)
+            if delay is None:
+                delay = policy.backoff(retry)
+            if loop.time() + delay > deadline:
+                raise
+            _LOGGER.debug(
+                "OpenPlantbook request failed (%s), retrying in %.1f s",
+                type(err).__name__,
+                delay,
+            )
+            if (stats := hass.data.get(DOMAIN, {}).get(DATA_STATS)) is not None:
+                stats.api_retries += 1
+            retry += 1
+            await asyncio.sleep(delay)
+        else:
+            return result
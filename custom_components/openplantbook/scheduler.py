@@ -0,0 +1,177 @@
+"""Admission control for the OpenPlantbook API requests of the integration.
+
+Every API request waits for a slot from the ApiScheduler stored at
+hass.data[DOMAIN][DATA_SCHEDULER]. A slot is given while fewer than
+max_concurrent requests are running and the token bucket (rate requests per
+RATE_WINDOW, refilled continuously) has a token left. Waiting requests are
+queued, never failed, and admitted by priority: interactive `get`/`search`
+lookups before uploads, prefetching and background refreshes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_SCHEDULER, DOMAIN
+
+# Seconds over which the requests-per-window budget applies
+RATE_WINDOW = 60
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+_background: ContextVar[bool] = ContextVar(f"{DOMAIN}_background", default=False)
+
+
+@contextmanager
+def background_requests() -> Iterator[None]:
+    """Make the API requests started in this context background priority."""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def current_priority() -> int:
+    """Return the priority of an API request started in this context."""
+    return PRIORITY_BACKGROUND if _background.get() else PRIORITY_INTERACTIVE
+
+
+class ApiScheduler:
+    """Token bucket and concurrency limit with a priority queue of waiters."""
+
+    def __init__(self, rate: int, max_concurrent: int) -> None:
+        """Initialize the scheduler; a rate of 0 leaves requests unlimited."""
+        self._rate = rate
+        self._max_concurrent = max_concurrent
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._running = 0
+        # (priority, arrival, future): lowest priority value first, then FIFO
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._arrivals = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self.delayed = 0
+
+    def configure(self, rate: int, max_concurrent: int) -> None:
+        """Apply new limits; queued requests are admitted if they now fit."""
+        self._refill()
+        self._rate = rate
+        self._max_concurrent = max_concurrent
+        self._tokens = min(self._tokens, float(rate))
+        self._dispatch()
+
+    @asynccontextmanager
+    async def async_slot(self, priority: int) -> AsyncIterator[None]:
+        """Wait until a request of this priority may run, and run it."""
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._dispatch()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the limits and current load, for diagnostics."""
+        self._refill()
+        return {
+            "rate": self._rate,
+            "window_seconds": RATE_WINDOW,
+            "max_concurrent": self._max_concurrent,
+            "running": self._running,
+            "queued": sum(not waiter[2].done() for waiter in self._waiters),
+            "tokens": round(self._tokens, 2) if self._rate else None,
+            "delayed": self.delayed,
+        }
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Take a slot, queueing behind waiters of the same or higher priority."""
+        if not self._waiters and self._try_admit():
+            return
+        self.delayed += 1
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._arrivals), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the caller gave up: pass the slot on.
+                self._running -= 1
+                self._dispatch()
+            raise
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        if self._rate:
+            earned = (now - self._updated) * self._rate / RATE_WINDOW
+            self._tokens = min(float(self._rate), self._tokens + earned)
+        self._updated = now
+
+    def _try_admit(self) -> bool:
+        """Take a slot and a token if both are available."""
+        if self._running >= self._max_concurrent:
+            return False
+        if self._rate:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        self._running += 1
+        return True
+
+    def _dispatch(self) -> None:
+        """Admit queued requests in order while slots and tokens allow."""
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                # Cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if not self._try_admit():
+                break
+            heapq.heappop(self._waiters)
+            future.set_result(None)
+        if (
+            self._waiters
+            and self._rate
+            and self._timer is None
+            and self._running < self._max_concurrent
+        ):
+            # Out of tokens: dispatch again once the next one is earned.
+            delay = (1 - self._tokens) * RATE_WINDOW / self._rate
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        """Dispatch the waiters a newly earned token may admit."""
+        self._timer = None
+        self._dispatch()
+
+
+@asynccontextmanager
+async def async_api_slot(
+    hass: HomeAssistant, priority: int | None = None
+) -> AsyncIterator[None]:
+    """Wait until the scheduler admits an API request, and run it.
+
+    The priority defaults to that of the current context (see
+    background_requests).
+    """
+    if (scheduler := hass.data.get(DOMAIN, {}).get(DATA_SCHEDULER)) is None:
+        yield
+        return
+    async with scheduler.async_slot(
+        current_priority() if priority is None else priority
+    ):
+        yield
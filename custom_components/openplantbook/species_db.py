@@ -0,0 +1,119 @@
+"""Local SQLite database of the species seen from OpenPlantbook.
+
+Every species detail and search result received is indexed by pid,
+display_pid and known aliases in an FTS5 table, so `search` can be answered
+locally (see FLOW_SEARCH_POLICY). All methods block and run in the executor;
+a lock serializes them on the single connection.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+# Most species a local search returns
+MAX_RESULTS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS species (
+    id INTEGER PRIMARY KEY,
+    pid TEXT NOT NULL UNIQUE,
+    display_pid TEXT NOT NULL,
+    aliases TEXT NOT NULL DEFAULT ''
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS species_fts USING fts5(
+    pid, display_pid, aliases,
+    content='species', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS species_ai AFTER INSERT ON species BEGIN
+    INSERT INTO species_fts(rowid, pid, display_pid, aliases)
+    VALUES (new.id, new.pid, new.display_pid, new.aliases);
+END;
+CREATE TRIGGER IF NOT EXISTS species_ad AFTER DELETE ON species BEGIN
+    INSERT INTO species_fts(species_fts, rowid, pid, display_pid, aliases)
+    VALUES ('delete', old.id, old.pid, old.display_pid, old.aliases);
+END;
+CREATE TRIGGER IF NOT EXISTS species_au AFTER UPDATE ON species BEGIN
+    INSERT INTO species_fts(species_fts, rowid, pid, display_pid, aliases)
+    VALUES ('delete', old.id, old.pid, old.display_pid, old.aliases);
+    INSERT INTO species_fts(rowid, pid, display_pid, aliases)
+    VALUES (new.id, new.pid, new.display_pid, new.aliases);
+END;
+"""
+
+
+def _match_query(text: str) -> str:
+    """Return an FTS5 query matching every word of text as a prefix."""
+    words = text.replace('"', " ").split()
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class SpeciesDatabase:
+    """Full-text index of species by pid, display_pid and aliases."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the database stored at path (opened by `open`)."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        """Open (creating if needed) the database file."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self._path, check_same_thread=False)
+        try:
+            conn.executescript(_SCHEMA)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self._conn = conn
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add_species(self, species: Iterable[tuple[str, str, Iterable[str]]]) -> None:
+        """Index (pid, display_pid, aliases) rows; known aliases are kept."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._add_species(species)
+
+    def _add_species(self, species: Iterable[tuple[str, str, Iterable[str]]]) -> None:
+        """Upsert rows, merging their aliases with those already indexed."""
+        for pid, display_pid, aliases in species:
+            row = self._conn.execute(
+                "SELECT aliases FROM species WHERE pid = ?", (pid,)
+            ).fetchone()
+            known = set(row[0].split("\n")) if row and row[0] else set()
+            merged = "\n".join(sorted(known.union(aliases) - {pid, display_pid}))
+            self._conn.execute(
+                "INSERT INTO species (pid, display_pid, aliases) VALUES (?, ?, ?)"
+                " ON CONFLICT (pid) DO UPDATE SET"
+                " display_pid = excluded.display_pid, aliases = excluded.aliases"
+                " WHERE display_pid != excluded.display_pid"
+                " OR aliases != excluded.aliases",
+                (pid, display_pid, merged),
+            )
+
+    def search(self, text: str, limit: int = MAX_RESULTS) -> dict[str, str]:
+        """Return {pid: display_pid} of the best matches for text."""
+        if not (query := _match_query(text)):
+            return {}
+        with self._lock:
+            if self._conn is None:
+                return {}
+            rows = self._conn.execute(
+                "SELECT species.pid, species.display_pid FROM species_fts"
+                " JOIN species ON species.id = species_fts.rowid"
+                " WHERE species_fts MATCH ? ORDER BY rank LIMIT ?",
+                (query, limit),
+            ).fetchall()
+        return dict(rows)
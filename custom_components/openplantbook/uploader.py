@@ -1,6 +1,7 @@
 import logging
 import random
 from datetime import datetime, timedelta
+from functools import partial
 from typing import Any
 
 import homeassistant.util.dt as dt_util
@@ -35,7 +36,13 @@ from .const import (
     FLOW_UPLOAD_HASS_LOCATION_COUNTRY,
     OPB_MEASUREMENTS_TO_UPLOAD,
 )
-from .plantbook_exception import OpenPlantbookException
+from .plantbook_exception import (
+    ApiUnavailableError,
+    CircuitOpenError,
+    OpenPlantbookException,
+)
+from .retry import async_api_call
+from .scheduler import PRIORITY_BACKGROUND
 
 UPLOAD_TIME_INTERVAL = timedelta(days=1)
 UPLOAD_WAIT_AFTER_RESTART = timedelta(hours=4)
@@ -216,11 +223,16 @@ async def plant_data_upload(
         res = None
         caught_exception = None
         try:
-            res = await hass.data[DOMAIN][ATTR_API].async_plant_instance_register(
-                sensor_pid_map=reg_map,
-                location_country=location.get("country"),
-                location_lon=location.get("lon"),
-                location_lat=location.get("lat"),
+            res = await async_api_call(
+                hass,
+                partial(
+                    hass.data[DOMAIN][ATTR_API].async_plant_instance_register,
+                    sensor_pid_map=reg_map,
+                    location_country=location.get("country"),
+                    location_lon=location.get("lon"),
+                    location_lat=location.get("lat"),
+                ),
+                PRIORITY_BACKGROUND,
             )
 
         # OPB ValidationFailure
@@ -232,8 +244,13 @@ async def plant_data_upload(
                 # workaround for case when HASS original_species is set to DISPLAY_PID rather than PID attempt to find
                 # the plant using PID as DISPLAY_PID and if found only 1 plant and DISPLAY_PID match they retry
                 try:
-                    search_res = await hass.data[DOMAIN][ATTR_API].async_plant_search(
-                        search_text=opb_pid
+                    search_res = await async_api_call(
+                        hass,
+                        partial(
+                            hass.data[DOMAIN][ATTR_API].async_plant_search,
+                            search_text=opb_pid,
+                        ),
+                        PRIORITY_BACKGROUND,
                     )
 
                     if search_res["count"] == 1:  # noqa: SIM102 - clearer as nested
@@ -242,13 +259,18 @@ async def plant_data_upload(
                             opb_pid = search_res["results"][0]["pid"]
                             reg_map[plant_instance_id] = opb_pid
 
-                            res = await hass.data[DOMAIN][
-                                ATTR_API
-                            ].async_plant_instance_register(
-                                sensor_pid_map=reg_map,
-                                location_country=location.get("country"),
-                                location_lon=location.get("lon"),
-                                location_lat=location.get("lat"),
+                            res = await async_api_call(
+                                hass,
+                                partial(
+                                    hass.data[DOMAIN][
+                                        ATTR_API
+                                    ].async_plant_instance_register,
+                                    sensor_pid_map=reg_map,
+                                    location_country=location.get("country"),
+                                    location_lon=location.get("lon"),
+                                    location_lat=location.get("lat"),
+                                ),
+                                PRIORITY_BACKGROUND,
                             )
 
                             _LOGGER.debug(
@@ -260,7 +282,7 @@ async def plant_data_upload(
                             )
                             caught_exception = None
 
-                except RateLimitError:
+                except (RateLimitError, CircuitOpenError):
                     raise
                 except Exception as ex_in:
                     _LOGGER.debug(
@@ -269,7 +291,7 @@ async def plant_data_upload(
                         ex_in,
                     )
 
-        except RateLimitError:
+        except (RateLimitError, CircuitOpenError):
             raise
         except Exception as ex:
             caught_exception = ex
@@ -282,13 +304,6 @@ async def plant_data_upload(
             )
             continue
 
-        if res is None:
-            _LOGGER.error(
-                "Unable to register Plant-instance %s: API returned no response (check credentials/token)",
-                reg_map,
-            )
-            continue
-
         _LOGGER.debug("Registration is successful with response: %s", res)
         # Error out if unexpected response has been received
         try:
@@ -413,8 +428,16 @@ async def plant_data_upload(
     if len(jts_doc) > 0:
         _LOGGER.debug("Payload to upload: %s", jts_doc.toJSONString())
         _LOGGER.debug("Calling OPB SDK to upload data")
-        res = await hass.data[DOMAIN][ATTR_API].async_plant_data_upload(
-            jts_doc, dry_run=False
+        # Not retried after a timeout: the data may have been stored anyway.
+        res = await async_api_call(
+            hass,
+            partial(
+                hass.data[DOMAIN][ATTR_API].async_plant_data_upload,
+                jts_doc,
+                dry_run=False,
+            ),
+            PRIORITY_BACKGROUND,
+            idempotent=False,
         )
         _LOGGER.info(
             "Uploading data from %s sensors was %s",
@@ -464,6 +487,10 @@ async def async_setup_upload_schedule(hass: HomeAssistant, entry: ConfigEntry) -
             _LOGGER.warning(
                 "Rate limit reached during scheduled upload; skipping until next scheduled run"
             )
+        except (ApiUnavailableError, CircuitOpenError) as err:
+            _LOGGER.warning(
+                "Skipping scheduled upload until next scheduled run: %s", err
+            )
 
     # Check if upload is enabled via OptionFlow
     upload_sensors = entry.options.get(FLOW_UPLOAD_DATA)
@@ -0,0 +1,94 @@
+"""Prefetch the species of existing plant entities once Home Assistant starts.
+
+Every plant created by the Plant Monitor integration carries its OpenPlantbook
+pid in the `species_original` attribute. Warming the species cache with those
+makes the first dashboard render and plant lookup after boot a cache hit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
+from homeassistant.core import CoreState, Event, HomeAssistant, callback
+from openplantbook_sdk.sdk import RateLimitError
+
+from .const import ATTR_SPECIES, DOMAIN, FLOW_WARM_UP, OPB_SERVICE_GET
+from .plantbook_exception import CircuitOpenError
+from .scheduler import background_requests
+
+# Species fetched at the same time during warm-up
+WARM_UP_CONCURRENCY = 4
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_warm_up(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Schedule the species cache warm-up for after Home Assistant has started."""
+    if not entry.options.get(FLOW_WARM_UP, False):
+        return
+
+    @callback
+    def start_warm_up(_event: Event | None = None) -> None:
+        entry.async_create_background_task(
+            hass, async_warm_up_species_cache(hass), f"{DOMAIN} cache warm-up"
+        )
+
+    if hass.state is CoreState.running:
+        start_warm_up()
+    else:
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, start_warm_up)
+        )
+
+
+async def async_warm_up_species_cache(hass: HomeAssistant) -> None:
+    """Fetch the species of all plant entities into the species cache.
+
+    Goes through the `get` service, so species already cached are not fetched
+    again and fetches share the in-flight coalescing. A rate-limit response
+    stops the warm-up: the remaining species are fetched on first use.
+    """
+    species = sorted(
+        {
+            pid
+            for state in hass.states.async_all("plant")
+            if (pid := state.attributes.get("species_original"))
+        }
+    )
+    if not species:
+        return
+    _LOGGER.debug("Warming up the species cache with %d species", len(species))
+    semaphore = asyncio.Semaphore(WARM_UP_CONCURRENCY)
+    rate_limited = asyncio.Event()
+    unavailable = asyncio.Event()
+
+    async def warm_up(pid: str) -> None:
+        async with semaphore:
+            if rate_limited.is_set() or unavailable.is_set():
+                return
+            try:
+                with background_requests():
+                    await hass.services.async_call(
+                        DOMAIN, OPB_SERVICE_GET, {ATTR_SPECIES: pid}, blocking=True
+                    )
+            except Exception as err:
+                # The get service raises rate limits as HomeAssistantError.
+                if isinstance(err.__cause__, RateLimitError):
+                    rate_limited.set()
+                    return
+                if isinstance(err.__cause__, CircuitOpenError):
+                    unavailable.set()
+                    return
+                _LOGGER.warning("Unable to warm up the cache for %s: %s", pid, err)
+
+    await asyncio.gather(*(warm_up(pid) for pid in species))
+    if rate_limited.is_set():
+        _LOGGER.warning("Rate limit reached, species cache warm-up stopped early")
+    if unavailable.is_set():
+        _LOGGER.warning(
+            "OpenPlantbook API unavailable, species cache warm-up stopped early"
+        )
@@ -11,6 +11,7 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.openplantbook.const import DOMAIN
+from custom_components.openplantbook.retry import RetryPolicy
 
 # This fixture ensures our custom component is loaded
 pytest_plugins = "pytest_homeassistant_custom_component"
@@ -49,6 +50,16 @@ def mock_recorder_dependency(hass: HomeAssistant) -> Generator[MagicMock, None,
         yield mock_instance
 
 
+@pytest.fixture(autouse=True)
+def no_retry_delay() -> Generator[None, None, None]:
+    """Retry failed API requests without waiting."""
+    with patch(
+        "custom_components.openplantbook.retry.DEFAULT_RETRY_POLICY",
+        RetryPolicy(base_delay=0, max_delay=0),
+    ):
+        yield
+
+
 # Standard test configuration
 TEST_CLIENT_ID = "test_client_id"
 TEST_CLIENT_SECRET = "test_client_secret"
@@ -72,8 +83,10 @@ def mock_config_entry() -> MockConfigEntry:
 
 @pytest.fixture
 def mock_openplantbook_api() -> Generator[MagicMock, None, None]:
-    """Mock the OpenPlantBookApi."""
-    with patch("custom_components.openplantbook.OpenPlantBookApi") as mock_api_class:
+    """Mock the OpenPlantbook API client."""
+    with patch(
+        "custom_components.openplantbook.auth.PlantbookClient"
+    ) as mock_api_class:
         mock_api = MagicMock()
         mock_api._async_get_token = AsyncMock(return_value="test_token")
         mock_api.async_plant_search = AsyncMock(
@@ -0,0 +1,98 @@
+"""Tests for the shared API client and its token."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.auth import async_get_client
+from custom_components.openplantbook.const import (
+    ATTR_API,
+    DOMAIN,
+    TOKEN_REFRESH_MARGIN,
+    TOKEN_STORAGE_KEY,
+    TOKEN_STORAGE_VERSION,
+)
+
+from .conftest import TEST_CLIENT_ID, TEST_CLIENT_SECRET
+
+
+def _token(expires_in: float) -> dict[str, Any]:
+    """Return a token as the SDK keeps it."""
+    return {
+        "access_token": f"token-{expires_in}",
+        "expires_in": expires_in,
+        "expires": (datetime.now() + timedelta(seconds=expires_in)).isoformat(),
+    }
+
+
+def _store_token(hass_storage: dict[str, Any], token: dict[str, Any]) -> None:
+    hass_storage[TOKEN_STORAGE_KEY] = {
+        "version": TOKEN_STORAGE_VERSION,
+        "key": TOKEN_STORAGE_KEY,
+        "data": {"client_id": TEST_CLIENT_ID, "token": token},
+    }
+
+
+async def _setup(
+    hass: HomeAssistant, entry: MockConfigEntry, mock_api: MagicMock
+) -> None:
+    """Set up the integration with a client that holds no token yet."""
+    mock_api.client_id = TEST_CLIENT_ID
+    mock_api.secret = TEST_CLIENT_SECRET
+    mock_api.token = None
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+def test_client_shared_for_same_credentials(hass: HomeAssistant) -> None:
+    """The validated client is reused by the entry; new credentials replace it."""
+    client = async_get_client(hass, "id", "secret")
+
+    assert async_get_client(hass, "id", "secret") is client
+    assert hass.data[DOMAIN][ATTR_API] is client
+    assert async_get_client(hass, "id", "other secret") is not client
+
+
+async def test_persisted_token_restored(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """A token still valid at startup is used without fetching a new one."""
+    token = _token(3600)
+    _store_token(hass_storage, token)
+
+    await _setup(hass, mock_config_entry, mock_openplantbook_api)
+
+    assert mock_openplantbook_api.token == token
+    mock_openplantbook_api._async_get_token.assert_not_called()
+
+
+async def test_expiring_token_renewed_and_persisted(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """A token about to expire is renewed in the background and saved."""
+    _store_token(hass_storage, _token(TOKEN_REFRESH_MARGIN / 2))
+    renewed = _token(3600)
+
+    async def _get_token() -> bool:
+        mock_openplantbook_api.token = renewed
+        return True
+
+    mock_openplantbook_api._async_get_token.side_effect = _get_token
+
+    await _setup(hass, mock_config_entry, mock_openplantbook_api)
+
+    mock_openplantbook_api._async_get_token.assert_called_once()
+    assert mock_openplantbook_api.token == renewed
+    assert hass_storage[TOKEN_STORAGE_KEY]["data"]["token"] == renewed
@@ -0,0 +1,268 @@
+"""Tests for the bounded species cache."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.cache import (
+    EVICTION_SAMPLE,
+    SearchCache,
+    SpeciesCache,
+    SpeciesRecord,
+    cache_key,
+    normalize_species,
+    species_fingerprint,
+)
+from custom_components.openplantbook.const import (
+    ATTR_SPECIES,
+    DOMAIN,
+    FLOW_CACHE_MAX_ENTRIES,
+    OPB_SERVICE_GET,
+)
+
+
+def _entry(pid: str, padding: int = 0, timestamp: float = 0) -> dict:
+    return {
+        "pid": pid,
+        "display_pid": pid.title(),
+        "notes": "x" * padding,
+        "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+    }
+
+
+def _record(pid: str, padding: int = 0, timestamp: float = 0) -> SpeciesRecord:
+    return SpeciesRecord.from_dict(_entry(pid, padding, timestamp))
+
+
+class TestSpeciesCache:
+    """Unit tests for SpeciesCache eviction."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        evicted = []
+        cache = SpeciesCache(2, 10**6, on_evict=lambda k, v: evicted.append(k))
+        cache["a"] = _record("a")
+        cache["b"] = _record("b")
+        cache.touch("a")
+        cache["c"] = _record("c")
+
+        assert set(cache) == {"a", "c"}
+        assert evicted == ["b"]
+
+    def test_frequently_used_entry_survives(self) -> None:
+        """An old but popular entry outlives newer one-off lookups."""
+        cache = SpeciesCache(3, 10**6)
+        cache["popular"] = _record("popular")
+        for _ in range(5):
+            cache.touch("popular")
+        cache["one"] = _record("one")
+        cache["two"] = _record("two")
+        cache.touch("one")
+        cache.touch("two")
+        # "popular" is now least recently used, but most frequently used.
+        cache["three"] = _record("three")
+
+        assert "popular" in cache
+        assert "one" not in cache
+
+    def test_byte_budget(self) -> None:
+        cache = SpeciesCache(100, 2000)
+        cache["a"] = _record("a", padding=900)
+        cache["b"] = _record("b", padding=900)
+        assert cache.size_bytes < 2000
+        cache["c"] = _record("c", padding=900)
+
+        assert set(cache) == {"b", "c"}
+        assert cache.size_bytes < 2000
+        del cache["b"]
+        del cache["c"]
+        assert cache.size_bytes == 0
+
+    def test_pinned_and_new_entries_never_evicted(self) -> None:
+        """In-flight keys and the entry being stored stay, even over budget."""
+        cache = SpeciesCache(1, 10**6, pinned={"a"})
+        cache["a"] = _record("a")
+        cache["b"] = _record("b")
+
+        assert set(cache) == {"a", "b"}
+
+    def test_resize_evicts(self) -> None:
+        cache = SpeciesCache(10, 10**6)
+        for key in "abcd":
+            cache[key] = _record(key)
+        cache.resize(2, 10**6)
+
+        assert list(cache) == ["c", "d"]
+
+
+class TestAliasIndex:
+    """Unit tests for species-name normalization and the alias index."""
+
+    def test_normalize_species(self) -> None:
+        assert normalize_species("Coleus 'Marble'") == "coleus 'marble'"
+        assert normalize_species("  coleus   \u2018Marble\u2019 ") == "coleus 'marble'"
+
+    def test_pid_and_display_pid_learned_on_store(self) -> None:
+        cache = SpeciesCache(10, 10**6)
+        cache["coleus 'marble'"] = SpeciesRecord(
+            "coleus 'marble'", None, {"display_pid": "Coleus 'Marble'"}, 0
+        )
+
+        assert cache.resolve("COLEUS 'MARBLE'") == "coleus 'marble'"
+        assert cache.resolve("unknown") is None
+
+    def test_aliases_survive_refresh_and_go_with_eviction(self) -> None:
+        cache = SpeciesCache(1, 10**6)
+        cache["a"] = _record("a")
+        cache.learn_alias("Alpha", "a")
+        cache["a"] = _record("a")
+        assert cache.resolve("alpha") == "a"
+
+        cache["b"] = _record("b")
+        assert cache.resolve("alpha") is None
+        assert cache.aliases == {"b": "b"}
+
+    def test_aliases_kept_until_last_language_removed(self) -> None:
+        cache = SpeciesCache(10, 10**6)
+        cache[cache_key("a", "en")] = _record("a")
+        cache[cache_key("a", "de")] = _record("a")
+        cache.learn_alias("Alpha", "a")
+
+        assert cache.keys_of("a") == {cache_key("a", "en"), cache_key("a", "de")}
+        del cache[cache_key("a", "en")]
+        assert cache.resolve("alpha") == "a"
+        del cache[cache_key("a", "de")]
+        assert cache.resolve("alpha") is None
+        assert cache.aliases == {}
+
+
+class TestSpeciesRecord:
+    """Unit tests for the cached species record."""
+
+    def test_round_trip_through_dict(self) -> None:
+        stored = {
+            **_entry("a", timestamp=1000),
+            "_fetched_includes": ["care"],
+            "_fetched_includes_at": {"care": datetime.fromtimestamp(500).isoformat()},
+            "_lang": "de",
+        }
+        record = SpeciesRecord.from_dict(stored, lang="en")
+
+        assert (record.pid, record.lang, record.fetched) == ("a", "de", 1000)
+        assert record.includes == {"care": 500}
+        assert record.as_dict() == stored
+
+    def test_listed_includes_and_missing_lang_from_older_stores(self) -> None:
+        record = SpeciesRecord.from_dict(
+            {**_entry("a", timestamp=1000), "_fetched_includes": ["care"]}, lang="en"
+        )
+
+        assert record.includes == {"care": 1000}
+        assert record.lang == "en"
+        assert "_fetched_includes" not in record.data
+        assert record["_fetched_includes"] == ["care"]
+
+
+class TestFingerprint:
+    """Unit tests for the species content fingerprint."""
+
+    def test_bookkeeping_fields_and_key_order_ignored(self) -> None:
+        first = {**_entry("a", timestamp=1000), "_lang": "en"}
+        second = {"_lang": "de", **_entry("a", timestamp=2000)}
+
+        assert species_fingerprint(first) == species_fingerprint(second)
+        assert species_fingerprint(first) != species_fingerprint(_entry("b"))
+
+
+class TestExpiry:
+    """Unit tests for the expiry heap."""
+
+    def test_pop_due_returns_only_expired_entries(self) -> None:
+        cache = SpeciesCache(10, 10**6, ttl=100)
+        cache["a"] = _record("a", timestamp=1000)
+        cache["b"] = _record("b", timestamp=2000)
+        cache["c"] = _record("c", timestamp=1500)
+
+        assert cache.next_expiry() == 1100
+        assert cache.pop_due(1600) == ["a", "c"]
+        assert cache.next_expiry() == 2100
+        # Reported once; the entries themselves are left to the caller.
+        assert cache.pop_due(1600) == []
+        assert list(cache) == ["a", "b", "c"]
+
+    def test_refreshed_and_removed_entries_skip_stale_heap_items(self) -> None:
+        cache = SpeciesCache(10, 10**6, ttl=100)
+        cache["a"] = _record("a", timestamp=1000)
+        cache["b"] = _record("b", timestamp=1000)
+        cache["a"] = _record("a", timestamp=5000)
+        del cache["b"]
+
+        assert cache.next_expiry() == 5100
+        assert cache.pop_due(5000) == []
+        assert cache.pop_due(5100) == ["a"]
+        assert cache.next_expiry() is None
+
+    def test_heap_compacted_after_many_refreshes(self) -> None:
+        cache = SpeciesCache(10, 10**6, ttl=100)
+        for timestamp in range(1000):
+            cache["a"] = _record("a", timestamp=timestamp)
+
+        assert len(cache._expiry_heap) <= 2 + EVICTION_SAMPLE
+        assert cache.pop_due(1099) == ["a"]
+
+
+class TestSearchCache:
+    """Tests for the search result cache."""
+
+    def test_keyed_on_normalized_alias_until_expiry(self) -> None:
+        cache = SearchCache(10)
+        cache.put("Swiss Cheese", {"monstera deliciosa": "Monstera"}, 100)
+
+        assert cache.get(" swiss  cheese", 99) == {"monstera deliciosa": "Monstera"}
+        assert cache.get("swiss cheese", 100) is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_dropped(self) -> None:
+        cache = SearchCache(2)
+        cache.put("a", {}, 100)
+        cache.put("b", {}, 100)
+        cache.get("a", 0)
+        cache.put("c", {}, 100)
+
+        assert cache.get("b", 0) is None
+        assert cache.get("a", 0) == {}
+        assert cache.get("c", 0) == {}
+
+
+async def test_eviction_removes_species_entity(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """An evicted species loses its entity and registry entry."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={FLOW_CACHE_MAX_ENTRIES: 1}
+    )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+        side_effect=[_entry("monstera deliciosa"), _entry("ficus lyrata")]
+    )
+
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "ficus lyrata"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert list(hass.data[DOMAIN][ATTR_SPECIES]) == [cache_key("ficus lyrata", "en")]
+    assert hass.states.get("openplantbook.monstera_deliciosa") is None
+    assert er.async_get(hass).async_get("openplantbook.monstera_deliciosa") is None
+    assert hass.states.get("openplantbook.ficus_lyrata") is not None
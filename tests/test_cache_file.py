@@ -0,0 +1,145 @@
+"""Tests for exporting and importing the species cache."""
+
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.cache import cache_key
+from custom_components.openplantbook.const import (
+    ATTR_HOURS,
+    ATTR_SPECIES,
+    DOMAIN,
+    OPB_SERVICE_CLEAN_CACHE,
+    OPB_SERVICE_EXPORT_CACHE,
+    OPB_SERVICE_GET,
+    OPB_SERVICE_IMPORT_CACHE,
+)
+from custom_components.openplantbook.plantbook_exception import OpenPlantbookException
+
+KEY = cache_key("monstera deliciosa", "en")
+
+
+@pytest.fixture
+def allowed_dir(hass: HomeAssistant, tmp_path: Path) -> Path:
+    """Allow the services to access a temporary directory."""
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    return tmp_path
+
+
+def _files(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.iterdir())
+
+
+async def _call(hass: HomeAssistant, service: str, **data) -> dict:
+    return await hass.services.async_call(
+        DOMAIN, service, data, blocking=True, return_response=True
+    )
+
+
+async def _clean(hass: HomeAssistant) -> None:
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_CLEAN_CACHE, {ATTR_HOURS: 0}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("filename", ["plants.jsonl", "plants.jsonl.gz"])
+async def test_export_then_import_restores_cache(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+    allowed_dir: Path,
+    filename: str,
+) -> None:
+    """An exported cache comes back with its aliases and entities, offline."""
+    path = allowed_dir / filename
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "Swiss cheese plant"}, blocking=True
+    )
+    result = await _call(hass, OPB_SERVICE_EXPORT_CACHE, path=str(path))
+    assert result == {ATTR_SPECIES: 1, "path": str(path)}
+    assert (path.read_bytes()[:2] == b"\x1f\x8b") == filename.endswith(".gz")
+    assert _files(allowed_dir) == [filename]
+
+    await _clean(hass)
+    assert hass.states.get("openplantbook.monstera_deliciosa") is None
+    result = await _call(hass, OPB_SERVICE_IMPORT_CACHE, path=str(path))
+    await _call(hass, OPB_SERVICE_GET, species="swiss cheese plant")
+
+    assert result == {ATTR_SPECIES: 1}
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+    assert KEY in hass.data[DOMAIN][ATTR_SPECIES]
+    state = hass.states.get("openplantbook.monstera_deliciosa")
+    assert state.state == "Monstera deliciosa"
+
+
+async def test_import_keeps_newer_cached_species(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+    allowed_dir: Path,
+) -> None:
+    """Species fetched after the export are not replaced by the file."""
+    path = allowed_dir / "plants.jsonl"
+    await _call(hass, OPB_SERVICE_GET, species="monstera deliciosa")
+    await _call(hass, OPB_SERVICE_EXPORT_CACHE, path=str(path))
+    await _call(hass, OPB_SERVICE_GET, species="monstera deliciosa", cache=False)
+    cached = hass.data[DOMAIN][ATTR_SPECIES][KEY]
+
+    result = await _call(hass, OPB_SERVICE_IMPORT_CACHE, path=str(path))
+
+    assert result == {ATTR_SPECIES: 0}
+    assert hass.data[DOMAIN][ATTR_SPECIES][KEY] is cached
+
+
+async def test_path_outside_allowlist_rejected(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    tmp_path: Path,
+) -> None:
+    """Files outside allowlist_external_dirs are neither written nor read."""
+    path = tmp_path / "plants.jsonl"
+
+    with pytest.raises(OpenPlantbookException):
+        await _call(hass, OPB_SERVICE_EXPORT_CACHE, path=str(path))
+    assert not path.exists()
+
+
+async def test_import_rejects_other_files(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    allowed_dir: Path,
+) -> None:
+    """A file without the export header is not imported."""
+    path = allowed_dir / "other.gz"
+    path.write_bytes(gzip.compress(b'{"pid": "monstera deliciosa"}\n'))
+
+    with pytest.raises(ServiceValidationError):
+        await _call(hass, OPB_SERVICE_IMPORT_CACHE, path=str(path))
+    assert KEY not in hass.data[DOMAIN][ATTR_SPECIES]
+
+
+async def test_import_rejects_malformed_lines(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+    allowed_dir: Path,
+) -> None:
+    """A line that is no JSON object fails the import and imports nothing."""
+    path = allowed_dir / "plants.jsonl"
+    await _call(hass, OPB_SERVICE_GET, species="monstera deliciosa")
+    await _call(hass, OPB_SERVICE_EXPORT_CACHE, path=str(path))
+    await _clean(hass)
+    header, species, aliases = path.read_bytes().splitlines()
+    path.write_bytes(b"\n".join([header, species, b"[1, 2]", aliases]))
+
+    with pytest.raises(ServiceValidationError, match="Line 3"):
+        await _call(hass, OPB_SERVICE_IMPORT_CACHE, path=str(path))
+    assert KEY not in hass.data[DOMAIN][ATTR_SPECIES]
@@ -0,0 +1,176 @@
+"""Tests for the API circuit breaker."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
+
+import aiohttp
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from openplantbook_sdk.sdk import RateLimitError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.cache import cache_key
+from custom_components.openplantbook.circuit import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+from custom_components.openplantbook.const import (
+    ATTR_SPECIES,
+    CACHE_TIME,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    DATA_CIRCUIT,
+    DOMAIN,
+    OPB_ATTR_TIMESTAMP,
+    OPB_SERVICE_GET,
+)
+from custom_components.openplantbook.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.openplantbook.plantbook_exception import (
+    ApiUnavailableError,
+    CircuitOpenError,
+)
+
+
+def _fail(breaker: CircuitBreaker, err: Exception) -> None:
+    with pytest.raises(type(err)), breaker.request():
+        raise err
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self) -> None:
+        """Only failures in a row count; an answer from the API resets them."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        _fail(breaker, aiohttp.ClientConnectionError())
+        _fail(breaker, RateLimitError())
+        _fail(breaker, aiohttp.ClientConnectionError())
+        assert breaker.state == STATE_CLOSED
+
+        _fail(breaker, ApiUnavailableError())
+        assert breaker.state == STATE_OPEN
+        with pytest.raises(CircuitOpenError), breaker.request():
+            pytest.fail("request ran while the circuit was open")
+        assert breaker.as_dict()["rejected"] == 1
+
+    def test_auth_failure_opens_at_once(self) -> None:
+        """Revoked credentials fail every request, so one failure is enough."""
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+        _fail(breaker, PermissionError())
+        assert breaker.as_dict()["state"] == STATE_OPEN
+        assert breaker.as_dict()["last_error"] == "PermissionError"
+
+    def test_half_open_lets_one_probe_through(
+        self, freezer: FrozenDateTimeFactory
+    ) -> None:
+        """After the timeout one probe runs; its outcome closes or reopens."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        _fail(breaker, aiohttp.ClientConnectionError())
+        freezer.tick(timedelta(seconds=61))
+        assert breaker.state == STATE_HALF_OPEN
+
+        with breaker.request(), pytest.raises(CircuitOpenError), breaker.request():
+            pytest.fail("second request ran during the probe")
+        assert breaker.state == STATE_CLOSED
+
+        _fail(breaker, aiohttp.ClientConnectionError())
+        freezer.tick(timedelta(seconds=61))
+        # A failed probe opens the circuit for another period
+        _fail(breaker, aiohttp.ClientConnectionError())
+        assert breaker.state == STATE_OPEN
+
+
+async def test_open_circuit_serves_stale_and_fails_fast(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """While open, expired species are served and unknown ones fail at once."""
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    old = datetime.now() - timedelta(hours=CACHE_TIME + 1)
+    hass.data[DOMAIN][ATTR_SPECIES][
+        cache_key("monstera deliciosa", "en")
+    ].fetched = old.timestamp()
+    # How the SDK reports an unreachable API
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(return_value=None)
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(HomeAssistantError, match="unavailable"):
+            await hass.services.async_call(
+                DOMAIN, OPB_SERVICE_GET, {"species": "capsicum"}, blocking=True
+            )
+    calls = mock_openplantbook_api.async_plant_detail_get.call_count
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        OPB_SERVICE_GET,
+        {"species": "monstera deliciosa"},
+        blocking=True,
+        return_response=True,
+    )
+    assert result[OPB_ATTR_TIMESTAMP] == old.isoformat()
+    with pytest.raises(HomeAssistantError, match="unavailable"):
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_GET, {"species": "capsicum"}, blocking=True
+        )
+    await hass.async_block_till_done()
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == calls
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+    assert diagnostics["circuit"]["state"] == STATE_OPEN
+    assert hass.data[DOMAIN][DATA_CIRCUIT].rejected == 1
+
+
+async def test_no_refresh_while_probe_in_flight(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """A stale get during a half-open probe refreshes nothing and warns of nothing."""
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    old = datetime.now() - timedelta(hours=CACHE_TIME + 1)
+    hass.data[DOMAIN][ATTR_SPECIES][
+        cache_key("monstera deliciosa", "en")
+    ].fetched = old.timestamp()
+    breaker = hass.data[DOMAIN][DATA_CIRCUIT]
+    _fail(breaker, PermissionError())
+    freezer.tick(timedelta(seconds=CIRCUIT_RESET_TIMEOUT + 1))
+    calls = mock_openplantbook_api.async_plant_detail_get.call_count
+
+    with breaker.request():
+        assert not breaker.admits_requests
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        )
+        await hass.async_block_till_done()
+
+        # A refresh rejected by the breaker all the same is dropped quietly
+        rejected = breaker.rejected
+        with patch.object(
+            CircuitBreaker, "admits_requests", new_callable=PropertyMock
+        ) as admits:
+            admits.return_value = True
+            await hass.services.async_call(
+                DOMAIN,
+                OPB_SERVICE_GET,
+                {"species": "monstera deliciosa"},
+                blocking=True,
+            )
+            await hass.async_block_till_done()
+
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == calls
+    assert breaker.rejected == rejected + 1
+    assert "Background refresh" not in caplog.text
@@ -0,0 +1,107 @@
+"""Tests for the integration's API client."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from http import HTTPStatus
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+from openplantbook_sdk.sdk import RateLimitError
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.openplantbook.client import PlantbookClient
+from custom_components.openplantbook.const import PLANTBOOK_BASEURL
+from custom_components.openplantbook.plantbook_exception import (
+    OpenPlantbookException,
+    SpeciesNotFoundError,
+)
+from custom_components.openplantbook.retry import retry_after
+
+DETAIL_URL = f"{PLANTBOOK_BASEURL}/plant/detail/capsicum/"
+
+
+def _client(hass: HomeAssistant) -> PlantbookClient:
+    """Return a client holding a valid token, so no token is fetched."""
+    client = PlantbookClient(hass, "id", "secret")
+    client.token = {
+        "access_token": "abc",
+        "expires": (datetime.now() + timedelta(hours=1)).isoformat(),
+    }
+    return client
+
+
+async def test_requests_use_shared_session(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Detail and search requests go through Home Assistant's session."""
+    aioclient_mock.get(DETAIL_URL, json={"pid": "capsicum"})
+    aioclient_mock.get(
+        f"{PLANTBOOK_BASEURL}/plant/search", json={"count": 0, "results": []}
+    )
+    client = _client(hass)
+
+    detail = await client.async_plant_detail_get(
+        "capsicum", lang="de", params={"include": "care"}
+    )
+    search = await client.async_plant_search("chili & pepper")
+
+    assert detail == {"pid": "capsicum"}
+    assert search == {"count": 0, "results": []}
+    (_, detail_url, _, detail_headers), (_, search_url, _, _) = (
+        aioclient_mock.mock_calls
+    )
+    assert dict(detail_url.query) == {"include": "care", "lang": "de"}
+    assert detail_headers["Authorization"] == "Bearer abc"
+    assert search_url.query["alias"] == "chili & pepper"
+
+
+@pytest.mark.parametrize(
+    ("status", "error"),
+    [
+        (HTTPStatus.NOT_FOUND, SpeciesNotFoundError),
+        (HTTPStatus.UNAUTHORIZED, PermissionError),
+        (HTTPStatus.BAD_REQUEST, OpenPlantbookException),
+        (HTTPStatus.BAD_GATEWAY, aiohttp.ClientResponseError),
+    ],
+)
+async def test_error_responses_raise(
+    hass: HomeAssistant,
+    aioclient_mock: AiohttpClientMocker,
+    status: HTTPStatus,
+    error: type[Exception],
+) -> None:
+    """Error responses raise instead of returning None as the SDK does."""
+    aioclient_mock.get(DETAIL_URL, status=status)
+
+    with pytest.raises(error):
+        await _client(hass).async_plant_detail_get("capsicum")
+
+
+async def test_rate_limit_keeps_retry_after(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """A 429 raises RateLimitError from the response, with its Retry-After."""
+    aioclient_mock.get(
+        DETAIL_URL,
+        status=HTTPStatus.TOO_MANY_REQUESTS,
+        headers={"Retry-After": "7"},
+    )
+
+    with pytest.raises(RateLimitError) as err:
+        await _client(hass).async_plant_detail_get("capsicum")
+
+    assert retry_after(err.value) == 7
+
+
+async def test_connection_error_raised(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """An unreachable API raises the connection error."""
+    aioclient_mock.get(DETAIL_URL, exc=aiohttp.ClientConnectionError())
+
+    with pytest.raises(aiohttp.ClientConnectionError):
+        await _client(hass).async_plant_detail_get("capsicum")
@@ -4,16 +4,19 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from homeassistant import config_entries
 from homeassistant.const import CONF_CLIENT_ID, CONF_CLIENT_SECRET
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
 from openplantbook_sdk import MissingClientIdOrSecret
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.openplantbook.const import (
     DEFAULT_IMAGE_PATH,
     DOMAIN,
+    FLOW_CACHE_MAX_ENTRIES,
+    FLOW_CACHE_MAX_SIZE,
     FLOW_DOWNLOAD_IMAGES,
     FLOW_DOWNLOAD_PATH,
     FLOW_UPLOAD_DATA,
@@ -44,7 +47,7 @@ class TestConfigFlow:
     ) -> None:
         """Test that invalid auth shows error."""
         with patch(
-            "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+            "custom_components.openplantbook.auth.PlantbookClient"
         ) as mock_api_class:
             mock_api = MagicMock()
             mock_api._async_get_token = AsyncMock(
@@ -74,7 +77,7 @@ class TestConfigFlow:
     ) -> None:
         """Test that connection error shows error."""
         with patch(
-            "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+            "custom_components.openplantbook.auth.PlantbookClient"
         ) as mock_api_class:
             mock_api = MagicMock()
             mock_api._async_get_token = AsyncMock(
@@ -104,7 +107,7 @@ class TestConfigFlow:
     ) -> None:
         """Test that valid credentials proceed to upload step."""
         with patch(
-            "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+            "custom_components.openplantbook.auth.PlantbookClient"
         ) as mock_api_class:
             mock_api = MagicMock()
             mock_api._async_get_token = AsyncMock(return_value="test_token")
@@ -131,7 +134,7 @@ class TestConfigFlow:
     ) -> None:
         """Test that upload step creates the config entry."""
         with patch(
-            "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+            "custom_components.openplantbook.auth.PlantbookClient"
         ) as mock_api_class:
             mock_api = MagicMock()
             mock_api._async_get_token = AsyncMock(return_value="test_token")
@@ -173,7 +176,7 @@ class TestConfigFlow:
     ) -> None:
         """A newly created entry gets the client_id as its unique_id."""
         with patch(
-            "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+            "custom_components.openplantbook.auth.PlantbookClient"
         ) as mock_api_class:
             mock_api = MagicMock()
             mock_api._async_get_token = AsyncMock(return_value="test_token")
@@ -310,3 +313,19 @@ class TestOptionsFlow:
 
         # Should succeed because download is disabled
         assert result["type"] == FlowResultType.CREATE_ENTRY
+
+    @pytest.mark.parametrize("option", [FLOW_CACHE_MAX_ENTRIES, FLOW_CACHE_MAX_SIZE])
+    async def test_options_flow_rejects_zero_cache_limit(
+        self,
+        hass: HomeAssistant,
+        mock_openplantbook_api: MagicMock,
+        init_integration: MockConfigEntry,
+        option: str,
+    ) -> None:
+        """A cache limit of 0 would keep only the newest species; it is refused."""
+        result = await hass.config_entries.options.async_init(init_integration.entry_id)
+
+        with pytest.raises(InvalidData):
+            await hass.config_entries.options.async_configure(
+                result["flow_id"], {option: 0}
+            )
@@ -0,0 +1,113 @@
+"""Tests for the cache statistics and diagnostics."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.openplantbook.const import (
+    DOMAIN,
+    FLOW_STATS_ENTITY,
+    OPB_SERVICE_GET,
+)
+from custom_components.openplantbook.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.openplantbook.entity import STATS_UPDATE_INTERVAL
+from custom_components.openplantbook.plantbook_exception import SpeciesNotFoundError
+
+
+async def _get(hass: HomeAssistant, species: str, **data) -> None:
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": species, **data}, blocking=True
+    )
+
+
+async def test_diagnostics_report_cache_statistics(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """Lookups are counted by outcome and the credentials are redacted."""
+    await _get(hass, "monstera deliciosa")
+    await _get(hass, "monstera deliciosa")
+    await _get(hass, "monstera deliciosa", include="care")
+    await _get(hass, "monstera deliciosa", cache=False)
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+        side_effect=SpeciesNotFoundError("unknown")
+    )
+    await _get(hass, "unknown")
+    await _get(hass, "unknown")
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+
+    stats = diagnostics["statistics"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["include_refetches"] == 1
+    assert stats["bypasses"] == 1
+    assert stats["negative_hits"] == 1
+    assert stats["api_requests"] == 4
+    assert stats["api_errors"] == 0
+    assert stats["api_seconds_mean"] is not None
+    assert stats["hit_ratio"] == 33.3
+    assert diagnostics["cache"]["entries"] == 1
+    assert diagnostics["cache"]["not_found"] == 1
+    assert diagnostics["entry"]["data"]["client_secret"] == "**REDACTED**"
+
+
+async def test_api_errors_counted(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """A failing request counts as an API error."""
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+        side_effect=PermissionError
+    )
+    with pytest.raises(HomeAssistantError):
+        await _get(hass, "monstera deliciosa")
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, init_integration)
+
+    assert diagnostics["statistics"]["api_errors"] == 1
+
+
+async def test_statistics_entity_follows_option(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """The statistics entity exists only while the option is on."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={FLOW_STATS_ENTITY: True}
+    )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    await _get(hass, "monstera deliciosa")
+    await _get(hass, "monstera deliciosa")
+
+    async_fire_time_changed(hass, dt_util.utcnow() + STATS_UPDATE_INTERVAL)
+    await hass.async_block_till_done()
+    state = hass.states.get("openplantbook.cache_statistics")
+    assert state.state == "50.0"
+    assert state.attributes["hits"] == 1
+    assert state.attributes["unit_of_measurement"] == "%"
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={FLOW_STATS_ENTITY: False}
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("openplantbook.cache_statistics") is None
+    assert er.async_get(hass).async_get("openplantbook.cache_statistics") is None
@@ -3,20 +3,32 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
+from typing import Any
 from unittest.mock import AsyncMock
 
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
 
+from custom_components.openplantbook.cache import cache_key
 from custom_components.openplantbook.const import (
     ATTR_HOURS,
     ATTR_SPECIES,
     CACHE_TIME,
     DOMAIN,
+    EVENT_SPECIES_CHANGED,
     OPB_ATTR_TIMESTAMP,
     OPB_SERVICE_CLEAN_CACHE,
     OPB_SERVICE_GET,
+    STORAGE_KEY,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
 )
 
 
@@ -121,141 +133,122 @@ async def test_species_entity_updates_on_refetch(
     assert state.state == "Monstera deliciosa UPDATED"
 
 
-async def test_species_entity_deduped_by_pid_across_inputs(
+async def test_unchanged_refetch_skips_state_write(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
     mock_openplantbook_api,
 ) -> None:
-    """Different service inputs resolving to the same pid map to one entity.
-
-    The entity holder is keyed by the canonical pid, so a second fetch with a
-    differently-cased input updates the existing entity instead of attempting
-    to add a duplicate with the same (already-taken) entity_id/unique_id.
-    """
-    # Both inputs resolve to the same pid; the second carries updated data.
-    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
-        side_effect=[
-            {
-                "pid": "monstera deliciosa",
-                "display_pid": "Monstera deliciosa",
-                "max_light_lux": 20000,
-                "min_light_lux": 1000,
-            },
-            {
-                "pid": "monstera deliciosa",
-                "display_pid": "Monstera deliciosa v2",
-                "max_light_lux": 20000,
-                "min_light_lux": 1000,
-            },
-        ]
-    )
-
+    """A refetch returning the same data writes no state and fires no event."""
+    changes = async_capture_events(hass, EVENT_SPECIES_CHANGED)
     await hass.services.async_call(
-        DOMAIN, OPB_SERVICE_GET, {"species": "Monstera Deliciosa"}, blocking=True
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
     )
+    before = hass.states.get("openplantbook.monstera_deliciosa")
+
     await hass.services.async_call(
-        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        DOMAIN,
+        OPB_SERVICE_GET,
+        {"species": "monstera deliciosa", "cache": False},
+        blocking=True,
     )
+    await hass.async_block_till_done()
 
-    # Exactly one registry entry for the shared entity_id...
-    ent_reg = er.async_get(hass)
-    matching = [
-        e
-        for e in ent_reg.entities.values()
-        if e.entity_id == "openplantbook.monstera_deliciosa"
-    ]
-    assert len(matching) == 1
-    # ...and it reflects the second fetch (proving the update path was taken,
-    # not a rejected duplicate add).
-    state = hass.states.get("openplantbook.monstera_deliciosa")
-    assert state is not None
-    assert state.state == "Monstera deliciosa v2"
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+    assert hass.states.get("openplantbook.monstera_deliciosa") is before
+    assert changes == []
 
 
-async def test_clean_cache_skips_in_flight_sentinel(
+async def test_changed_refetch_fires_event(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
     mock_openplantbook_api,
 ) -> None:
-    """clean_cache tolerates the in-flight sentinel ({}) left by the concurrency guard."""
-    # A completed entry plus a simulated in-flight sentinel (as get_plant's
-    # concurrency guard would leave mid-fetch).
+    """Only a refetch with different content fires openplantbook_species_changed."""
+    changes = async_capture_events(hass, EVENT_SPECIES_CHANGED)
     await hass.services.async_call(
         DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
     )
-    hass.data[DOMAIN][ATTR_SPECIES]["in flight species"] = {}
-
-    # Must not raise despite the sentinel lacking a timestamp/pid.
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+        return_value={"pid": "monstera deliciosa", "display_pid": "Monstera"}
+    )
     await hass.services.async_call(
-        DOMAIN, OPB_SERVICE_CLEAN_CACHE, {ATTR_HOURS: 0}, blocking=True
+        DOMAIN,
+        OPB_SERVICE_GET,
+        {"species": "monstera deliciosa", "cache": False},
+        blocking=True,
     )
     await hass.async_block_till_done()
 
-    # The completed entry was cleaned; the in-flight sentinel is left intact.
-    assert hass.states.get("openplantbook.monstera_deliciosa") is None
-    assert hass.data[DOMAIN][ATTR_SPECIES].get("in flight species") == {}
+    assert [event.data for event in changes] == [
+        {"pid": "monstera deliciosa", "lang": "en"}
+    ]
 
 
-async def test_entity_survives_until_last_pid_cache_entry_expires(
+async def test_species_variants_resolve_to_one_entry(
     hass: HomeAssistant,
     init_integration: MockConfigEntry,
     mock_openplantbook_api,
 ) -> None:
-    """The shared per-pid entity is removed only when its last cache entry expires.
+    """Casing/spacing variants and the display_pid resolve to the pid locally.
 
-    Two differently-cased inputs resolve to the same pid → one shared entity but
-    two cache keys. Expiring one key must not strand the still-cached other key
-    without its state; the entity is torn down only on the last expiry.
+    The first fetch caches the entry under its canonical pid and learns its
+    aliases, so every later variant is a cache hit on the same entry and
+    entity, with no further API call.
     """
-    # side_effect (not return_value) so each call yields a DISTINCT dict — else
-    # both cache keys would alias one object and backdating one backdates both.
-    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
-        side_effect=[
-            {
-                "pid": "monstera deliciosa",
-                "display_pid": "Monstera deliciosa",
-                "max_light_lux": 20000,
-                "min_light_lux": 1000,
-            },
-            {
-                "pid": "monstera deliciosa",
-                "display_pid": "Monstera deliciosa",
-                "max_light_lux": 20000,
-                "min_light_lux": 1000,
-            },
-        ]
-    )
+    for species in (
+        "Monstera Deliciosa",
+        "monstera deliciosa",
+        "  MONSTERA   deliciosa ",
+        "Monstera deliciosa",
+    ):
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": species},
+            blocking=True,
+            return_response=True,
+        )
+        assert result["pid"] == "monstera deliciosa"
+
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+    assert list(hass.data[DOMAIN][ATTR_SPECIES]) == [
+        cache_key("monstera deliciosa", "en")
+    ]
+    ent_reg = er.async_get(hass)
+    matching = [
+        e
+        for e in ent_reg.entities.values()
+        if e.entity_id == "openplantbook.monstera_deliciosa"
+    ]
+    assert len(matching) == 1
+
+
+async def test_input_alias_learned_and_forgotten(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api,
+) -> None:
+    """A name the API resolved to a pid is learned, and dropped with its entry."""
     await hass.services.async_call(
-        DOMAIN, OPB_SERVICE_GET, {"species": "Monstera Deliciosa"}, blocking=True
+        DOMAIN, OPB_SERVICE_GET, {"species": "Swiss cheese plant"}, blocking=True
     )
     await hass.services.async_call(
-        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        DOMAIN, OPB_SERVICE_GET, {"species": "swiss cheese plant"}, blocking=True
+    )
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+    assert (
+        hass.data[DOMAIN][ATTR_SPECIES].resolve("SWISS cheese plant")
+        == "monstera deliciosa"
     )
-    cache = hass.data[DOMAIN][ATTR_SPECIES]
-    assert set(cache) == {"Monstera Deliciosa", "monstera deliciosa"}
-    assert hass.states.get("openplantbook.monstera_deliciosa") is not None
-
-    ent_reg = er.async_get(hass)
-    old = (datetime.now() - timedelta(hours=CACHE_TIME + 1)).isoformat()
-
-    # Expire only the first key (default CACHE_TIME window applies).
-    cache["Monstera Deliciosa"][OPB_ATTR_TIMESTAMP] = old
-    await hass.services.async_call(DOMAIN, OPB_SERVICE_CLEAN_CACHE, {}, blocking=True)
-    await hass.async_block_till_done()
-
-    # The other cache entry is still valid → the entity must survive.
-    assert "Monstera Deliciosa" not in hass.data[DOMAIN][ATTR_SPECIES]
-    assert "monstera deliciosa" in hass.data[DOMAIN][ATTR_SPECIES]
-    assert hass.states.get("openplantbook.monstera_deliciosa") is not None
-    assert ent_reg.async_get("openplantbook.monstera_deliciosa") is not None
-
-    # Expire the last remaining key → entity + registry entry now removed.
-    hass.data[DOMAIN][ATTR_SPECIES]["monstera deliciosa"][OPB_ATTR_TIMESTAMP] = old
-    await hass.services.async_call(DOMAIN, OPB_SERVICE_CLEAN_CACHE, {}, blocking=True)
-    await hass.async_block_till_done()
 
-    assert hass.states.get("openplantbook.monstera_deliciosa") is None
-    assert ent_reg.async_get("openplantbook.monstera_deliciosa") is None
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_CLEAN_CACHE, {ATTR_HOURS: 0}, blocking=True
+    )
+    assert hass.data[DOMAIN][ATTR_SPECIES].resolve("swiss cheese plant") is None
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "swiss cheese plant"}, blocking=True
+    )
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
 
 
 async def test_stale_species_entities_purged_on_setup(
@@ -265,10 +258,10 @@ async def test_stale_species_entities_purged_on_setup(
 ) -> None:
     """Per-species registry entries left over from a previous run are purged at setup.
 
-    The species cache is in-memory, so after a restart it is empty and
-    clean_cache can't expire anything. Setup must clear leftover per-species
-    registry rows so they don't linger as stale, unavailable entities, while
-    keeping the persistent search_result entity.
+    Rows whose pid is not in the restored cache can't be expired by
+    clean_cache. Setup must clear leftover per-species registry rows so they
+    don't linger as stale, unavailable entities, while keeping the persistent
+    search_result entity.
     """
     ent_reg = er.async_get(hass)
     # Simulate a per-species entity left in the registry by a previous run.
@@ -288,3 +281,109 @@ async def test_stale_species_entities_purged_on_setup(
     assert ent_reg.async_get(ghost.entity_id) is None
     # The persistent search_result entity is preserved.
     assert ent_reg.async_get("openplantbook.search_result") is not None
+
+
+async def test_species_cache_restored_from_storage(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api,
+) -> None:
+    """A fresh persisted cache rebuilds its entities and serves gets offline.
+
+    Entries that expired while HA was down are dropped, and their leftover
+    registry rows are purged like any other stale per-species entity.
+    """
+    now = datetime.now()
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": {
+            ATTR_SPECIES: {
+                "monstera deliciosa": {
+                    "pid": "monstera deliciosa",
+                    "display_pid": "Monstera deliciosa",
+                    OPB_ATTR_TIMESTAMP: now.isoformat(),
+                    "_fetched_includes": [],
+                },
+                "old species": {
+                    "pid": "old species",
+                    "display_pid": "Old species",
+                    OPB_ATTR_TIMESTAMP: (
+                        now - timedelta(hours=CACHE_TIME + 1)
+                    ).isoformat(),
+                    "_fetched_includes": [],
+                },
+            }
+        },
+    }
+    ent_reg = er.async_get(hass)
+    ent_reg.async_get_or_create(
+        domain=DOMAIN,
+        platform=DOMAIN,
+        unique_id="test_client_id_old species",
+        suggested_object_id="old_species",
+    )
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("openplantbook.monstera_deliciosa")
+    assert state is not None
+    assert state.state == "Monstera deliciosa"
+    assert ent_reg.async_get("openplantbook.old_species") is None
+    assert cache_key("old species", "en") not in hass.data[DOMAIN][ATTR_SPECIES]
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        OPB_SERVICE_GET,
+        {"species": "monstera deliciosa"},
+        blocking=True,
+        return_response=True,
+    )
+    assert result["display_pid"] == "Monstera deliciosa"
+    mock_openplantbook_api.async_plant_detail_get.assert_not_called()
+
+
+async def test_species_cache_persisted_after_fetch(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api,
+) -> None:
+    """A fetched species is written to storage once the save delay elapses."""
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STORAGE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[STORAGE_KEY]["data"][ATTR_SPECIES]
+    assert stored[cache_key("monstera deliciosa", "en")]["pid"] == "monstera deliciosa"
+    assert OPB_ATTR_TIMESTAMP in stored[cache_key("monstera deliciosa", "en")]
+
+
+async def test_species_expires_on_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api,
+) -> None:
+    """A species and its entity go away when the entry expires, without a sweep."""
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    freezer.tick(timedelta(hours=CACHE_TIME, seconds=-1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("openplantbook.monstera_deliciosa") is not None
+
+    freezer.tick(timedelta(seconds=2))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert cache_key("monstera deliciosa", "en") not in hass.data[DOMAIN][ATTR_SPECIES]
+    assert hass.states.get("openplantbook.monstera_deliciosa") is None
+    assert er.async_get(hass).async_get("openplantbook.monstera_deliciosa") is None
@@ -2,27 +2,59 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from homeassistant.core import HomeAssistant
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, ServiceResponse
+from homeassistant.exceptions import HomeAssistantError
 from openplantbook_sdk import MissingClientIdOrSecret
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from openplantbook_sdk.sdk import RateLimitError
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+)
 
+from custom_components.openplantbook.cache import SpeciesRecord, cache_key
 from custom_components.openplantbook.const import (
     ATTR_API,
     ATTR_IMAGE,
     ATTR_SPECIES,
+    CACHE_TIME,
+    DATA_STATS,
     DEFAULT_IMAGE_PATH,
+    DEFAULT_NEGATIVE_CACHE_TTL,
     DOMAIN,
     FLOW_DOWNLOAD_IMAGES,
     FLOW_DOWNLOAD_PATH,
+    FLOW_NEGATIVE_CACHE_TTL,
+    FLOW_SEARCH_CACHE_TTL,
+    FLOW_SEARCH_DEBOUNCE,
+    FLOW_SEARCH_RESULT_MAX,
+    FLOW_SEND_LANG,
+    FLOW_SERVE_STALE,
+    GET_MANY_CONCURRENCY,
+    IMAGE_MAX_SIZE,
+    OPB_ATTR_INCLUDES,
+    OPB_ATTR_INCLUDES_AT,
+    OPB_ATTR_TIMESTAMP,
     OPB_SERVICE_CLEAN_CACHE,
+    OPB_SERVICE_EXPORT_CACHE,
     OPB_SERVICE_GET,
+    OPB_SERVICE_GET_MANY,
+    OPB_SERVICE_IMPORT_CACHE,
     OPB_SERVICE_SEARCH,
     OPB_SERVICE_UPLOAD,
 )
-from custom_components.openplantbook.plantbook_exception import OpenPlantbookException
+from custom_components.openplantbook.plantbook_exception import (
+    OpenPlantbookException,
+    SpeciesNotFoundError,
+)
+from custom_components.openplantbook.retry import DEFAULT_RETRY_POLICY
 
 
 def _make_detail_side_effect():
@@ -92,7 +124,10 @@ class TestIntegrationSetup:
         """Test that all services are registered."""
         assert hass.services.has_service(DOMAIN, OPB_SERVICE_SEARCH)
         assert hass.services.has_service(DOMAIN, OPB_SERVICE_GET)
+        assert hass.services.has_service(DOMAIN, OPB_SERVICE_GET_MANY)
         assert hass.services.has_service(DOMAIN, OPB_SERVICE_CLEAN_CACHE)
+        assert hass.services.has_service(DOMAIN, OPB_SERVICE_EXPORT_CACHE)
+        assert hass.services.has_service(DOMAIN, OPB_SERVICE_IMPORT_CACHE)
         assert hass.services.has_service(DOMAIN, OPB_SERVICE_UPLOAD)
 
     async def test_existing_entry_unique_id_backfilled(
@@ -154,7 +189,10 @@ class TestIntegrationSetup:
         # All registered services should be removed (including upload)
         assert not hass.services.has_service(DOMAIN, OPB_SERVICE_SEARCH)
         assert not hass.services.has_service(DOMAIN, OPB_SERVICE_GET)
+        assert not hass.services.has_service(DOMAIN, OPB_SERVICE_GET_MANY)
         assert not hass.services.has_service(DOMAIN, OPB_SERVICE_CLEAN_CACHE)
+        assert not hass.services.has_service(DOMAIN, OPB_SERVICE_EXPORT_CACHE)
+        assert not hass.services.has_service(DOMAIN, OPB_SERVICE_IMPORT_CACHE)
         assert not hass.services.has_service(DOMAIN, OPB_SERVICE_UPLOAD)
 
 
@@ -198,6 +236,278 @@ class TestSearchService:
         assert int(state.state) == 1
 
 
+class TestSearchServiceCaching:
+    """Tests for the search result cache and coalescing of searches."""
+
+    @staticmethod
+    async def _search(hass: HomeAssistant, alias: str) -> dict:
+        return await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_SEARCH,
+            {"alias": alias},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def test_repeated_search_answered_from_cache(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Variants of a searched alias reuse its results until they expire."""
+        first = await self._search(hass, "Monstera")
+        second = await self._search(hass, " monstera ")
+
+        assert first == second == {"monstera deliciosa": "Monstera deliciosa"}
+        assert mock_openplantbook_api.async_plant_search.call_count == 1
+        assert hass.data[DOMAIN]["stats"].search_hits == 1
+        assert hass.states.get(f"{DOMAIN}.search_result").state == "1"
+
+    async def test_search_cache_expires_and_is_cleaned(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """Cached searches expire after their TTL and go with clean_cache."""
+        await self._search(hass, "monstera")
+        freezer.tick(timedelta(minutes=11))
+        await self._search(hass, "monstera")
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_CLEAN_CACHE, {"hours": 0}, blocking=True
+        )
+        await self._search(hass, "monstera")
+
+        assert mock_openplantbook_api.async_plant_search.call_count == 3
+
+    async def test_search_cache_disabled(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A search cache TTL of 0 sends every search to the API."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_SEARCH_CACHE_TTL: 0}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        await self._search(hass, "monstera")
+        await self._search(hass, "monstera")
+
+        assert mock_openplantbook_api.async_plant_search.call_count == 2
+
+    async def test_concurrent_searches_share_one_request(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Identical searches in flight together hit the API once."""
+        release = asyncio.Event()
+        results = mock_openplantbook_api.async_plant_search.return_value
+
+        async def _side_effect(alias):
+            await release.wait()
+            return results
+
+        mock_openplantbook_api.async_plant_search = AsyncMock(side_effect=_side_effect)
+        tasks = [
+            hass.async_create_task(self._search(hass, alias))
+            for alias in ("monstera", "Monstera", "monstera")
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        responses = await asyncio.gather(*tasks)
+
+        assert mock_openplantbook_api.async_plant_search.call_count == 1
+        assert all(r == {"monstera deliciosa": "Monstera deliciosa"} for r in responses)
+        assert hass.data[DOMAIN]["stats"].search_coalesced == 2
+        assert hass.data[DOMAIN]["search_in_flight"] == {}
+
+    async def test_cancelled_search_does_not_fail_waiters(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Cancelling the caller that started a search leaves it running."""
+        release = asyncio.Event()
+        results = mock_openplantbook_api.async_plant_search.return_value
+
+        async def _side_effect(alias):
+            await release.wait()
+            return results
+
+        mock_openplantbook_api.async_plant_search = AsyncMock(side_effect=_side_effect)
+        first, second = (
+            hass.async_create_task(self._search(hass, "monstera")) for _ in range(2)
+        )
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await second == {"monstera deliciosa": "Monstera deliciosa"}
+        assert first.cancelled()
+        assert mock_openplantbook_api.async_plant_search.call_count == 1
+
+
+CAPSICUM_RESULTS = {
+    "count": 5,
+    "results": [
+        {"pid": f"capsicum {n}", "display_pid": f"Capsicum {n}"} for n in range(5)
+    ],
+}
+
+
+class TestSearchServicePaging:
+    """Tests for limit/offset and the cap on results shown by the entity."""
+
+    @staticmethod
+    async def _search(hass: HomeAssistant, **data) -> dict:
+        return await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_SEARCH,
+            {"alias": "capsicum", **data},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def test_limit_and_offset(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A page of the results is returned and shown, with the total count."""
+        mock_openplantbook_api.async_plant_search.return_value = CAPSICUM_RESULTS
+
+        page = await self._search(hass, limit=2, offset=1)
+        assert page == {"capsicum 1": "Capsicum 1", "capsicum 2": "Capsicum 2"}
+        state = hass.states.get(f"{DOMAIN}.search_result")
+        assert state.state == "5"
+        assert dict(state.attributes) == page
+
+        assert len(await self._search(hass, offset=3)) == 2
+        assert mock_openplantbook_api.async_plant_search.call_count == 1
+
+    async def test_entity_shows_at_most_the_configured_results(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """The response keeps every result; the entity only the first ones."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_SEARCH_RESULT_MAX: 2}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        mock_openplantbook_api.async_plant_search.return_value = CAPSICUM_RESULTS
+
+        assert len(await self._search(hass)) == 5
+        state = hass.states.get(f"{DOMAIN}.search_result")
+        assert state.state == "5"
+        assert list(state.attributes) == ["capsicum 0", "capsicum 1"]
+
+    async def test_invalid_offset_rejected(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A negative offset is an invalid service call."""
+        with pytest.raises(OpenPlantbookException):
+            await self._search(hass, offset=-1)
+        mock_openplantbook_api.async_plant_search.assert_not_called()
+
+
+class TestSearchServiceDebounce:
+    """Tests for the optional debounce of bursts of searches."""
+
+    @staticmethod
+    async def _burst(
+        hass: HomeAssistant, freezer: FrozenDateTimeFactory, aliases: list[str]
+    ) -> list[ServiceResponse]:
+        """Search for aliases 200 ms apart and return the responses."""
+        tasks = []
+        for alias in aliases:
+            tasks.append(
+                hass.async_create_task(
+                    hass.services.async_call(
+                        DOMAIN,
+                        OPB_SERVICE_SEARCH,
+                        {"alias": alias},
+                        blocking=True,
+                        return_response=True,
+                    )
+                )
+            )
+            freezer.tick(timedelta(milliseconds=200))
+            await asyncio.sleep(0)
+        freezer.tick(timedelta(milliseconds=300))
+        async_fire_time_changed(hass)
+        responses = await asyncio.gather(*tasks)
+        await hass.async_block_till_done()
+        return responses
+
+    async def test_burst_runs_only_the_last_search(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """Every caller of a burst gets the trailing search's results."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_SEARCH_DEBOUNCE: 300}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+        responses = await self._burst(
+            hass, freezer, ["Monstera", "monstera ", "monstera"]
+        )
+
+        mock_openplantbook_api.async_plant_search.assert_called_once_with("monstera")
+        assert all(r == {"monstera deliciosa": "Monstera deliciosa"} for r in responses)
+        assert [e.data["entity_id"] for e in events] == [f"{DOMAIN}.search_result"]
+        assert not hass.data[DOMAIN]["search_burst"]
+        assert not hass.data[DOMAIN]["search_burst_call"]
+
+    async def test_bursts_are_per_alias(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """Searches for different aliases in one window get their own results."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_SEARCH_DEBOUNCE: 300}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        mock_openplantbook_api.async_plant_search.side_effect = lambda alias: {
+            "results": [{"pid": alias, "display_pid": alias.title()}]
+        }
+
+        monstera, capsicum = await self._burst(hass, freezer, ["monstera", "capsicum"])
+
+        assert mock_openplantbook_api.async_plant_search.call_count == 2
+        assert monstera == {"monstera": "Monstera"}
+        assert capsicum == {"capsicum": "Capsicum"}
+
+
 class TestGetPlantService:
     """Tests for the get plant service."""
 
@@ -236,7 +546,7 @@ class TestGetPlantService:
         )
 
         # Verify it's cached
-        assert "monstera deliciosa" in hass.data[DOMAIN][ATTR_SPECIES]
+        assert cache_key("monstera deliciosa", "en") in hass.data[DOMAIN][ATTR_SPECIES]
 
         # Second call should use cache
         mock_openplantbook_api.async_plant_detail_get.reset_mock()
@@ -270,7 +580,7 @@ class TestCleanCacheService:
         )
 
         # Verify it's cached
-        assert "monstera deliciosa" in hass.data[DOMAIN][ATTR_SPECIES]
+        assert cache_key("monstera deliciosa", "en") in hass.data[DOMAIN][ATTR_SPECIES]
 
         # Clean cache with hours=0 to remove all
         await hass.services.async_call(
@@ -281,7 +591,9 @@ class TestCleanCacheService:
         )
 
         # Cache should be empty
-        assert "monstera deliciosa" not in hass.data[DOMAIN][ATTR_SPECIES]
+        assert (
+            cache_key("monstera deliciosa", "en") not in hass.data[DOMAIN][ATTR_SPECIES]
+        )
 
 
 class TestSearchServiceErrors:
@@ -321,6 +633,27 @@ class TestSearchServiceErrors:
                 blocking=True,
             )
 
+    async def test_search_service_api_unavailable(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A search the SDK answers with None is retried, then fails cleanly."""
+        mock_openplantbook_api.async_plant_search = AsyncMock(return_value=None)
+
+        with pytest.raises(HomeAssistantError, match="unavailable"):
+            await hass.services.async_call(
+                DOMAIN,
+                OPB_SERVICE_SEARCH,
+                {"alias": "monstera"},
+                blocking=True,
+            )
+        assert (
+            mock_openplantbook_api.async_plant_search.call_count
+            == DEFAULT_RETRY_POLICY.attempts
+        )
+
 
 class TestGetPlantServiceErrors:
     """Tests for get plant service error handling."""
@@ -359,6 +692,28 @@ class TestGetPlantServiceErrors:
                 blocking=True,
             )
 
+    async def test_get_plant_api_unavailable(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A fetch the SDK answers with None is retried, then fails cleanly."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(return_value=None)
+
+        with pytest.raises(HomeAssistantError, match="unavailable"):
+            await hass.services.async_call(
+                DOMAIN,
+                OPB_SERVICE_GET,
+                {"species": "monstera deliciosa"},
+                blocking=True,
+            )
+        assert (
+            mock_openplantbook_api.async_plant_detail_get.call_count
+            == DEFAULT_RETRY_POLICY.attempts
+        )
+        assert hass.data[DOMAIN][DATA_STATS].api_retries == 2
+
     async def test_get_plant_returns_empty_when_not_found(
         self,
         hass: HomeAssistant,
@@ -366,7 +721,9 @@ class TestGetPlantServiceErrors:
         mock_openplantbook_api: MagicMock,
     ) -> None:
         """Test get plant returns empty dict when plant not found."""
-        mock_openplantbook_api.async_plant_detail_get = AsyncMock(return_value=None)
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=SpeciesNotFoundError("unknown")
+        )
 
         result = await hass.services.async_call(
             DOMAIN,
@@ -454,7 +811,7 @@ class TestCleanCacheServiceEdgeCases:
         )
 
         # With default hours (24), recent cache entries should remain
-        assert "monstera deliciosa" in hass.data[DOMAIN][ATTR_SPECIES]
+        assert cache_key("monstera deliciosa", "en") in hass.data[DOMAIN][ATTR_SPECIES]
 
     async def test_clean_cache_with_invalid_hours(
         self,
@@ -480,7 +837,34 @@ class TestCleanCacheServiceEdgeCases:
         )
 
         # With invalid hours, uses default (24), recent entries should remain
-        assert "monstera deliciosa" in hass.data[DOMAIN][ATTR_SPECIES]
+        assert cache_key("monstera deliciosa", "en") in hass.data[DOMAIN][ATTR_SPECIES]
+
+
+def _image_session(
+    data: bytes,
+    content_type: str = "image/jpeg",
+    content_length: int | None = None,
+    content_encoding: str | None = None,
+) -> MagicMock:
+    """Return a mocked HTTP session whose responses stream data in two chunks."""
+
+    async def _iter_chunked(_size: int):
+        yield data[: len(data) // 2]
+        yield data[len(data) // 2 :]
+
+    resp = MagicMock(
+        status=200,
+        content_type=content_type,
+        content_length=len(data) if content_length is None else content_length,
+        headers={"Content-Encoding": content_encoding} if content_encoding else {},
+    )
+    resp.content.iter_chunked = _iter_chunked
+    request = MagicMock()
+    request.__aenter__ = AsyncMock(return_value=resp)
+    request.__aexit__ = AsyncMock(return_value=None)
+    session = MagicMock()
+    session.get = MagicMock(return_value=request)
+    return session
 
 
 class TestImageDownload:
@@ -503,12 +887,24 @@ class TestImageDownload:
             title="Openplantbook API",
         )
 
+    @pytest.mark.parametrize(
+        "session",
+        [
+            _image_session(b"fake image data"),
+            # Content-Length of the gzipped body, shorter than the decoded data
+            _image_session(
+                b"fake image data", content_length=9, content_encoding="gzip"
+            ),
+        ],
+        ids=["identity", "gzip"],
+    )
     async def test_get_plant_downloads_image(
         self,
         hass: HomeAssistant,
         mock_config_entry_with_download: MockConfigEntry,
         mock_openplantbook_api: MagicMock,
         tmp_path,
+        session: MagicMock,
     ) -> None:
         """Test get_plant downloads image when enabled and rewrites URL."""
         # Use a real temp directory under www/ so the /local/ rewrite works
@@ -524,16 +920,9 @@ class TestImageDownload:
             },
         )
 
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.read = AsyncMock(return_value=b"fake image data")
-
-        mock_session = MagicMock()
-        mock_session.get = AsyncMock(return_value=mock_resp)
-
         with patch(
             "custom_components.openplantbook.async_get_clientsession",
-            return_value=mock_session,
+            return_value=session,
         ):
             await hass.config_entries.async_setup(
                 mock_config_entry_with_download.entry_id
@@ -587,15 +976,9 @@ class TestImageDownload:
             }
         )
 
-        mock_resp = AsyncMock()
-        mock_resp.status = 200
-        mock_resp.read = AsyncMock(return_value=b"fake image data")
-        mock_session = MagicMock()
-        mock_session.get = AsyncMock(return_value=mock_resp)
-
         with patch(
             "custom_components.openplantbook.async_get_clientsession",
-            return_value=mock_session,
+            return_value=_image_session(b"fake image data"),
         ):
             await hass.config_entries.async_setup(
                 mock_config_entry_with_download.entry_id
@@ -653,6 +1036,66 @@ class TestImageDownload:
         # Should still rewrite to /local/ path even if file existed
         assert result.get(ATTR_IMAGE, "").startswith("/local/")
 
+    @pytest.mark.parametrize(
+        ("session", "reason"),
+        [
+            (_image_session(b"<html>", content_type="text/html"), "not an image"),
+            (
+                _image_session(b"x", content_length=IMAGE_MAX_SIZE + 1),
+                "over the limit",
+            ),
+            (_image_session(b"x" * (IMAGE_MAX_SIZE + 1)), "over the limit"),
+            (
+                _image_session(
+                    b"x" * (IMAGE_MAX_SIZE + 1),
+                    content_length=1,
+                    content_encoding="gzip",
+                ),
+                "over the limit",
+            ),
+            (_image_session(b"half", content_length=8), "got 4 of 8 bytes"),
+        ],
+    )
+    async def test_rejected_image_leaves_no_file(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry_with_download: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+        tmp_path,
+        caplog: pytest.LogCaptureFixture,
+        session: MagicMock,
+        reason: str,
+    ) -> None:
+        """A wrong type, oversized or truncated download keeps the remote URL."""
+        download_dir = tmp_path / "www" / "images" / "plants"
+        download_dir.mkdir(parents=True)
+        mock_config_entry_with_download.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry_with_download,
+            options={
+                **mock_config_entry_with_download.options,
+                FLOW_DOWNLOAD_PATH: str(download_dir),
+            },
+        )
+        await hass.config_entries.async_setup(mock_config_entry_with_download.entry_id)
+        await hass.async_block_till_done()
+
+        with patch(
+            "custom_components.openplantbook.async_get_clientsession",
+            return_value=session,
+        ):
+            result = await hass.services.async_call(
+                DOMAIN,
+                OPB_SERVICE_GET,
+                {"species": "monstera deliciosa"},
+                blocking=True,
+                return_response=True,
+            )
+
+        assert result[ATTR_IMAGE].startswith("https://")
+        assert list(download_dir.iterdir()) == []
+        assert reason in caplog.text
+
     async def test_get_plant_no_download_when_disabled(
         self,
         hass: HomeAssistant,
@@ -840,3 +1283,697 @@ class TestGetServiceIncludeCaching:
         )
 
         assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+
+    async def test_only_missing_category_fetched_and_merged(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A cached category is not asked for again; new ones are merged in."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_make_detail_side_effect()
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care"},
+            blocking=True,
+        )
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care,pests"},
+            blocking=True,
+            return_response=True,
+        )
+
+        call = mock_openplantbook_api.async_plant_detail_get.call_args
+        assert call.kwargs["params"] == {"include": "pests"}
+        assert result["watering"] == "Likes wet envs; reduce watering in winter."
+        assert set(result[OPB_ATTR_INCLUDES]) == {"care", "pests"}
+        state = hass.states.get("openplantbook.monstera_deliciosa")
+        assert state.attributes["watering"] == result["watering"]
+
+    async def test_expired_category_refetched_alone(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Each category expires on its own timestamp."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_make_detail_side_effect()
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care,pests"},
+            blocking=True,
+        )
+        old = datetime.now() - timedelta(hours=CACHE_TIME + 1)
+        cached = hass.data[DOMAIN][ATTR_SPECIES][cache_key("monstera deliciosa", "en")]
+        cached.includes["care"] = old.timestamp()
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care,pests"},
+            blocking=True,
+            return_response=True,
+        )
+
+        call = mock_openplantbook_api.async_plant_detail_get.call_args
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+        assert call.kwargs["params"] == {"include": "care"}
+        assert result[OPB_ATTR_INCLUDES_AT]["care"] > old.isoformat()
+        assert "pests" in result[OPB_ATTR_INCLUDES]
+
+    async def test_base_refetch_keeps_cached_categories(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A base-only refetch does not drop the care fields already cached."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_make_detail_side_effect()
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care"},
+            blocking=True,
+        )
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "cache": False},
+            blocking=True,
+            return_response=True,
+        )
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+        assert result["soil"] == "Peat mixed with coarse sand or hydroponics"
+        assert "care" in result[OPB_ATTR_INCLUDES]
+
+    async def test_listed_categories_from_older_store_satisfied(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Entries that only list their categories are as fresh as the entry."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_make_detail_side_effect()
+        )
+        await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care"},
+            blocking=True,
+        )
+        key = cache_key("monstera deliciosa", "en")
+        cached = hass.data[DOMAIN][ATTR_SPECIES][key]
+        hass.data[DOMAIN][ATTR_SPECIES][key] = SpeciesRecord.from_dict(
+            {**cached, OPB_ATTR_INCLUDES: ["care"]}
+        )
+
+        await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa", "include": "care"},
+            blocking=True,
+        )
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+
+
+class TestGetPlantCoalescing:
+    """Tests for single-flight coalescing of concurrent get calls."""
+
+    @staticmethod
+    def _gated_side_effect(release: asyncio.Event, error: Exception | None = None):
+        """Wrap _make_detail_side_effect so each call blocks until released."""
+        inner = _make_detail_side_effect()
+
+        async def _side_effect(species, lang=None, params=None, **kwargs):
+            await release.wait()
+            if error is not None:
+                raise error
+            return await inner(species, lang=lang, params=params)
+
+        return _side_effect
+
+    @staticmethod
+    def _get(hass: HomeAssistant, data: dict) -> asyncio.Task:
+        return hass.async_create_task(
+            hass.services.async_call(
+                DOMAIN, OPB_SERVICE_GET, data, blocking=True, return_response=True
+            )
+        )
+
+    async def test_concurrent_gets_share_one_request(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Waiters resume with the first caller's data; the API is hit once."""
+        release = asyncio.Event()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._gated_side_effect(release)
+        )
+
+        tasks = [self._get(hass, {"species": "monstera deliciosa"}) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+        assert all(r["pid"] == "monstera deliciosa" for r in results)
+        assert hass.data[DOMAIN]["in_flight"] == {}
+
+    async def test_cancelled_caller_does_not_fail_waiters(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Cancelling the caller that started the fetch leaves it running."""
+        release = asyncio.Event()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._gated_side_effect(release)
+        )
+
+        leader = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        waiter = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert (await waiter)["pid"] == "monstera deliciosa"
+        assert leader.cancelled()
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+        assert hass.data[DOMAIN]["in_flight"] == {}
+
+    async def test_waiter_outlasts_leader_retries(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+        freezer: FrozenDateTimeFactory,
+    ) -> None:
+        """A waiter gets the data of a fetch that succeeds on a retry after 30 s."""
+        release = asyncio.Event()
+        inner = _make_detail_side_effect()
+        calls = 0
+
+        async def _fail_slowly_then_succeed(species, lang=None, params=None, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await release.wait()
+                freezer.tick(timedelta(seconds=35))
+                # How the SDK reports an unreachable API
+                return None
+            return await inner(species, lang=lang, params=params)
+
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_fail_slowly_then_succeed
+        )
+
+        leader = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        waiter = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(leader, waiter)
+
+        assert calls == 2
+        assert [r["pid"] for r in results] == ["monstera deliciosa"] * 2
+
+    async def test_waiters_receive_original_exception(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A failed fetch propagates the same error to every coalesced waiter."""
+        release = asyncio.Event()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._gated_side_effect(release, RateLimitError())
+        )
+
+        tasks = [self._get(hass, {"species": "monstera deliciosa"}) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # One fetch for both waiters, retried before giving up
+        assert (
+            mock_openplantbook_api.async_plant_detail_get.call_count
+            == DEFAULT_RETRY_POLICY.attempts
+        )
+        assert all(isinstance(r, HomeAssistantError) for r in results)
+        assert "rate limit" in str(results[1])
+
+    async def test_waiter_times_out(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A waiter gives up after its deadline without cancelling the fetch."""
+        release = asyncio.Event()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._gated_side_effect(release)
+        )
+
+        first = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        with pytest.raises(OpenPlantbookException):
+            await hass.services.async_call(
+                DOMAIN,
+                OPB_SERVICE_GET,
+                {"species": "monstera deliciosa", "timeout": 0.01},
+                blocking=True,
+                return_response=True,
+            )
+
+        release.set()
+        result = await first
+        assert result["pid"] == "monstera deliciosa"
+
+    async def test_include_mismatch_chains_follow_up_fetch(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A care waiter on a base-only fetch gets care via a chained fetch."""
+        release = asyncio.Event()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._gated_side_effect(release)
+        )
+
+        base = self._get(hass, {"species": "monstera deliciosa"})
+        await asyncio.sleep(0)
+        care = self._get(hass, {"species": "monstera deliciosa", "include": "care"})
+        await asyncio.sleep(0)
+        release.set()
+        base_result, care_result = await asyncio.gather(base, care)
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+        assert "watering" not in base_result
+        assert care_result["watering"] == "Likes wet envs; reduce watering in winter."
+
+
+class TestGetServiceServeStale:
+    """Tests for the serve_stale (stale-while-revalidate) option."""
+
+    async def test_expired_entry_served_and_refreshed(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """An expired entry is returned at once; its entity updates after refresh."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_SERVE_STALE: True}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        )
+        old = datetime.now() - timedelta(hours=CACHE_TIME + 1)
+        hass.data[DOMAIN][ATTR_SPECIES][
+            cache_key("monstera deliciosa", "en")
+        ].fetched = old.timestamp()
+
+        release = asyncio.Event()
+
+        async def _slow_refresh(species, lang=None, params=None, **kwargs):
+            await release.wait()
+            return {"pid": "monstera deliciosa", "display_pid": "Monstera refreshed"}
+
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=_slow_refresh
+        )
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa"},
+            blocking=True,
+            return_response=True,
+        )
+
+        # Served from the stale entry while the refresh is still blocked.
+        assert result["display_pid"] == "Monstera deliciosa"
+        assert result[OPB_ATTR_TIMESTAMP] == old.isoformat()
+
+        release.set()
+        await hass.async_block_till_done()
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+        state = hass.states.get("openplantbook.monstera_deliciosa")
+        assert state.state == "Monstera refreshed"
+
+    async def test_expired_entry_refetched_without_option(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Without serve_stale, an expired entry blocks on a fresh fetch."""
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        )
+        old = datetime.now() - timedelta(hours=CACHE_TIME + 1)
+        hass.data[DOMAIN][ATTR_SPECIES][
+            cache_key("monstera deliciosa", "en")
+        ].fetched = old.timestamp()
+
+        result = await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": "monstera deliciosa"},
+            blocking=True,
+            return_response=True,
+        )
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+        assert result[OPB_ATTR_TIMESTAMP] != old.isoformat()
+
+
+class TestGetServiceNegativeCache:
+    """Tests for remembering species the API does not know."""
+
+    async def _get(self, hass: HomeAssistant, species: str, **data) -> dict:
+        return await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": species, **data},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def test_repeated_miss_answered_locally(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A name that was not found is not asked for again, in any casing."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=SpeciesNotFoundError("unknown")
+        )
+
+        assert await self._get(hass, "monstra deliciosa") == {}
+        assert await self._get(hass, "Monstra  Deliciosa") == {}
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+
+    async def test_miss_expires(
+        self,
+        hass: HomeAssistant,
+        freezer: FrozenDateTimeFactory,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """The API is asked again once the negative cache TTL has passed."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=SpeciesNotFoundError("unknown")
+        )
+        await self._get(hass, "monstra deliciosa")
+
+        freezer.tick(timedelta(minutes=DEFAULT_NEGATIVE_CACHE_TTL, seconds=1))
+        await self._get(hass, "monstra deliciosa")
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+
+    async def test_cache_bypass_and_clean_cache_ask_again(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """cache: false skips the negative cache and clean_cache clears it."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=SpeciesNotFoundError("unknown")
+        )
+        await self._get(hass, "monstra deliciosa")
+
+        await self._get(hass, "monstra deliciosa", cache=False)
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_CLEAN_CACHE, {"hours": 0}, blocking=True
+        )
+        await self._get(hass, "monstra deliciosa")
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 3
+
+    async def test_disabled_with_zero_ttl(
+        self,
+        hass: HomeAssistant,
+        mock_config_entry: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A TTL of 0 turns the negative cache off."""
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={FLOW_NEGATIVE_CACHE_TTL: 0}
+        )
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=SpeciesNotFoundError("unknown")
+        )
+
+        await self._get(hass, "monstra deliciosa")
+        await self._get(hass, "monstra deliciosa")
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+
+    async def test_failed_request_not_cached(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """An unreachable API does not mark a valid species as not found."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(return_value=None)
+        with pytest.raises(HomeAssistantError):
+            await self._get(hass, "monstera deliciosa")
+
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            return_value={"pid": "monstera deliciosa", "display_pid": "Monstera"}
+        )
+        assert (await self._get(hass, "monstera deliciosa"))["pid"] == (
+            "monstera deliciosa"
+        )
+        assert hass.data[DOMAIN][DATA_STATS].negative_hits == 0
+
+
+class TestGetServiceLanguage:
+    """Tests for caching each language separately."""
+
+    async def _get(self, hass: HomeAssistant, species: str, **data) -> dict:
+        return await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET,
+            {"species": species, **data},
+            blocking=True,
+            return_response=True,
+        )
+
+    @staticmethod
+    def _localized_detail():
+        async def _detail(species, lang=None, params=None, **kwargs):
+            return {
+                "pid": "monstera deliciosa",
+                "display_pid": {"de": "Fensterblatt"}.get(lang, "Monstera deliciosa"),
+            }
+
+        return _detail
+
+    async def test_second_language_kept_warm(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Another language is cached next to the default one, without an entity."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._localized_detail()
+        )
+
+        assert (await self._get(hass, "monstera deliciosa"))["display_pid"] == (
+            "Monstera deliciosa"
+        )
+        result = await self._get(hass, "Monstera deliciosa", lang="de-DE")
+        assert result["display_pid"] == "Fensterblatt"
+        await self._get(hass, "monstera deliciosa")
+        await self._get(hass, "fensterblatt", lang="de")
+
+        calls = mock_openplantbook_api.async_plant_detail_get.call_args_list
+        assert [call.kwargs["lang"] for call in calls] == ["en", "de"]
+        assert set(hass.data[DOMAIN][ATTR_SPECIES]) == {
+            cache_key("monstera deliciosa", "en"),
+            cache_key("monstera deliciosa", "de"),
+        }
+        state = hass.states.get("openplantbook.monstera_deliciosa")
+        assert state.state == "Monstera deliciosa"
+
+    async def test_option_change_drops_only_previous_language(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Turning the language off invalidates the entries cached in it only."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._localized_detail()
+        )
+        await self._get(hass, "monstera deliciosa")
+        await self._get(hass, "monstera deliciosa", lang="de")
+
+        hass.config_entries.async_update_entry(
+            init_integration, options={FLOW_SEND_LANG: False}
+        )
+        await hass.async_block_till_done()
+
+        assert set(hass.data[DOMAIN][ATTR_SPECIES]) == {
+            cache_key("monstera deliciosa", "de")
+        }
+        assert hass.states.get("openplantbook.monstera_deliciosa") is None
+
+        await self._get(hass, "monstera deliciosa")
+        assert (
+            mock_openplantbook_api.async_plant_detail_get.call_args.kwargs["lang"]
+            is None
+        )
+        assert hass.states.get("openplantbook.monstera_deliciosa") is not None
+
+    async def test_entity_switches_to_cached_language(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """A species already cached in the new language keeps its entity."""
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+            side_effect=self._localized_detail()
+        )
+        await self._get(hass, "monstera deliciosa")
+        await self._get(hass, "monstera deliciosa", lang="de")
+
+        hass.config.language = "de"
+        hass.config_entries.async_update_entry(
+            init_integration, options={FLOW_SEND_LANG: True}
+        )
+        await hass.async_block_till_done()
+
+        state = hass.states.get("openplantbook.monstera_deliciosa")
+        assert state.state == "Fensterblatt"
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+
+
+class TestGetManyService:
+    """Tests for the batch get_many service."""
+
+    async def _get_many(self, hass: HomeAssistant, species: list[str], **data):
+        return await hass.services.async_call(
+            DOMAIN,
+            OPB_SERVICE_GET_MANY,
+            {"species": species, **data},
+            blocking=True,
+            return_response=True,
+        )
+
+    async def test_response_keyed_by_input_and_deduplicated(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Variants of one species are fetched once and each input is answered."""
+        result = await self._get_many(
+            hass, ["monstera deliciosa", "Monstera  Deliciosa", "monstera deliciosa"]
+        )
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+        assert set(result) == {"monstera deliciosa", "Monstera  Deliciosa"}
+        assert result["Monstera  Deliciosa"]["pid"] == "monstera deliciosa"
+
+    async def test_cache_hits_not_refetched(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """Species already cached are answered from the cache."""
+        await hass.services.async_call(
+            DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+        )
+
+        result = await self._get_many(hass, ["monstera deliciosa"])
+
+        assert mock_openplantbook_api.async_plant_detail_get.call_count == 1
+        assert result["monstera deliciosa"]["display_pid"] == "Monstera deliciosa"
+
+    async def test_errors_reported_per_species(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """One failing species does not fail the others."""
+
+        async def _detail(species, lang=None, params=None, **kwargs):
+            if species == "ficus lyrata":
+                raise RateLimitError
+            if species == "unknown":
+                raise SpeciesNotFoundError(species)
+            return {"pid": species, "display_pid": species.capitalize()}
+
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(side_effect=_detail)
+
+        result = await self._get_many(
+            hass, ["monstera deliciosa", "ficus lyrata", "unknown"]
+        )
+
+        assert result["monstera deliciosa"]["pid"] == "monstera deliciosa"
+        assert "rate limit" in result["ficus lyrata"]["error"]
+        assert result["unknown"] == {}
+
+    async def test_fetches_bounded(
+        self,
+        hass: HomeAssistant,
+        init_integration: MockConfigEntry,
+        mock_openplantbook_api: MagicMock,
+    ) -> None:
+        """At most GET_MANY_CONCURRENCY species are fetched at the same time."""
+        running = 0
+        peak = 0
+
+        async def _detail(species, lang=None, params=None, **kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return {"pid": species, "display_pid": species.capitalize()}
+
+        mock_openplantbook_api.async_plant_detail_get = AsyncMock(side_effect=_detail)
+        species = [f"plant {i}" for i in range(3 * GET_MANY_CONCURRENCY)]
+
+        result = await self._get_many(hass, species)
+
+        assert peak == GET_MANY_CONCURRENCY
+        assert list(result) == species
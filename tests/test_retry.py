@@ -0,0 +1,112 @@
+"""Tests for the retry policy of the API requests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+from homeassistant.core import HomeAssistant
+from openplantbook_sdk.sdk import RateLimitError
+
+from custom_components.openplantbook.plantbook_exception import ApiUnavailableError
+from custom_components.openplantbook.retry import (
+    RetryPolicy,
+    async_api_call,
+    retry_after,
+)
+from custom_components.openplantbook.scheduler import PRIORITY_BACKGROUND
+
+NO_DELAY = RetryPolicy(base_delay=0, max_delay=0)
+
+
+def _rate_limited(retry_after_header: str | None = None) -> RateLimitError:
+    """Return a RateLimitError raised from a 429 response, as the SDK does."""
+    headers = {} if retry_after_header is None else {"Retry-After": retry_after_header}
+    err = RateLimitError()
+    err.__cause__ = aiohttp.ClientResponseError(
+        MagicMock(), (), status=429, headers=headers
+    )
+    return err
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [(None, None), ("12", 12.0), ("-3", 0.0), ("soon", None)],
+)
+def test_retry_after_seconds(header: str | None, expected: float | None) -> None:
+    """Retry-After is read as seconds from the response the SDK failed on."""
+    assert retry_after(_rate_limited(header)) == expected
+
+
+def test_retry_after_http_date() -> None:
+    """Retry-After may also be an HTTP date."""
+    when = datetime.now(UTC) + timedelta(seconds=30)
+    assert 25 < retry_after(_rate_limited(format_datetime(when, usegmt=True))) <= 30
+
+
+async def test_transient_failure_is_retried(hass: HomeAssistant) -> None:
+    """A failed SDK request (None) is retried and the later result returned."""
+    request = AsyncMock(side_effect=[None, {"pid": "x"}])
+
+    assert await async_api_call(hass, request, policy=NO_DELAY) == {"pid": "x"}
+    assert request.call_count == 2
+
+
+@pytest.mark.parametrize(("idempotent", "calls"), [(True, 3), (False, 1)])
+async def test_no_result_raised_as_unavailable(
+    hass: HomeAssistant, idempotent: bool, calls: int
+) -> None:
+    """None after the last attempt raises; uploads are not retried on it."""
+    request = AsyncMock(return_value=None)
+
+    with pytest.raises(ApiUnavailableError):
+        await async_api_call(hass, request, idempotent=idempotent, policy=NO_DELAY)
+    assert request.call_count == calls
+
+
+async def test_gives_up_after_attempts(hass: HomeAssistant) -> None:
+    """The last failure is raised once every attempt failed."""
+    request = AsyncMock(side_effect=_rate_limited())
+
+    with pytest.raises(RateLimitError):
+        await async_api_call(hass, request, policy=NO_DELAY)
+    assert request.call_count == NO_DELAY.attempts
+
+
+async def test_retry_after_beyond_deadline_fails_fast(hass: HomeAssistant) -> None:
+    """A retry the server asks for after the deadline is not waited for."""
+    request = AsyncMock(side_effect=_rate_limited("120"))
+
+    with pytest.raises(RateLimitError):
+        await async_api_call(hass, request, policy=NO_DELAY)
+    assert request.call_count == 1
+
+
+async def test_background_rate_limit_not_retried(hass: HomeAssistant) -> None:
+    """Background requests give the rate budget back instead of retrying."""
+    request = AsyncMock(side_effect=_rate_limited())
+
+    with pytest.raises(RateLimitError):
+        await async_api_call(hass, request, PRIORITY_BACKGROUND, policy=NO_DELAY)
+    assert request.call_count == 1
+
+
+@pytest.mark.parametrize(("idempotent", "calls"), [(True, 3), (False, 1)])
+async def test_timeouts_retried_only_if_idempotent(
+    hass: HomeAssistant, idempotent: bool, calls: int
+) -> None:
+    """An attempt over its timeout is retried unless it may have taken effect."""
+    policy = RetryPolicy(attempts=3, base_delay=0, max_delay=0, attempt_timeout=0.01)
+
+    async def _slow() -> None:
+        await asyncio.sleep(1)
+
+    request = AsyncMock(side_effect=_slow)
+
+    with pytest.raises(TimeoutError):
+        await async_api_call(hass, request, idempotent=idempotent, policy=policy)
+    assert request.call_count == calls
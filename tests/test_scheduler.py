@@ -0,0 +1,156 @@
+"""Tests for the API request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.openplantbook.const import (
+    DOMAIN,
+    FLOW_API_MAX_CONCURRENT,
+    FLOW_API_RATE_LIMIT,
+    OPB_SERVICE_GET,
+)
+from custom_components.openplantbook.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.openplantbook.scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    ApiScheduler,
+    background_requests,
+    current_priority,
+)
+
+
+async def _run(
+    scheduler: ApiScheduler,
+    priority: int,
+    order: list[str],
+    name: str,
+    release: asyncio.Event,
+) -> None:
+    async with scheduler.async_slot(priority):
+        order.append(name)
+        await release.wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_interactive_requests_admitted_first(hass: HomeAssistant) -> None:
+    """Queued interactive requests overtake queued background ones."""
+    scheduler = ApiScheduler(0, 1)
+    order: list[str] = []
+    release = asyncio.Event()
+    tasks = [
+        hass.async_create_task(_run(scheduler, priority, order, name, release))
+        for name, priority in (
+            ("running", PRIORITY_INTERACTIVE),
+            ("upload", PRIORITY_BACKGROUND),
+            ("get", PRIORITY_INTERACTIVE),
+        )
+    ]
+    await _settle()
+    assert order == ["running"]
+    assert scheduler.as_dict()["queued"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["running", "get", "upload"]
+    assert scheduler.as_dict()["running"] == 0
+
+
+async def test_requests_over_the_rate_wait_for_tokens(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """With the bucket empty, a request waits for the next token, not fails."""
+    scheduler = ApiScheduler(2, 10)
+    order: list[str] = []
+    release = asyncio.Event()
+    release.set()
+    tasks = [
+        hass.async_create_task(
+            _run(scheduler, PRIORITY_INTERACTIVE, order, str(n), release)
+        )
+        for n in range(3)
+    ]
+    await _settle()
+    assert order == ["0", "1"]
+
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await asyncio.gather(*tasks)
+
+    assert order == ["0", "1", "2"]
+    assert scheduler.delayed == 1
+
+
+async def test_cancelled_waiter_gives_up_its_place(hass: HomeAssistant) -> None:
+    """A request cancelled while queued neither runs nor holds a slot."""
+    scheduler = ApiScheduler(0, 1)
+    order: list[str] = []
+    release = asyncio.Event()
+    running = hass.async_create_task(
+        _run(scheduler, PRIORITY_INTERACTIVE, order, "running", release)
+    )
+    cancelled = hass.async_create_task(
+        _run(scheduler, PRIORITY_INTERACTIVE, order, "cancelled", release)
+    )
+    queued = hass.async_create_task(
+        _run(scheduler, PRIORITY_INTERACTIVE, order, "queued", release)
+    )
+    await _settle()
+    cancelled.cancel()
+    release.set()
+    await asyncio.gather(running, queued)
+
+    assert order == ["running", "queued"]
+    assert cancelled.cancelled()
+
+
+def test_background_context_priority() -> None:
+    """Requests started inside background_requests rank as background."""
+    assert current_priority() == PRIORITY_INTERACTIVE
+    with background_requests():
+        assert current_priority() == PRIORITY_BACKGROUND
+    assert current_priority() == PRIORITY_INTERACTIVE
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [({}, (60, 4)), ({FLOW_API_RATE_LIMIT: 0, FLOW_API_MAX_CONCURRENT: 2}, (0, 2))],
+)
+async def test_limits_from_options_in_diagnostics(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+    options: dict,
+    expected: tuple[int, int],
+) -> None:
+    """The scheduler takes its limits from the options and reports its load."""
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(mock_config_entry, options=options)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    scheduler = diagnostics["scheduler"]
+    assert (scheduler["rate"], scheduler["max_concurrent"]) == expected
+    assert scheduler["running"] == scheduler["queued"] == 0
@@ -0,0 +1,133 @@
+"""Tests for the local species database and the search policies."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.const import (
+    DOMAIN,
+    FLOW_SEARCH_POLICY,
+    OPB_SERVICE_GET,
+    OPB_SERVICE_SEARCH,
+    SEARCH_POLICY_LOCAL,
+    SEARCH_POLICY_LOCAL_FIRST,
+)
+from custom_components.openplantbook.species_db import SpeciesDatabase
+
+SEARCH_RESULTS = {
+    "results": [
+        {"pid": "capsicum annuum", "display_pid": "Capsicum annuum"},
+        {"pid": "capsicum chinense", "display_pid": "Capsicum chinense"},
+    ]
+}
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> SpeciesDatabase:
+    """Return an open species database in a temporary directory."""
+    database = SpeciesDatabase(tmp_path / "species.db")
+    database.open()
+    yield database
+    database.close()
+
+
+async def _setup(hass: HomeAssistant, entry: MockConfigEntry, policy: str) -> None:
+    """Set up the integration with a search policy."""
+    entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(entry, options={FLOW_SEARCH_POLICY: policy})
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def _search(hass: HomeAssistant, alias: str) -> dict:
+    return await hass.services.async_call(
+        DOMAIN,
+        OPB_SERVICE_SEARCH,
+        {"alias": alias},
+        blocking=True,
+        return_response=True,
+    )
+
+
+class TestSpeciesDatabase:
+    """Tests for SpeciesDatabase."""
+
+    def test_search_matches_word_prefixes(self, database: SpeciesDatabase) -> None:
+        """Every word must prefix-match pid, display_pid or an alias."""
+        database.add_species(
+            [
+                ("monstera deliciosa", "Monstera deliciosa", ["Swiss cheese plant"]),
+                ("capsicum annuum", "Capsicum annuum", []),
+            ]
+        )
+
+        assert database.search("swiss chee") == {
+            "monstera deliciosa": "Monstera deliciosa"
+        }
+        assert database.search("caps") == {"capsicum annuum": "Capsicum annuum"}
+        assert database.search("capsicum deliciosa") == {}
+        assert database.search('"') == {}
+
+    def test_reindexing_keeps_aliases(self, database: SpeciesDatabase) -> None:
+        """Aliases learned earlier are kept when a species is indexed again."""
+        database.add_species([("monstera deliciosa", "Monstera", ["Swiss cheese"])])
+        database.add_species([("monstera deliciosa", "Monstera deliciosa", [])])
+
+        assert database.search("swiss") == {"monstera deliciosa": "Monstera deliciosa"}
+
+    def test_closed_database_is_empty(self, database: SpeciesDatabase) -> None:
+        """A database closed during a pending call neither fails nor finds."""
+        database.add_species([("monstera deliciosa", "Monstera deliciosa", [])])
+        database.close()
+
+        database.add_species([("capsicum annuum", "Capsicum annuum", [])])
+        assert database.search("monstera") == {}
+
+
+async def test_local_then_remote_search(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """Species seen before are found locally, others through the API."""
+    hass.config.config_dir = str(tmp_path)
+    await _setup(hass, mock_config_entry, SEARCH_POLICY_LOCAL_FIRST)
+    mock_openplantbook_api.async_plant_search.return_value = SEARCH_RESULTS
+    await hass.services.async_call(
+        DOMAIN, OPB_SERVICE_GET, {"species": "monstera deliciosa"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    assert await _search(hass, "swiss cheese") == {
+        "monstera deliciosa": "Monstera deliciosa"
+    }
+    mock_openplantbook_api.async_plant_search.assert_not_called()
+    assert hass.states.get("openplantbook.search_result").state == "1"
+
+    assert await _search(hass, "capsicum") == {
+        "capsicum annuum": "Capsicum annuum",
+        "capsicum chinense": "Capsicum chinense",
+    }
+    await hass.async_block_till_done()
+    assert await _search(hass, "chinense") == {"capsicum chinense": "Capsicum chinense"}
+    assert mock_openplantbook_api.async_plant_search.call_count == 1
+
+
+async def test_local_only_search_never_calls_api(
+    hass: HomeAssistant,
+    tmp_path: Path,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """With the local_only policy an unknown species is simply not found."""
+    hass.config.config_dir = str(tmp_path)
+    await _setup(hass, mock_config_entry, SEARCH_POLICY_LOCAL)
+    assert await _search(hass, "capsicum") == {}
+    mock_openplantbook_api.async_plant_search.assert_not_called()
+    assert hass.states.get("openplantbook.search_result").state == "0"
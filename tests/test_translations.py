@@ -58,7 +58,7 @@ def _assert_step_translated(flow: str, step: str, data_schema) -> None:
 async def test_config_flow_fields_translated(hass: HomeAssistant) -> None:
     """Every config flow step's form fields are translated."""
     with patch(
-        "custom_components.openplantbook.config_flow.OpenPlantBookApi"
+        "custom_components.openplantbook.auth.PlantbookClient"
     ) as mock_api_class:
         mock_api = MagicMock()
         mock_api._async_get_token = AsyncMock(return_value="test_token")
@@ -0,0 +1,110 @@
+"""Tests for the species cache warm-up."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.core import HomeAssistant
+from openplantbook_sdk.sdk import RateLimitError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.openplantbook.cache import cache_key
+from custom_components.openplantbook.const import ATTR_SPECIES, DOMAIN, FLOW_WARM_UP
+from custom_components.openplantbook.warmup import (
+    WARM_UP_CONCURRENCY,
+    async_warm_up_species_cache,
+)
+
+
+def _add_plants(hass: HomeAssistant, *species: str | None) -> None:
+    for index, pid in enumerate(species):
+        attributes = {"species_original": pid} if pid else {}
+        hass.states.async_set(f"plant.plant_{index}", "ok", attributes)
+
+
+def _detail(species: str, lang=None, params=None, **kwargs) -> dict:
+    return {"pid": species, "display_pid": species.capitalize()}
+
+
+async def test_warm_up_on_setup(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """With the option on, every plant's species is cached once, after setup."""
+    _add_plants(hass, "monstera deliciosa", "ficus lyrata", "ficus lyrata", None)
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(side_effect=_detail)
+    mock_config_entry.add_to_hass(hass)
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={FLOW_WARM_UP: True}
+    )
+
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert set(hass.data[DOMAIN][ATTR_SPECIES]) == {
+        cache_key("monstera deliciosa", "en"),
+        cache_key("ficus lyrata", "en"),
+    }
+    assert mock_openplantbook_api.async_plant_detail_get.call_count == 2
+    assert hass.states.get("openplantbook.ficus_lyrata") is not None
+
+
+async def test_no_warm_up_by_default(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """Without the option, nothing is fetched at startup."""
+    _add_plants(hass, "monstera deliciosa")
+    mock_config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_openplantbook_api.async_plant_detail_get.assert_not_called()
+
+
+async def test_warm_up_concurrency_bounded(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """No more than WARM_UP_CONCURRENCY species are fetched at the same time."""
+    _add_plants(hass, *(f"plant {i}" for i in range(3 * WARM_UP_CONCURRENCY)))
+    running = 0
+    peak = 0
+
+    async def _slow_detail(species, lang=None, params=None, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return _detail(species)
+
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(side_effect=_slow_detail)
+
+    await async_warm_up_species_cache(hass)
+
+    assert peak == WARM_UP_CONCURRENCY
+    assert len(hass.data[DOMAIN][ATTR_SPECIES]) == 3 * WARM_UP_CONCURRENCY
+
+
+async def test_warm_up_stops_on_rate_limit(
+    hass: HomeAssistant,
+    init_integration: MockConfigEntry,
+    mock_openplantbook_api: MagicMock,
+) -> None:
+    """After a rate-limit response, the remaining species are not requested."""
+    _add_plants(hass, *(f"plant {i}" for i in range(3 * WARM_UP_CONCURRENCY)))
+    mock_openplantbook_api.async_plant_detail_get = AsyncMock(
+        side_effect=RateLimitError
+    )
+
+    await async_warm_up_species_cache(hass)
+
+    assert mock_openplantbook_api.async_plant_detail_get.call_count <= (
+        WARM_UP_CONCURRENCY
+    )